@@ -4,10 +4,7 @@ import logging
 import sys
 from collections.abc import Sequence
 
-from PySide6.QtWidgets import QApplication
-
-from app.controllers.main_controller import MainController
-from app.views.main_window import MainWindow
+from app.cli import COMMANDS, run_cli
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +14,21 @@ def main(argv: Sequence[str] | None = None) -> int:
 
     argv = list(argv) if argv is not None else sys.argv[1:]
 
+    # サブコマンドが指定された場合は GUI を起動せずにヘッドレスで実行する
+    if argv and argv[0] in COMMANDS:
+        return run_cli(argv)
+
+    return run_gui(argv)
+
+
+def run_gui(argv: Sequence[str]) -> int:
+    """GUIアプリケーションを起動する"""
+    # ヘッドレス実行時に PySide6 を読み込まないよう、ここでインポートする
+    from PySide6.QtWidgets import QApplication
+
+    from app.controllers.main_controller import MainController
+    from app.views.main_window import MainWindow
+
     try:
         app = QApplication(sys.argv)
         window = MainWindow()
@@ -0,0 +1,34 @@
+"""
+ヘッドレス実行用のコマンドラインインターフェース
+
+GUI を起動せずに実行するため、このパッケージ配下では PySide6 をインポートしない
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections.abc import Sequence
+
+from app.cli import check, convert, diff, merge, watch
+
+# サブコマンド名の一覧
+COMMANDS = ("check", "convert", "diff", "merge", "watch")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """サブコマンドを登録した引数パーサーを生成する"""
+    parser = argparse.ArgumentParser(prog="python -m app", description="JIP-まてりある総括表変換ツール")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    check.add_parser(subparsers)
+    convert.add_parser(subparsers)
+    diff.add_parser(subparsers)
+    merge.add_parser(subparsers)
+    watch.add_parser(subparsers)
+    return parser
+
+
+def run_cli(argv: Sequence[str]) -> int:
+    """サブコマンドを実行して終了コードを返す"""
+    parser = build_parser()
+    args = parser.parse_args(list(argv))
+    return args.func(args)
@@ -0,0 +1,73 @@
+"""総括表CSVの集計値 (小計・中計・合計, 下位レベルの合計) の整合性を検証するサブコマンド"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import time
+
+from app.cli.convert import collect_input_files
+from app.models.summary_sheet import SummarySheet
+from app.models.summary_validator import DEFAULT_TOLERANCE
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ERRORS = 20  # ファイル毎に表示する不整合の件数
+
+
+def add_parser(subparsers: argparse._SubParsersAction) -> None:
+    """`check` サブコマンドを登録する"""
+    parser = subparsers.add_parser("check", help="総括表CSVの小計・中計・合計と下位レベルの合計の整合性を検証する")
+    parser.add_argument("inputs", nargs="+", help="入力ファイル・グロブ・ディレクトリ")
+    parser.add_argument(
+        "--tolerance", type=float, default=DEFAULT_TOLERANCE, help=f"許容する誤差 (既定: {DEFAULT_TOLERANCE})"
+    )
+    parser.add_argument(
+        "--max-errors",
+        type=int,
+        default=DEFAULT_MAX_ERRORS,
+        help=f"ファイル毎に表示する不整合の件数 (0: 全て, 既定: {DEFAULT_MAX_ERRORS})",
+    )
+    parser.set_defaults(func=run)
+
+
+def run(args: argparse.Namespace) -> int:
+    """
+    `check` サブコマンドを実行する
+
+    終了コードは全て整合する場合 `0`、不整合がある場合 `1`、読み込みに失敗した場合 `2` とする
+    """
+    input_paths = collect_input_files(args.inputs)
+    if not input_paths:
+        logger.error("検証対象のファイルがありません")
+        return 2
+
+    start = time.perf_counter()
+    invalid_count = failed_count = 0
+    for input_path in input_paths:
+        try:
+            inconsistencies = SummarySheet.load_from_csv(input_path).validate(args.tolerance)
+        except Exception as exc:
+            failed_count += 1
+            logger.error("読み込みに失敗しました: %s | %s: %s", input_path, type(exc).__name__, exc)
+            continue
+        if not inconsistencies:
+            logger.info("整合しています: %s", input_path)
+            continue
+
+        invalid_count += 1
+        print(f"{input_path}: 不整合 {len(inconsistencies)}件")
+        shown = inconsistencies if args.max_errors <= 0 else inconsistencies[: args.max_errors]
+        for inconsistency in shown:
+            print(f"  {inconsistency.message}")
+        if len(shown) < len(inconsistencies):
+            print(f"  ... 他 {len(inconsistencies) - len(shown)}件")
+
+    valid_count = len(input_paths) - invalid_count - failed_count
+    print(
+        f"ファイル数: {len(input_paths)} (整合: {valid_count}, 不整合: {invalid_count}, 失敗: {failed_count}) / "
+        f"処理時間: {time.perf_counter() - start:.2f}秒"
+    )
+    if failed_count:
+        return 2
+    return 1 if invalid_count else 0
@@ -0,0 +1,207 @@
+"""総括表CSVをレベル別CSVへ一括変換するサブコマンド"""
+
+from __future__ import annotations
+
+import argparse
+import glob
+import logging
+import os
+import time
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from app.io.csv_handler import level_csv_filename, write_csv
+from app.io.xlsx_handler import write_xlsx, xlsx_filename
+from app.models.summary_cache import summary_cache
+from app.models.summary_sheet import SummarySheet
+from app.profiling import profile_path_from_env, profile_to, record_spans
+
+logger = logging.getLogger(__name__)
+
+# 入力パターンにグロブ文字が含まれるか判定するための文字
+GLOB_CHARS = "*?["
+
+# 出力形式 (csv: レベル毎のCSVファイル, xlsx: 全レベルを1つのExcelファイル)
+OUTPUT_FORMATS = ("csv", "xlsx")
+
+
+@dataclass(frozen=True)
+class ConvertResult:
+    """1ファイル分の変換結果"""
+
+    input_path: Path
+    output_paths: tuple[Path, ...] = ()
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        """変換に成功した場合 `True` を返す"""
+        return self.error is None
+
+
+@dataclass
+class ConvertReport:
+    """一括変換の集計結果"""
+
+    results: list[ConvertResult] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def succeeded(self) -> list[ConvertResult]:
+        """変換に成功した結果一覧"""
+        return [result for result in self.results if result.ok]
+
+    @property
+    def failed(self) -> list[ConvertResult]:
+        """変換に失敗した結果一覧"""
+        return [result for result in self.results if not result.ok]
+
+    @property
+    def files_per_sec(self) -> float:
+        """1秒あたりの処理ファイル数"""
+        if self.elapsed <= 0:
+            return 0.0
+        return len(self.results) / self.elapsed
+
+    def summary(self) -> str:
+        """集計結果を文字列で返す"""
+        return (
+            f"ファイル数: {len(self.results)} (成功: {len(self.succeeded)}, 失敗: {len(self.failed)}) / "
+            f"処理時間: {self.elapsed:.2f}秒 / {self.files_per_sec:.1f} files/sec"
+        )
+
+
+def collect_input_files(patterns: Iterable[str]) -> list[Path]:
+    """ファイル・グロブ・ディレクトリの指定から入力CSVファイルの一覧を返す"""
+    paths: dict[Path, None] = {}  # 順序を保持して重複を除外する
+    for pattern in patterns:
+        path = Path(pattern)
+        if path.is_dir():
+            # ディレクトリの場合は配下のCSVファイルを再帰的に収集
+            matches = sorted(p for p in path.rglob("*") if p.suffix.lower() == ".csv" and p.is_file())
+        elif any(char in pattern for char in GLOB_CHARS):
+            matches = sorted(Path(p) for p in glob.glob(pattern, recursive=True) if Path(p).is_file())
+        else:
+            matches = [path]
+
+        if not matches:
+            logger.warning("入力ファイルが見つかりません: %s", pattern)
+        for match in matches:
+            paths.setdefault(match, None)
+
+    return list(paths)
+
+
+def convert_file(
+    input_path: Path, output_dir: Path | None = None, output_format: str = "csv", use_cache: bool = False
+) -> ConvertResult:
+    """
+    総括表CSVファイルをレベル毎のCSVファイル、または全レベルを含む Excel ファイルに変換する
+
+    `use_cache` が `True` の場合は読み込んだ総括表をキャッシュし、同じファイルの再変換時は変更されていない
+    ブロックを引き継ぐ (監視モード用)。例外は送出せず、`ConvertResult.error` に格納して返す
+    """
+    try:
+        with record_spans():
+            if use_cache:
+                summary_sheet = summary_cache.load(input_path, reloader=SummarySheet.reloaded_from_csv)
+            else:
+                summary_sheet = SummarySheet.load_from_csv(input_path)
+            dest_dir = output_dir if output_dir is not None else input_path.parent
+            output_paths = write_summary_sheet(summary_sheet, dest_dir, input_path.stem, output_format)
+            return ConvertResult(input_path, output_paths)
+    except Exception as exc:
+        return ConvertResult(input_path, error=f"{type(exc).__name__}: {exc}")
+
+
+def write_summary_sheet(
+    summary_sheet: SummarySheet, dest_dir: Path, file_stem: str, output_format: str = "csv"
+) -> tuple[Path, ...]:
+    """総括表をレベル毎のCSVファイル、または全レベルを含む Excel ファイルに書き込み、出力したパスを返す"""
+    dest_dir.mkdir(parents=True, exist_ok=True)
+    if output_format == "xlsx":
+        output_path = dest_dir / xlsx_filename(file_stem)
+        write_xlsx(summary_sheet, output_path)
+        return (output_path,)
+
+    output_paths: list[Path] = []
+    for level in sorted(summary_sheet.cols_by_level):
+        output_path = dest_dir / level_csv_filename(file_stem, level)
+        write_csv(summary_sheet.iter_csv_rows(level), output_path)
+        output_paths.append(output_path)
+    return tuple(output_paths)
+
+
+def convert_files(
+    input_paths: Sequence[Path], output_dir: Path | None = None, jobs: int = 1, output_format: str = "csv"
+) -> ConvertReport:
+    """
+    複数の総括表CSVファイルを変換する
+
+    `jobs` が2以上の場合はプロセスプールで並列に変換する。
+    ワーカープロセスの異常終了などで結果を取得できないファイルは、失敗として他のファイルと分けて集計する
+    """
+    report = ConvertReport()
+    start = time.perf_counter()
+
+    if jobs <= 1 or len(input_paths) <= 1:
+        for input_path in input_paths:
+            _append_result(report, convert_file(input_path, output_dir, output_format))
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = {
+                executor.submit(convert_file, input_path, output_dir, output_format): input_path
+                for input_path in input_paths
+            }
+            for future in as_completed(futures):
+                try:
+                    result = future.result()
+                except Exception as exc:
+                    # BrokenProcessPool など、変換処理の外で発生したエラー
+                    result = ConvertResult(futures[future], error=f"{type(exc).__name__}: {exc}")
+                _append_result(report, result)
+
+    report.elapsed = time.perf_counter() - start
+    return report
+
+
+def _append_result(report: ConvertReport, result: ConvertResult) -> None:
+    """変換結果をレポートに追加してログに出力する"""
+    report.results.append(result)
+    if result.ok:
+        logger.info("変換しました: %s (%dファイル)", result.input_path, len(result.output_paths))
+    else:
+        logger.error("変換に失敗しました: %s | %s", result.input_path, result.error)
+
+
+def add_parser(subparsers: argparse._SubParsersAction) -> None:
+    """`convert` サブコマンドを登録する"""
+    parser = subparsers.add_parser("convert", help="総括表CSVをレベル別CSVまたはExcelファイルに一括変換する")
+    parser.add_argument("inputs", nargs="+", help="入力ファイル・グロブ・ディレクトリ")
+    parser.add_argument("-o", "--output-dir", type=Path, default=None, help="出力先ディレクトリ (既定: 入力と同じ場所)")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1, help="並列プロセス数 (既定: CPUコア数)")
+    parser.add_argument("-f", "--format", choices=OUTPUT_FORMATS, default="csv", help="出力形式 (既定: csv)")
+    parser.add_argument(
+        "--profile",
+        type=Path,
+        default=profile_path_from_env(),
+        help="cProfile の出力先 (指定した場合は1プロセスで変換する, 既定: 環境変数 MATE_SUMMARY_PROFILE)",
+    )
+    parser.set_defaults(func=run)
+
+
+def run(args: argparse.Namespace) -> int:
+    """`convert` サブコマンドを実行する"""
+    input_paths = collect_input_files(args.inputs)
+    if not input_paths:
+        logger.error("変換対象のファイルがありません")
+        return 2
+
+    # プロファイル出力時は計測対象を1プロセスにまとめる
+    jobs = 1 if args.profile is not None else args.jobs
+    with profile_to(args.profile):
+        report = convert_files(input_paths, args.output_dir, jobs, args.format)
+    print(report.summary())
+    return 0 if not report.failed else 1
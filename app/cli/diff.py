@@ -0,0 +1,45 @@
+"""2つの総括表CSV (変更前・変更後) の差分を出力するサブコマンド"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+from pathlib import Path
+
+from app.io.csv_handler import write_csv
+from app.models.summary_sheet import SummarySheet
+from app.profiling import record_spans
+
+logger = logging.getLogger(__name__)
+
+
+def add_parser(subparsers: argparse._SubParsersAction) -> None:
+    """`diff` サブコマンドを登録する"""
+    parser = subparsers.add_parser("diff", help="2つの総括表CSV (変更前・変更後) の差分を出力する")
+    parser.add_argument("old", type=Path, help="変更前の総括表CSVファイル")
+    parser.add_argument("new", type=Path, help="変更後の総括表CSVファイル")
+    parser.add_argument("-o", "--output", type=Path, default=None, help="差分を書き込むCSVファイル")
+    parser.set_defaults(func=run)
+
+
+def run(args: argparse.Namespace) -> int:
+    """
+    `diff` サブコマンドを実行する
+
+    終了コードは差分なしの場合 `0`、差分ありの場合 `1`、エラーの場合 `2` とする
+    """
+    try:
+        with record_spans():
+            old_sheet = SummarySheet.load_from_csv(args.old)
+            new_sheet = SummarySheet.load_from_csv(args.new)
+            summary_diff = new_sheet.diff(old_sheet)
+            if args.output is not None:
+                write_csv(summary_diff.csv_rows(), args.output)
+    except Exception as exc:
+        logger.error("差分の取得に失敗しました: %s: %s", type(exc).__name__, exc)
+        return 2
+
+    if args.output is not None:
+        logger.info("出力しました: %s", args.output)
+    print(summary_diff.summary())
+    return 1 if summary_diff else 0
@@ -0,0 +1,56 @@
+"""複数の総括表CSV (橋梁毎) を1つの総括表に統合するサブコマンド"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import time
+from pathlib import Path
+
+from app.cli.convert import OUTPUT_FORMATS, collect_input_files, write_summary_sheet
+from app.models.summary_merger import DEFAULT_ROOT_NAME, merge_summary_csvs
+from app.profiling import record_spans
+
+logger = logging.getLogger(__name__)
+
+
+def add_parser(subparsers: argparse._SubParsersAction) -> None:
+    """`merge` サブコマンドを登録する"""
+    parser = subparsers.add_parser("merge", help="複数の総括表CSV (橋梁毎) を1つの総括表に統合する")
+    parser.add_argument("inputs", nargs="+", help="入力ファイル・グロブ・ディレクトリ (指定順に橋梁の列を並べる)")
+    parser.add_argument(
+        "-o", "--output-dir", type=Path, default=Path("."), help="出力先ディレクトリ (既定: 現在の場所)"
+    )
+    parser.add_argument(
+        "-n", "--name", default=DEFAULT_ROOT_NAME, help=f"統合した総括表の名称 (既定: {DEFAULT_ROOT_NAME})"
+    )
+    parser.add_argument("--bridge-names", nargs="+", help="橋梁の列名 (既定: 各総括表の #1レベル名)")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1, help="並列プロセス数 (既定: CPUコア数)")
+    parser.add_argument("-f", "--format", choices=OUTPUT_FORMATS, default="csv", help="出力形式 (既定: csv)")
+    parser.set_defaults(func=run)
+
+
+def run(args: argparse.Namespace) -> int:
+    """`merge` サブコマンドを実行する"""
+    input_paths = collect_input_files(args.inputs)
+    if not input_paths:
+        logger.error("統合対象のファイルがありません")
+        return 2
+
+    start = time.perf_counter()
+    try:
+        with record_spans():
+            merged_sheet = merge_summary_csvs(input_paths, args.bridge_names, args.name, args.jobs)
+            file_stem = f"{args.name}_{merged_sheet.schema.name}"
+            output_paths = write_summary_sheet(merged_sheet, args.output_dir, file_stem, args.format)
+    except Exception as exc:
+        logger.error("統合に失敗しました: %s: %s", type(exc).__name__, exc)
+        return 1
+
+    for output_path in output_paths:
+        logger.info("出力しました: %s", output_path)
+    print(
+        f"ファイル数: {len(input_paths)} / 出力: {len(output_paths)}ファイル / 処理時間: {time.perf_counter() - start:.2f}秒"
+    )
+    return 0
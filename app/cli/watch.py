@@ -0,0 +1,187 @@
+"""ディレクトリを監視し、更新された総括表CSVを変換し続けるサブコマンド"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import re
+import threading
+import time
+from pathlib import Path
+
+from app.cli.convert import OUTPUT_FORMATS, convert_file
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INTERVAL = 2.0  # 走査の間隔 (秒)
+DEFAULT_SETTLE = 2.0  # 更新が止まってから変換するまでの待機時間 (秒)
+
+# 変換結果のファイル (例: 鋼材重量総括表_#3レベル名.csv) は監視対象から除外する
+LEVEL_CSV_PATTERN = re.compile(r"_#\d+レベル名\.csv$", re.IGNORECASE)
+# 隠しファイル・一時ファイルの接頭辞
+IGNORED_PREFIXES = (".", "~")
+
+
+# ファイルの更新日時 (ns) とサイズ (走査毎に全ファイル分を生成するため tuple で保持する)
+FileState = tuple[int, int]
+
+
+def scan_directory(root: Path, exclude_dirs: frozenset[Path] = frozenset()) -> dict[str, FileState]:
+    """
+    ディレクトリ配下の総括表CSVの更新日時とサイズを、パス文字列をキーとして返す
+
+    `os.scandir` で再帰的に走査し、拡張子と名前で対象を絞り込んでから stat を取得する。
+    ファイル数が多い場合に備え、走査中は `Path` を生成しない
+    """
+    excluded = {str(path) for path in exclude_dirs}
+    snapshot: dict[str, FileState] = {}
+    stack = [str(root)]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.startswith(IGNORED_PREFIXES):
+                        continue
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.path not in excluded:
+                                stack.append(entry.path)
+                            continue
+                        if not name.lower().endswith(".csv"):
+                            continue
+                        if "レベル名" in name and LEVEL_CSV_PATTERN.search(name):
+                            continue
+                        stat = entry.stat()
+                    except OSError:
+                        # 走査中に削除されたファイルは無視する
+                        continue
+                    snapshot[entry.path] = (stat.st_mtime_ns, stat.st_size)
+        except OSError as e:
+            logger.warning("ディレクトリを読み込めません: %s (%s)", directory, e)
+    return snapshot
+
+
+class DirectoryWatcher:
+    """
+    ディレクトリ配下の総括表CSVの変更を検出するクラス
+
+    更新日時またはサイズが変わったファイルは、`settle` 秒間変化しなくなってから変更として返す
+    (書き込み中のファイルや連続した上書きをまとめる)
+    """
+
+    def __init__(self, root: Path, settle: float = DEFAULT_SETTLE, exclude_dirs: frozenset[Path] = frozenset()):
+        self.root = root
+        self.settle = settle
+        self.exclude_dirs = exclude_dirs
+        # 変換済みのファイルの状態
+        self._known: dict[str, FileState] = {}
+        # 変更を検出したファイルの最新の状態と、その状態を最初に検出した時刻
+        self._pending: dict[str, tuple[FileState, float]] = {}
+
+    @property
+    def pending_count(self) -> int:
+        """更新が止まるのを待っているファイル数"""
+        return len(self._pending)
+
+    def snapshot(self) -> dict[str, FileState]:
+        """監視対象のファイルの状態を返す"""
+        return scan_directory(self.root, self.exclude_dirs)
+
+    def baseline(self) -> int:
+        """現在のファイルを変換済みとして記録し、ファイル数を返す"""
+        self._known = self.snapshot()
+        self._pending.clear()
+        return len(self._known)
+
+    def poll(self, now: float | None = None) -> list[Path]:
+        """ディレクトリを走査し、変換対象のファイル (更新が止まったファイル) を返す"""
+        now = time.monotonic() if now is None else now
+        snapshot = self.snapshot()
+
+        # 削除されたファイルは記録から除外する
+        for path in self._known.keys() - snapshot.keys():
+            del self._known[path]
+        for path in self._pending.keys() - snapshot.keys():
+            del self._pending[path]
+
+        ready: list[str] = []
+        for path, state in snapshot.items():
+            if self._known.get(path) == state:
+                self._pending.pop(path, None)
+                continue
+            pending = self._pending.get(path)
+            if pending is None or pending[0] != state:
+                # 新たな変更: 更新が止まるまで待機する
+                self._pending[path] = (state, now)
+            elif now - pending[1] >= self.settle:
+                ready.append(path)
+
+        for path in ready:
+            self._known[path] = self._pending.pop(path)[0]
+        return [Path(path) for path in sorted(ready)]
+
+
+def watch(
+    root: Path,
+    output_dir: Path | None = None,
+    output_format: str = "csv",
+    interval: float = DEFAULT_INTERVAL,
+    settle: float = DEFAULT_SETTLE,
+    initial: bool = False,
+    stop_event: threading.Event | None = None,
+) -> None:
+    """
+    `stop_event` が設定されるまでディレクトリを監視し、更新されたファイルを変換する
+
+    `initial` が `True` の場合は起動時に存在するファイルも変換する
+    """
+    stop_event = stop_event or threading.Event()
+    exclude_dirs = frozenset({output_dir.resolve()}) if output_dir is not None else frozenset()
+    watcher = DirectoryWatcher(root.resolve(), settle, exclude_dirs)
+    if not initial:
+        count = watcher.baseline()
+        logger.info("監視を開始しました: %s (%dファイル)", root, count)
+
+    while not stop_event.is_set():
+        start = time.perf_counter()
+        ready = watcher.poll()
+        logger.debug("走査しました: %.1fms (待機中: %d)", (time.perf_counter() - start) * 1000, watcher.pending_count)
+
+        for path in ready:
+            if stop_event.is_set():
+                break
+            result = convert_file(path, output_dir, output_format, use_cache=True)
+            if result.ok:
+                logger.info("変換しました: %s (%dファイル)", path, len(result.output_paths))
+            else:
+                logger.error("変換に失敗しました: %s | %s", path, result.error)
+
+        stop_event.wait(interval)
+
+
+def add_parser(subparsers: argparse._SubParsersAction) -> None:
+    """`watch` サブコマンドを登録する"""
+    parser = subparsers.add_parser("watch", help="ディレクトリを監視し、更新された総括表CSVを変換し続ける")
+    parser.add_argument("directory", type=Path, help="監視するディレクトリ")
+    parser.add_argument("-o", "--output-dir", type=Path, default=None, help="出力先ディレクトリ (既定: 入力と同じ場所)")
+    parser.add_argument("-f", "--format", choices=OUTPUT_FORMATS, default="csv", help="出力形式 (既定: csv)")
+    parser.add_argument("--interval", type=float, default=DEFAULT_INTERVAL, help="走査の間隔 (秒)")
+    parser.add_argument("--settle", type=float, default=DEFAULT_SETTLE, help="更新が止まってから変換するまでの秒数")
+    parser.add_argument("--initial", action="store_true", help="起動時に存在するファイルも変換する")
+    parser.set_defaults(func=run)
+
+
+def run(args: argparse.Namespace) -> int:
+    """`watch` サブコマンドを実行する"""
+    if not args.directory.is_dir():
+        logger.error("ディレクトリが存在しません: %s", args.directory)
+        return 2
+
+    try:
+        watch(args.directory, args.output_dir, args.format, args.interval, args.settle, args.initial)
+    except KeyboardInterrupt:
+        logger.info("監視を終了しました")
+    return 0
@@ -3,17 +3,26 @@ from __future__ import annotations
 import logging
 from pathlib import Path
 
-from PySide6.QtCore import QObject, Slot
+from PySide6.QtCore import QObject, QThreadPool, QTimer, Slot
 from PySide6.QtGui import QCloseEvent
 from PySide6.QtWidgets import QFileDialog, QMessageBox
 
 from app.config import APP_NAME, APP_VERSION
+from app.controllers.summary_loader import SummaryLoadTask
+from app.io.csv_handler import level_csv_filename, write_csv
+from app.io.xlsx_handler import write_xlsx
+from app.models.summary_cache import summary_cache
+from app.models.summary_diff import SummaryDiff
 from app.models.summary_sheet import SummarySheet
-from app.views.components.summary_table_widget import SummaryTableWidget
+from app.profiling import format_spans, record_spans
 from app.views.main_window import MainWindow
 from app.views.settings import WindowSettings
 
-LEVELS = [1, 2, 3, 4]
+INITIAL_LEVELS = [1]  # 総括表を読み込む前に表示するタブのレベル
+LOAD_DEBOUNCE_MS = 300  # パス変更から読み込み開始までの待機時間
+MAX_LOGGED_INCONSISTENCIES = 20  # ログに出力する集計値の不整合の件数
+CSV_FILE_FILTER = "CSVファイル (*.csv)"
+XLSX_FILE_FILTER = "Excelブック (*.xlsx)"
 logger = logging.getLogger(__name__)
 
 
@@ -30,11 +39,28 @@ class MainController(QObject):
         last_dir = str(self.window_settings.get_last_dir())
         self.main_window.fileSelector.set_initial_dir(last_dir)
 
+        # バックグラウンド読み込み用のスレッドプールとデバウンス用タイマー
+        self._thread_pool = QThreadPool(self)
+        self._load_timer = QTimer(self)
+        self._load_timer.setSingleShot(True)
+        self._load_timer.setInterval(LOAD_DEBOUNCE_MS)
+        self._load_request_id = 0
+        self._load_task: SummaryLoadTask | None = None
+        self._pending_path = ""
+        # 比較対象の読み込み要求 (表示中の総括表の読み込みとは独立してキャンセルする)
+        self._compare_request_id = 0
+        self._compare_task: SummaryLoadTask | None = None
+        # セルを表示済みのタブのレベル (タブは初めて表示した時にセルをセットする)
+        self._populated_levels: set[int] = set()
+        self._diff: SummaryDiff | None = None
+
         # 初期化処理
         self._setup()
 
         # 状態変数を宣言
         self.summary_sheet: SummarySheet | None = None
+        # 比較対象 (変更前) の総括表
+        self.compare_sheet: SummarySheet | None = None
 
     @property
     def filepath(self) -> Path:
@@ -61,15 +87,79 @@ class MainController(QObject):
     @Slot(str)
     def on_path_changed(self, filepath: str) -> None:
         """`FileSelector` のパス変更ハンドラ"""
-        # テーブルを全て更新
-        self._update_tables()
-
-        # 最後に開いたディレクトリを保存
-        last_dir = Path(filepath).parent
-        self.window_settings.save_last_dir(last_dir)
+        # 連続したパス変更はタイマーを再始動してまとめる
+        self._pending_path = filepath
+        self._load_timer.start()
 
         logger.info("選択パスが変更されました: %s", filepath)
 
+    @Slot()
+    def on_load_requested(self) -> None:
+        """デバウンス後にファイルの読み込みを開始する"""
+        # 実行中の読み込みはキャンセル
+        self._cancel_load()
+
+        if not self._pending_path:
+            self.main_window.statusbar.clearMessage()
+            return
+
+        self._load_request_id += 1
+        task = SummaryLoadTask(self._load_request_id, Path(self._pending_path))
+        task.signals.progress.connect(self.on_load_progress)
+        task.signals.finished.connect(self.on_load_finished)
+        task.signals.failed.connect(self.on_load_failed)
+        self._load_task = task
+        self._thread_pool.start(task)
+
+    @Slot(int, str)
+    def on_load_progress(self, request_id: int, message: str) -> None:
+        """読み込みの進捗をステータスバーに表示する"""
+        if request_id != self._load_request_id:
+            return
+        self.main_window.statusbar.showMessage(message)
+
+    @Slot(int, object)
+    def on_load_finished(self, request_id: int, summary_sheet: SummarySheet) -> None:
+        """読み込み完了時にテーブルを更新する"""
+        # 古い読み込み要求の結果は破棄
+        if request_id != self._load_request_id:
+            return
+        load_spans = self._load_task.spans if self._load_task is not None else []
+        inconsistencies = self._load_task.inconsistencies if self._load_task is not None else []
+        self._load_task = None
+        self.summary_sheet = summary_sheet
+
+        # テーブルを全て更新 (比較中の場合は差分も更新)
+        with record_spans() as update_spans:
+            self._update_tables()
+            diff_message = self._apply_diff()
+
+        # 最後に開いたディレクトリを保存
+        if summary_sheet.csv_path is not None:
+            self.window_settings.save_last_dir(summary_sheet.csv_path.parent)
+
+        # 処理時間をステータスバーに表示
+        message = f"読み込みました: {summary_sheet.csv_path}"
+        if spans := [*load_spans, *update_spans]:
+            message += f" ({format_spans(spans)})"
+        if inconsistencies:
+            message += f" / 集計値の不整合: {len(inconsistencies)}件"
+            for inconsistency in inconsistencies[:MAX_LOGGED_INCONSISTENCIES]:
+                logger.warning("集計値の不整合: %s", inconsistency.message)
+        if diff_message:
+            message += f" / {diff_message}"
+        self.main_window.statusbar.showMessage(message)
+        logger.info("ファイルを読み込みました: %s (%s)", summary_sheet.csv_path, summary_cache.stats())
+
+    @Slot(int, str)
+    def on_load_failed(self, request_id: int, message: str) -> None:
+        """読み込み失敗時にステータスバーへ通知する"""
+        if request_id != self._load_request_id:
+            return
+        self._load_task = None
+        self.main_window.statusbar.showMessage(f"読み込みに失敗しました: {message}")
+        logger.warning("ファイルの読み込みに失敗しました: %s", message)
+
     @Slot()
     def on_open(self) -> None:
         """ファイル選択ダイアログを開く"""
@@ -77,7 +167,7 @@ class MainController(QObject):
 
     @Slot()
     def on_save_as(self) -> None:
-        """名前を付けてCSVファイルを保存"""
+        """名前を付けてCSVファイル (表示中のレベル) または Excel ファイル (全レベル) を保存"""
         if self.summary_sheet is None:
             logger.warning("保存するデータがありません")
             return
@@ -89,28 +179,102 @@ class MainController(QObject):
         else:
             input_file_stem = "summary"
 
-        # レベル名称
-        level = self.summary_sheet.display_level
-        level_name = f"#{level}レベル名"  # 例: #3レベル
+        # 表示中のタブのレベルを保存対象とする
+        level = self.main_window.current_level
+        if level is None:
+            return
 
-        # 保存先のファイル名 (例: 鋼材重量総括表_#3レベル.csv)
-        output_filename = f"{input_file_stem}_{level_name}.csv"
+        # 保存先のファイル名 (例: 鋼材重量総括表_#3レベル名.csv)
+        output_filename = level_csv_filename(input_file_stem, level)
 
-        file_path, _ = QFileDialog.getSaveFileName(
+        file_path, selected_filter = QFileDialog.getSaveFileName(
             self.main_window,
-            "CSVファイルを保存",
+            "ファイルを保存",
             output_filename,
-            "CSVファイル (*.csv);;すべてのファイル (*.*)",
+            f"{CSV_FILE_FILTER};;{XLSX_FILE_FILTER};;すべてのファイル (*.*)",
         )
         if file_path:
+            output_path = Path(file_path)
+            if selected_filter == XLSX_FILE_FILTER:
+                output_path = output_path.with_suffix(".xlsx")
             try:
-                # 元のCSVデータを保存
-                from app.io.csv_handler import write_csv
-
-                write_csv(self.summary_sheet.csv_data, Path(file_path))
-                logger.info("ファイルを保存しました: %s", file_path)
+                if output_path.suffix.lower() == ".xlsx":
+                    # 全レベルをワークシート毎に保存
+                    write_xlsx(self.summary_sheet, output_path)
+                else:
+                    # 表示中のレベルを保存
+                    write_csv(self.summary_sheet.iter_csv_rows(level), output_path)
+                logger.info("ファイルを保存しました: %s", output_path)
             except Exception:
-                logger.exception("ファイル保存に失敗しました: %s", file_path)
+                logger.exception("ファイル保存に失敗しました: %s", output_path)
+
+    @Slot()
+    def on_compare(self) -> None:
+        """変更前の総括表CSVを選択し、表示中の総括表との差分を強調表示する"""
+        if self.summary_sheet is None:
+            logger.warning("比較する総括表がありません")
+            return
+
+        initial_dir = str(self.summary_sheet.csv_path.parent) if self.summary_sheet.csv_path else ""
+        file_path, _ = QFileDialog.getOpenFileName(
+            self.main_window, "変更前の総括表CSVを選択", initial_dir, f"{CSV_FILE_FILTER};;すべてのファイル (*.*)"
+        )
+        if not file_path:
+            return
+
+        # 比較対象はワーカースレッドで読み込み、読み込み完了時に差分を取得する
+        self._cancel_compare_load()
+        self._compare_request_id += 1
+        task = SummaryLoadTask(self._compare_request_id, Path(file_path), validate=False)
+        task.signals.progress.connect(self.on_compare_progress)
+        task.signals.finished.connect(self.on_compare_finished)
+        task.signals.failed.connect(self.on_compare_failed)
+        self._compare_task = task
+        self._thread_pool.start(task)
+
+    @Slot(int, str)
+    def on_compare_progress(self, request_id: int, message: str) -> None:
+        """比較対象の読み込みの進捗をステータスバーに表示する"""
+        if request_id != self._compare_request_id:
+            return
+        self.main_window.statusbar.showMessage(f"比較対象を{message}")
+
+    @Slot(int, object)
+    def on_compare_finished(self, request_id: int, compare_sheet: SummarySheet) -> None:
+        """比較対象の読み込み完了時に差分を強調表示する"""
+        if request_id != self._compare_request_id:
+            return
+        self._compare_task = None
+        self.compare_sheet = compare_sheet
+        diff_message = self._apply_diff()
+        self.main_window.statusbar.showMessage(diff_message)
+        logger.info(diff_message)
+
+    @Slot(int, str)
+    def on_compare_failed(self, request_id: int, message: str) -> None:
+        """比較対象の読み込み失敗時にステータスバーへ通知する"""
+        if request_id != self._compare_request_id:
+            return
+        self._compare_task = None
+        self.main_window.statusbar.showMessage(f"比較対象の読み込みに失敗しました: {message}")
+        logger.warning("比較対象の読み込みに失敗しました: %s", message)
+
+    @Slot()
+    def on_clear_compare(self) -> None:
+        """比較表示を解除する (比較対象の読み込み中の場合はキャンセルする)"""
+        self._cancel_compare_load()
+        # キャンセル前に完了した読み込みの結果は破棄
+        self._compare_request_id += 1
+        self.compare_sheet = None
+        self._apply_diff()
+        self.main_window.statusbar.clearMessage()
+
+    @Slot(int)
+    def on_tab_changed(self, _index: int) -> None:
+        """表示したタブのテーブルが未表示の場合はセットする"""
+        level = self.main_window.current_level
+        if level is not None:
+            self._populate_level(level)
 
     @Slot()
     def on_exit(self) -> None:
@@ -128,16 +292,22 @@ class MainController(QObject):
         """シグナル接続と初期化処理を行う"""
         # シグナル接続
         self.main_window.fileSelector.pathChanged.connect(self.on_path_changed)
+        self._load_timer.timeout.connect(self.on_load_requested)
 
         # メニューアクション接続
         self.main_window.actionOpen.triggered.connect(self.on_open)
         self.main_window.actionSaveAs.triggered.connect(self.on_save_as)
+        self.main_window.actionCompare.triggered.connect(self.on_compare)
+        self.main_window.actionClearCompare.triggered.connect(self.on_clear_compare)
         self.main_window.actionExit.triggered.connect(self.on_exit)
         self.main_window.actionShowVersion.triggered.connect(self.on_show_version)
 
         # ボタンアクション接続
         self.main_window.saveButton.clicked.connect(self.on_save_as)
 
+        # タブ切り替え時に未表示のテーブルをセット
+        self.main_window.levelTabWidget.currentChanged.connect(self.on_tab_changed)
+
         # ウィンドウ終了イベントにウィンドウ状態保存をフック
         self.main_window.closeEvent = self._handle_close_event
 
@@ -147,39 +317,86 @@ class MainController(QObject):
     def _handle_close_event(self, event: QCloseEvent) -> None:
         """ウィンドウ終了イベント"""
         self.save_window()
+
+        # 実行中の読み込みを停止
+        self._load_timer.stop()
+        self._cancel_load()
+        self._cancel_compare_load()
+        self._thread_pool.waitForDone()
+
         event.accept()
 
+    def _cancel_load(self) -> None:
+        """実行中の読み込みをキャンセルする"""
+        if self._load_task is not None:
+            self._load_task.cancel()
+            self._load_task = None
+
+    def _cancel_compare_load(self) -> None:
+        """実行中の比較対象の読み込みをキャンセルする"""
+        if self._compare_task is not None:
+            self._compare_task.cancel()
+            self._compare_task = None
+
     def _init_tables(self) -> None:
         """テーブルを全て初期化"""
-        for level in LEVELS:
-            self._init_table_widget(level)
-
-    def _get_table_widget(self, level: int) -> SummaryTableWidget:
-        """レベル番号に対応するテーブルウィジェットを返す"""
-        mapping = {
-            1: self.main_window.level1TableWidget,
-            2: self.main_window.level2TableWidget,
-            3: self.main_window.level3TableWidget,
-            4: self.main_window.level4TableWidget,
-        }
-        widget = mapping.get(level)
-        if isinstance(widget, SummaryTableWidget):
-            return widget
-
-        raise RuntimeError(f"レベル{level} のテーブルが見つかりません。")
-
-    def _init_table_widget(self, level: int) -> None:
-        """テーブルを初期化"""
-        table = self._get_table_widget(level)
-        table.setRowCount(0)
+        self.main_window.set_levels(INITIAL_LEVELS)
+        for table_view in self.main_window.level_table_views.values():
+            table_view.clear()
+        self._populated_levels.clear()
 
     def _update_tables(self) -> None:
-        """テーブルを全て更新する"""
-        self.summary_sheet = SummarySheet.load_from_csv(self.filepath)
-
-        # レベル毎にシートをセット
-        for level in LEVELS:
-            self.summary_sheet.display_level = level
-            csv_data = self.summary_sheet.csv_data
-            table_widget = self._get_table_widget(level)
-            table_widget.populate(csv_data)
+        """
+        読み込んだ総括表のレベル構成に合わせてタブを生成し、表示中のタブのテーブルをセットする
+
+        他のタブは初めて表示した時にセットするため、表示までの時間はレベル数に依存しない
+        """
+        if self.summary_sheet is None:
+            return
+
+        # 総括表を表示中の場合は表示中のレベルを維持する
+        current_level = self.main_window.current_level if self._populated_levels else None
+        levels = sorted(self.summary_sheet.cols_by_level)
+        self.main_window.set_levels(levels)
+        for table_view in self.main_window.level_table_views.values():
+            table_view.clear()
+        self._populated_levels.clear()
+        # 差分は読み込んだ総括表で取得し直す (`_apply_diff`)
+        self._diff = None
+        if not levels:
+            return
+
+        # 初回表示または表示中のレベルが存在しない場合は最下位レベルのタブを表示する
+        if current_level not in levels:
+            current_level = levels[-1]
+        self.main_window.set_current_level(current_level)
+        self._populate_level(current_level)
+
+    def _populate_level(self, level: int) -> None:
+        """レベルのテーブルに総括表と差分をセットする (セット済みの場合は何もしない)"""
+        if self.summary_sheet is None or level in self._populated_levels:
+            return
+        table_view = self.main_window.level_table_views[level]
+        table_view.populate(self.summary_sheet, level)
+        table_view.set_diff(self._diff)
+        self._populated_levels.add(level)
+
+    def _apply_diff(self) -> str:
+        """比較対象との差分をテーブルに強調表示し、差分の件数を返す (比較対象がない場合は解除して空文字を返す)"""
+        diff = None
+        message = ""
+        if self.compare_sheet is not None and self.summary_sheet is not None:
+            try:
+                diff = self.summary_sheet.diff(self.compare_sheet)
+                message = f"比較: {self.compare_sheet.csv_path} ({diff.summary()})"
+            except ValueError as exc:
+                # 総括表の種類が異なる場合は比較を解除する
+                self.compare_sheet = None
+                message = f"比較を解除しました: {exc}"
+
+        self.main_window.actionClearCompare.setEnabled(self.compare_sheet is not None)
+        # 差分はセット済みのテーブルのみに反映し、他のタブは表示時に反映する
+        self._diff = diff
+        for level in self._populated_levels:
+            self.main_window.level_table_views[level].set_diff(diff)
+        return message
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+from app.io.csv_reader import CSVReader, CSVRow
+from app.models.summary_cache import summary_cache
+from app.models.summary_sheet import SummarySheet
+from app.models.summary_validator import Inconsistency
+from app.profiling import TimingSpan, profile_path_from_env, profile_to, record_spans
+
+# 進捗を通知する行数の間隔
+PROGRESS_INTERVAL_ROWS = 1000
+
+logger = logging.getLogger(__name__)
+
+
+class LoadCancelledError(Exception):
+    """読み込みがキャンセルされた場合に送出される例外"""
+
+
+class SummaryLoadSignals(QObject):
+    """`SummaryLoadTask` の通知用シグナル"""
+
+    # 読み込み要求ID, 進捗メッセージ
+    progress = Signal(int, str)
+    # 読み込み要求ID, 読み込んだ SummarySheet
+    finished = Signal(int, object)
+    # 読み込み要求ID, エラーメッセージ
+    failed = Signal(int, str)
+
+
+class SummaryLoadTask(QRunnable):
+    """`SummarySheet` をワーカースレッドで読み込むタスク"""
+
+    def __init__(self, request_id: int, filepath: Path, validate: bool = True) -> None:
+        super().__init__()
+        self.request_id = request_id
+        self.filepath = filepath
+        # 読み込み後に集計値の整合性を検証するか (比較対象の読み込みでは検証しない)
+        self.validate = validate
+        self.signals = SummaryLoadSignals()
+        # 読み込み処理の計測結果 (読み込み完了後に参照する)
+        self.spans: list[TimingSpan] = []
+        # 集計値の整合性の検証結果 (読み込み完了後に参照する)
+        self.inconsistencies: list[Inconsistency] = []
+        self._cancel_event = threading.Event()
+
+    @property
+    def is_cancelled(self) -> bool:
+        """キャンセル済みの場合 `True` を返す"""
+        return self._cancel_event.is_set()
+
+    def cancel(self) -> None:
+        """読み込みをキャンセルする (読み込み中の場合は次の行の読み込み時に中断する)"""
+        self._cancel_event.set()
+
+    def run(self) -> None:
+        """ワーカースレッドで実行される処理"""
+        try:
+            self._check_cancelled()
+            self.signals.progress.emit(self.request_id, f"読み込み中: {self.filepath.name}")
+            with record_spans() as spans, profile_to(profile_path_from_env()):
+                self.spans = spans
+                summary_sheet = summary_cache.load(self.filepath, self._load, self._reload)
+                self._check_cancelled()
+                if self.validate:
+                    self.inconsistencies = summary_sheet.validate()
+            self._check_cancelled()
+        except LoadCancelledError:
+            logger.info("読み込みをキャンセルしました: %s", self.filepath)
+            return
+        except Exception as exc:
+            if not self.is_cancelled:
+                self.signals.failed.emit(self.request_id, str(exc))
+            return
+
+        self.signals.finished.emit(self.request_id, summary_sheet)
+
+    def _load(self, filepath: Path) -> SummarySheet:
+        """キャンセル可能な行イテレータから `SummarySheet` を生成する"""
+        reader = CSVReader(filepath)
+        return SummarySheet(self._iter_rows(reader.iter_rows()), filepath)
+
+    def _reload(self, summary_sheet: SummarySheet) -> SummarySheet:
+        """キャンセル可能な行イテレータで `SummarySheet` を再読み込みする (変更されていないブロックを引き継ぐ)"""
+        reader = CSVReader(self.filepath)
+        return summary_sheet.reloaded(self._iter_rows(reader.iter_rows()))
+
+    def _iter_rows(self, rows: Iterable[CSVRow]) -> Iterator[CSVRow]:
+        """キャンセルを確認しながら行を返し、一定行数毎に進捗を通知する"""
+        for count, row in enumerate(rows, start=1):
+            self._check_cancelled()
+            if count % PROGRESS_INTERVAL_ROWS == 0:
+                self.signals.progress.emit(self.request_id, f"読み込み中: {self.filepath.name} ({count}行)")
+            yield row
+
+    def _check_cancelled(self) -> None:
+        """キャンセル済みの場合は `LoadCancelledError` を送出する"""
+        if self.is_cancelled:
+            raise LoadCancelledError
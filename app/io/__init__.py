@@ -1 +1,2 @@
-ENCODING = "shift_jis"
+# 書き込み時の文字コード (読み込み時は自動判定する)
+ENCODING = "cp932"
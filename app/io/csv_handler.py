@@ -1,13 +1,31 @@
 import csv
+from collections.abc import Iterable
+from itertools import batched
 from pathlib import Path
 
 from app.io import ENCODING
-from app.models.csv_data import CSVData
+from app.io.csv_reader import CSVRow
+from app.profiling import timed
 
+# `writerows` でまとめて書き込む行数
+WRITE_BATCH_ROWS = 1000
 
-def write_csv(csv_data: CSVData, output_path: Path) -> None:
-    """`CSVData` をCSVファイルに書き込む"""
-    with output_path.open("w", encoding=ENCODING, newline="") as csvfile:
+
+def write_csv(rows: Iterable[CSVRow], output_path: Path) -> None:
+    """
+    CSV行 (`CSVData` または `SummarySheet.iter_csv_rows` など) をCSVファイルに書き込む
+
+    行は一定行数毎にまとめて書き込むため、イテレータを渡した場合は全行を保持しない
+    """
+    with timed("write_csv") as counts, output_path.open("w", encoding=ENCODING, newline="") as csvfile:
         writer = csv.writer(csvfile)
-        for row in csv_data:
-            writer.writerow(row)
+        count = 0
+        for batch in batched(rows, WRITE_BATCH_ROWS):
+            writer.writerows(batch)
+            count += len(batch)
+        counts["rows"] = count
+
+
+def level_csv_filename(input_file_stem: str, level: int) -> str:
+    """レベル別CSVファイルの保存ファイル名を返す (例: 鋼材重量総括表_#3レベル名.csv)"""
+    return f"{input_file_stem}_#{level}レベル名.csv"
@@ -1,9 +1,11 @@
 import csv
+import io
+from collections.abc import Iterator
 from pathlib import Path
 from typing import override
 
-from app.io import ENCODING
 from app.io.file_reader import BaseFileReader
+from app.profiling import timed
 
 
 class CSVRow(list[str]):
@@ -22,25 +24,30 @@ class CSVReader(BaseFileReader):
 
     def load(self) -> list[CSVRow]:
         """CSVファイルを読み込んで検証する"""
-        csv_data: list[CSVRow] = []
-        with self.csv_path.open("r", encoding=ENCODING) as csv_file:
-            reader = csv.reader(csv_file)
-            for row in reader:
-                csv_row = CSVRow(row)
-                csv_data.append(self._strip_cells(csv_row))
-
+        with timed("csv_load") as counts:
+            csv_data = list(self.iter_rows())
+            counts["rows"] = len(csv_data)
         self._validate_csv_data(csv_data)
         return csv_data
 
+    def iter_rows(self) -> Iterator[CSVRow]:
+        """
+        CSVファイルを1行ずつ読み込み、前後の空白を削除した行を返す
+
+        ファイルは一括で読み込んで復号し (文字コードは自動判定)、空白の削除は行の分割と同時に行う
+        """
+        for row in self.iter_raw_rows():
+            yield CSVRow(map(str.strip, row))
+
+    def iter_raw_rows(self) -> Iterator[list[str]]:
+        """CSVファイルを一括で読み込み、空白を削除していない行のイテレータを返す"""
+        return csv.reader(io.StringIO(self.read_text(), newline=""))
+
     def _validate_csv_data(self, csv_data: list[CSVRow]) -> None:
         """読み込んだCSVデータを検証"""
         if not csv_data:
             raise ValueError("CSVファイルが空です")
 
-    def _strip_cells(self, row: CSVRow) -> CSVRow:
-        """各セルの前後の空白を削除して返す"""
-        return CSVRow(cell.strip() for cell in row)
-
     @property
     @override
     def supported_extensions(self) -> list[str]:
@@ -1,13 +1,24 @@
+import mmap
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from pathlib import Path
 from typing import Final
 
+from app.profiling import timed
+
+# 読み込み時に判定する文字コード (先頭から順に復号を試す)
+# cp932 は シフトJIS の上位互換のため、シフトJIS のファイルも cp932 で復号する
+SNIFF_ENCODINGS = ("utf-8-sig", "cp932")
+# このサイズ (バイト) 以上のファイルは mmap で読み込む
+MMAP_THRESHOLD = 1 << 20
+
 
 class BaseFileReader(ABC):
     """ファイル読み込みの基底クラス"""
 
     def __init__(self, file_path: str | Path):
         self.file_path: Final = Path(file_path)
+        self.encoding: str | None = None  # 読み込み時に判定した文字コード
         self.validate()
 
     @property
@@ -24,20 +35,40 @@ class BaseFileReader(ABC):
         self._validate_extension()
         self._validate_file_readable()
 
+    def read_text(self, encodings: Sequence[str] = SNIFF_ENCODINGS) -> str:
+        """
+        ファイルを1回だけ開いて一括で読み込み、文字コードを判定して復号する
+
+        大きなファイルは mmap した領域をそのまま復号し、バイト列の複製を作らない
+        """
+        try:
+            with self.file_path.open("rb") as file, timed("read") as counts:
+                size = counts["bytes"] = self.file_path.stat().st_size
+                if size < MMAP_THRESHOLD:
+                    return self._decode(file.read(), encodings)
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    return self._decode(mapped, encodings)
+        except (PermissionError, OSError) as e:
+            raise PermissionError(f"ファイルにアクセスできません: {self.file_path}") from e
+
+    def _decode(self, data: bytes | mmap.mmap, encodings: Sequence[str]) -> str:
+        """候補の文字コードで順に復号し、最初に成功した結果を返す"""
+        for encoding in encodings:
+            try:
+                text = str(data, encoding)
+            except UnicodeDecodeError:
+                continue
+            self.encoding = encoding
+            return text
+        raise ValueError(f"文字コードを判定できません ({', '.join(encodings)}): {self.file_path}")
+
     def _validate_file_readable(self) -> None:
-        """ファイルが開けるか確認"""
+        """ファイルが存在するか確認 (アクセス権は読み込み時に確認する)"""
         if not self.file_path.exists():
             raise FileNotFoundError(f"指定されたパスにファイルが存在しません: {self.file_path}")
         if not self.file_path.is_file():
             raise IsADirectoryError(f"指定されたパスがディレクトリです: {self.file_path}")
 
-        # ファイルオープンチェック
-        try:
-            with self.file_path.open("r", encoding="utf-8"):
-                pass
-        except (PermissionError, OSError) as e:
-            raise PermissionError(f"ファイルにアクセスできません: {self.file_path}") from e
-
     def _validate_extension(self) -> None:
         """許可された拡張子か確認"""
         actual_extension = self.file_path.suffix.lower()
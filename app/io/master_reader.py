@@ -0,0 +1,27 @@
+from pathlib import Path
+from typing import override
+
+from app.io.file_reader import BaseFileReader
+
+# 材料マスタの文字コード (機種依存文字を含むため cp932 で読み込む)
+MASTER_ENCODING = "cp932"
+
+
+class MasterFileReader(BaseFileReader):
+    """材料マスタ (固定長テキストファイル) を行リストに読み込むクラス"""
+
+    def __init__(self, master_path: str | Path):
+        super().__init__(master_path)
+
+    def load(self) -> list[str]:
+        """材料マスタを読み込み、行リストとして返す"""
+        text = self.read_text((MASTER_ENCODING,))
+        lines = text.splitlines()
+        if not lines:
+            raise ValueError(f"材料マスタが空です: {self.file_path}")
+        return lines
+
+    @property
+    @override
+    def supported_extensions(self) -> list[str]:
+        return [".txt"]
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import mmap
+import struct
+from collections.abc import Iterator
+from pathlib import Path
+from typing import NamedTuple, override
+
+from app.io.file_reader import BaseFileReader
+from app.io.master_reader import MASTER_ENCODING
+
+SUPPORTED_VERSIONS = (2,)
+
+# バイナリ形式 (リトルエンディアン)
+HEADER = struct.Struct("<6i")  # バージョン, 予約, :MARK数, :QULT数, :USER数, :PRIMER数
+SECTION_COUNT = struct.Struct("<h")  # セクションのレコード数
+RECORD_PREFIX = struct.Struct("<2i")  # 各レコード先頭のフラグ
+MARK_FIELDS = struct.Struct("<15i")  # :MARK の数値フィールド
+TABLE_COUNT = struct.Struct("<ih")  # :TABLE の行数 (int32, int16 の2箇所に同じ値が格納される)
+TABLE_ROW = struct.Struct("<6i2d")  # フラグ×2, 寸法1~4, 単位重量, 第2値
+QULT_FIELDS = struct.Struct("<d10i")  # 比重, 数値フィールド
+
+# 寸法は 1/100 単位の整数で格納される
+DIMENSION_SCALE = 100
+
+
+class MazMarkRecord(NamedTuple):
+    """:MARK レコード (単位重量表の位置を含む)"""
+
+    code: str
+    base_code: str
+    description: str
+    table_offset: int
+    table_count: int
+
+
+class MazMaterialRecord(NamedTuple):
+    """:QULT レコード"""
+
+    name: str
+    specific_gravity: float
+    description: str
+
+
+class MazTableRow(NamedTuple):
+    """:TABLE の1行"""
+
+    dimensions: tuple[float, ...]
+    weight: float
+    coefficient: float
+
+
+class MazFileReader(BaseFileReader):
+    """
+    材料マスタのバイナリファイル (.maz) を読み込むクラス
+
+    ファイルは mmap で開き、レコードは `memoryview` から必要な箇所のみ復号する。
+    `open()` から `close()` までの間、レコードを読み込める
+    """
+
+    def __init__(self, maz_path: str | Path):
+        super().__init__(maz_path)
+        self._mmap: mmap.mmap | None = None
+        self._view: memoryview | None = None
+        self._materials_offset: int | None = None
+
+    def __enter__(self) -> MazFileReader:
+        self.open()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    @property
+    def is_open(self) -> bool:
+        """ファイルを開いている場合 `True` を返す"""
+        return self._view is not None
+
+    def open(self) -> None:
+        """ファイルを読み取り専用で mmap する"""
+        if self.is_open:
+            return
+        with self.file_path.open("rb") as maz_file:
+            try:
+                self._mmap = mmap.mmap(maz_file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as e:
+                raise ValueError(f"材料マスタが空です: {self.file_path}") from e
+        self._view = memoryview(self._mmap)
+
+    def close(self) -> None:
+        """mmap を解放する"""
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def load(self) -> list[MazMarkRecord]:
+        """:MARK レコードの一覧を返す (単位重量表は位置のみ記録し、読み飛ばす)"""
+        view = self._get_view()
+        try:
+            header = HEADER.unpack_from(view, 0)
+            if header[0] not in SUPPORTED_VERSIONS:
+                raise ValueError(f"未対応のバージョンです: {header[0]}")
+
+            count, offset = self._read_section_count(view, HEADER.size)
+            records: list[MazMarkRecord] = []
+            for _ in range(count):
+                offset += RECORD_PREFIX.size
+                code, offset = self._read_string(view, offset)
+                base_code, offset = self._read_string(view, offset)
+                offset += MARK_FIELDS.size
+                description, offset = self._read_string(view, offset)
+                table_count = TABLE_COUNT.unpack_from(view, offset)[1]
+                offset += TABLE_COUNT.size
+                records.append(MazMarkRecord(code, base_code, description, offset, table_count))
+                offset += TABLE_ROW.size * table_count
+        except (struct.error, IndexError) as e:
+            raise ValueError(f"不正なファイル形式です: {self.file_path}") from e
+
+        self._materials_offset = offset
+        return records
+
+    def load_materials(self) -> list[MazMaterialRecord]:
+        """:QULT レコードの一覧を返す"""
+        if self._materials_offset is None:
+            self.load()
+        view = self._get_view()
+        offset = self._materials_offset
+        try:
+            count, offset = self._read_section_count(view, offset)
+            records: list[MazMaterialRecord] = []
+            for _ in range(count):
+                offset += RECORD_PREFIX.size
+                name, offset = self._read_string(view, offset)
+                specific_gravity = QULT_FIELDS.unpack_from(view, offset)[0]
+                offset += QULT_FIELDS.size
+                description, offset = self._read_string(view, offset)
+                records.append(MazMaterialRecord(name, specific_gravity, description))
+        except (struct.error, IndexError) as e:
+            raise ValueError(f"不正なファイル形式です: {self.file_path}") from e
+        return records
+
+    def iter_table_rows(self, record: MazMarkRecord) -> Iterator[MazTableRow]:
+        """:MARK レコードに続く単位重量表の行を順に返す"""
+        view = self._get_view()
+        end = record.table_offset + TABLE_ROW.size * record.table_count
+        if end > len(view):
+            raise ValueError(f"不正なファイル形式です: {self.file_path}")
+        for row in TABLE_ROW.iter_unpack(view[record.table_offset : end]):
+            dimensions = tuple(value / DIMENSION_SCALE for value in row[2:6])
+            yield MazTableRow(dimensions, row[6], row[7])
+
+    @property
+    @override
+    def supported_extensions(self) -> list[str]:
+        return [".maz"]
+
+    def _get_view(self) -> memoryview:
+        """mmap した領域の memoryview を返す"""
+        if self._view is None:
+            raise ValueError(f"ファイルが開かれていません: {self.file_path}")
+        return self._view
+
+    def _read_section_count(self, view: memoryview, offset: int) -> tuple[int, int]:
+        """セクションのレコード数と、次のレコードの位置を返す"""
+        return SECTION_COUNT.unpack_from(view, offset)[0], offset + SECTION_COUNT.size
+
+    def _read_string(self, view: memoryview, offset: int) -> tuple[str, int]:
+        """長さ (1バイト) を先頭に持つ文字列と、次のフィールドの位置を返す"""
+        length = view[offset]
+        start = offset + 1
+        end = start + length
+        if end > len(view):
+            raise IndexError(offset)
+        return str(view[start:end], MASTER_ENCODING), end
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Iterator
+from itertools import chain
+from operator import itemgetter
+from typing import NamedTuple
+
+from app.io.csv_reader import CSVReader
+from app.models.summary_matrix import parse_number
+
+# 重量計算書の列構成
+# 先頭の列に続いて階層毎に (番号, 名称) の2列が並び、その後にブロック名から区分までの固定の列が続く
+LEADING_COL_COUNT = 1
+FIXED_COL_COUNT = 14
+# 固定の列の先頭 (ブロック名) からの位置
+SHAPE_OFFSET = 1
+DIMENSION_OFFSETS = (2, 3, 4, 5)
+LENGTH_OFFSET = 6
+COUNT_OFFSET = 7
+WEIGHT_OFFSET = 8  # 員数を乗じた重量
+MATERIAL_OFFSET = 9
+CATEGORY_OFFSET = 13  # 大型, 小型, 購入
+
+Number = int | float
+
+
+class PartsLayout(NamedTuple):
+    """重量計算書の列番号 (階層数から求める)"""
+
+    level_count: int
+
+    @staticmethod
+    def from_col_count(col_count: int) -> PartsLayout:
+        """列数から階層数を判定する (判定できない場合はエラー)"""
+        level_count, remainder = divmod(col_count - LEADING_COL_COUNT - FIXED_COL_COUNT, 2)
+        if level_count < 1:
+            raise ValueError(f"列数が不足しています ({col_count}列)")
+        if remainder:
+            raise ValueError(f"列数から階層数を判定できません ({col_count}列)")
+        return PartsLayout(level_count)
+
+    @property
+    def col_count(self) -> int:
+        """列数"""
+        return LEADING_COL_COUNT + 2 * self.level_count + FIXED_COL_COUNT
+
+    @property
+    def level_name_indices(self) -> tuple[int, ...]:
+        """#1~#nレベル名の列番号"""
+        return tuple(range(LEADING_COL_COUNT + 1, self._fixed_start, 2))
+
+    @property
+    def count_index(self) -> int:
+        """員数の列番号"""
+        return self._fixed_start + COUNT_OFFSET
+
+    @property
+    def weight_index(self) -> int:
+        """重量の列番号"""
+        return self._fixed_start + WEIGHT_OFFSET
+
+    @property
+    def key_indices(self) -> tuple[int, ...]:
+        """集計キーに使用する列番号 (`PartsKey.from_cells` の引数の順序)"""
+        start = self._fixed_start
+        return (
+            *self.level_name_indices,
+            start + CATEGORY_OFFSET,
+            start + MATERIAL_OFFSET,
+            start + SHAPE_OFFSET,
+            *(start + offset for offset in DIMENSION_OFFSETS),
+            start + LENGTH_OFFSET,
+        )
+
+    @property
+    def _fixed_start(self) -> int:
+        """固定の列の先頭 (ブロック名) の列番号"""
+        return LEADING_COL_COUNT + 2 * self.level_count
+
+
+class PartsKey(NamedTuple):
+    """材片行の集計キー"""
+
+    path: tuple[str, ...]  # 階層名 (#1~#nレベル名)
+    category: str
+    material: str
+    shape: str
+    dimensions: tuple[str, ...]  # 寸法1~4 (文字列のまま保持する)
+    length: str
+
+    @staticmethod
+    def from_cells(cells: tuple[str, ...], level_count: int) -> PartsKey:
+        """`PartsLayout.key_indices` の順に並んだセルから集計キーを生成する"""
+        cells = tuple(cell.strip() for cell in cells)
+        path = tuple(name for name in cells[:level_count] if name)
+        category, material, shape = cells[level_count : level_count + 3]
+        dimensions = cells[level_count + 3 : level_count + 7]
+        return PartsKey(path, category, material, shape, dimensions, cells[level_count + 7])
+
+
+class PartsRow(NamedTuple):
+    """重量計算書の材片行"""
+
+    key: PartsKey
+    count: str
+    weight: Number
+
+
+class PartsListReader(CSVReader):
+    """
+    重量計算書 (材片リスト) CSVファイルを読み込むクラス
+
+    階層数は最初の行の列数から判定し、列数が異なる行はエラーとする
+    """
+
+    def iter_parts(self) -> Iterator[PartsRow]:
+        """材片行を1行ずつ返す"""
+        layout, rows = self._iter_layout_rows()
+        for line_no, row in rows:
+            self._validate_col_count(row, layout, line_no)
+            key = PartsKey.from_cells(itemgetter(*layout.key_indices)(row), layout.level_count)
+            yield PartsRow(key, row[layout.count_index].strip(), self._parse_weight(row, layout, line_no))
+
+    def sum_weights(self) -> dict[PartsKey, Number]:
+        """
+        集計キー毎に重量を合計する
+
+        加工前のセルをキーとして集計し、空白の削除はキーの種類数だけ行う
+        """
+        raw_sums: defaultdict[tuple[str, ...], Number] = defaultdict(int)
+        layout, rows = self._iter_layout_rows()
+        col_count, weight_index = layout.col_count, layout.weight_index
+        get_key = itemgetter(*layout.key_indices)
+        # 行毎の処理は列数の確認、集計キーの取得と重量の加算のみとする
+        for line_no, row in rows:
+            if len(row) != col_count:
+                self._validate_col_count(row, layout, line_no)
+            try:
+                weight = int(row[weight_index])
+            except ValueError:
+                weight = self._parse_weight(row, layout, line_no)
+            raw_sums[get_key(row)] += weight
+
+        sums: defaultdict[PartsKey, Number] = defaultdict(int)
+        for key_cells, weight in raw_sums.items():
+            sums[PartsKey.from_cells(key_cells, layout.level_count)] += weight
+        return dict(sums)
+
+    def _iter_csv_rows(self) -> Iterator[tuple[int, list[str]]]:
+        """空行を除いたCSV行を行番号とともに返す"""
+        for line_no, row in enumerate(self.iter_raw_rows(), start=1):
+            if row:
+                yield line_no, row
+
+    def _iter_layout_rows(self) -> tuple[PartsLayout, Iterator[tuple[int, list[str]]]]:
+        """最初の行の列数から判定した列構成と、空行を除いたCSV行のイテレータを返す"""
+        rows = self._iter_csv_rows()
+        first = next(rows, None)
+        if first is None:
+            raise ValueError(f"CSVファイルが空です: {self.csv_path.name}")
+        line_no, row = first
+        try:
+            layout = PartsLayout.from_col_count(len(row))
+        except ValueError as e:
+            raise ValueError(f"{e}: {self.csv_path.name} ({line_no}行目)") from None
+        return layout, chain([first], rows)
+
+    def _validate_col_count(self, row: list[str], layout: PartsLayout, line_no: int) -> None:
+        """列数が最初の行と一致するか確認する"""
+        if len(row) != layout.col_count:
+            raise ValueError(
+                f"列数が一致しません ({len(row)}列, {layout.level_count}階層: {layout.col_count}列): "
+                f"{self.csv_path.name} ({line_no}行目)"
+            )
+
+    def _parse_weight(self, row: list[str], layout: PartsLayout, line_no: int) -> Number:
+        """重量セルを数値に変換する"""
+        cell = row[layout.weight_index]
+        try:
+            return int(cell)
+        except ValueError:
+            pass
+        number = parse_number(cell.strip())
+        if number is None:
+            raise ValueError(f"重量が数値ではありません: {cell!r} | {self.csv_path.name} ({line_no}行目)")
+        return number
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from pathlib import Path
+
+from openpyxl import Workbook
+from openpyxl.utils import get_column_letter
+
+from app.models.summary_matrix import parse_number
+from app.models.summary_sheet import SummarySheet
+
+XLSXCell = str | int | float | None
+
+# 材片種別の列の列幅 (列名毎, 未登録の列は既定の列幅)
+KEY_COL_WIDTHS = {"材質": 12, "形状": 8, "寸法": 20, "塗装名称": 20, "区分": 8}
+DEFAULT_KEY_COL_WIDTH = 12
+
+
+def write_xlsx(summary_sheet: SummarySheet, output_path: Path) -> None:
+    """
+    総括表の全レベルをワークシート毎に Excel ファイルへ書き込む
+
+    書き込み専用モードで1行ずつ出力するため、列数が多い場合もメモリ使用量は増加しない
+    """
+    workbook = Workbook(write_only=True)
+    # ヘッダー列 (総括表の種類により列数が異なる) を固定する
+    key_col_count = len(summary_sheet.schema.key_cols)
+    freeze_panes = f"{get_column_letter(key_col_count + 1)}2"
+    key_col_widths = [KEY_COL_WIDTHS.get(name, DEFAULT_KEY_COL_WIDTH) for name in summary_sheet.schema.key_cols]
+    for level in sorted(summary_sheet.cols_by_level):
+        worksheet = workbook.create_sheet(title=level_sheet_title(level))
+        worksheet.freeze_panes = freeze_panes
+        for i, width in enumerate(key_col_widths):
+            worksheet.column_dimensions[get_column_letter(i + 1)].width = width
+        for row in _iter_level_rows(summary_sheet, level):
+            worksheet.append(row)
+    workbook.save(output_path)
+
+
+def level_sheet_title(level: int) -> str:
+    """レベル別ワークシート名を返す (例: #3レベル名)"""
+    return f"#{level}レベル名"
+
+
+def xlsx_filename(input_file_stem: str) -> str:
+    """Excelファイルの保存ファイル名を返す (例: 鋼材重量総括表.xlsx)"""
+    return f"{input_file_stem}.xlsx"
+
+
+def _iter_level_rows(summary_sheet: SummarySheet, level: int) -> Iterator[list[XLSXCell]]:
+    """指定レベルの総括表を1行ずつ返す (数値として解釈できるセルは数値に変換する)"""
+    csv_rows = summary_sheet.iter_csv_rows(level)
+    key_col_count = len(summary_sheet.schema.key_cols)
+
+    # ヘッダー行
+    yield list(next(csv_rows))
+
+    # 材片種別毎の行
+    for csv_row in csv_rows:
+        yield [*(value or None for value in csv_row[:key_col_count]), *map(_to_cell, csv_row[key_col_count:])]
+
+
+def _to_cell(text: str) -> XLSXCell:
+    """セルの文字列を数値に変換する (数値でない場合は文字列のまま、空文字は空セルとする)"""
+    if not text:
+        return None
+    number = parse_number(text)
+    return number if number is not None else text
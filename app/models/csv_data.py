@@ -6,14 +6,17 @@ from pathlib import Path
 from typing import Final
 
 from app.io.csv_reader import CSVColumn, CSVReader, CSVRow
+from app.profiling import timed
 
 
 class CSVData(Sequence[CSVRow]):
     """CSVデータを格納するクラス"""
 
     def __init__(self, rows: list[CSVRow], csv_path: Path | None = None):
-        self.cols: Final = self._rows_to_cols(rows)
-        self.rows: Final = self._cols_to_rows(self.cols)
+        with timed("transpose", rows=len(rows)) as counts:
+            self.cols: Final = self._rows_to_cols(rows)
+            self.rows: Final = self._cols_to_rows(self.cols)
+            counts["cols"] = len(self.cols)
         self._csv_path = Path(csv_path) if csv_path is not None else None
 
     @property
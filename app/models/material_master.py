@@ -0,0 +1,292 @@
+from __future__ import annotations
+
+import logging
+import math
+from array import array
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from functools import partial
+from pathlib import Path
+from typing import Final, NamedTuple
+
+from app.io.master_reader import MasterFileReader
+from app.io.maz_reader import MazFileReader, MazMarkRecord
+
+# 寸法の最大数 (寸法1~4)
+DIMENSION_COUNT = 4
+
+# :TABLE レコードの固定長フィールド (文字位置)
+TABLE_CODE_SLICE = slice(10, 15)
+TABLE_DIMENSION_SLICES = tuple(slice(15 + 5 * i, 20 + 5 * i) for i in range(DIMENSION_COUNT))
+TABLE_WEIGHT_SLICE = slice(35, 45)
+TABLE_COEFFICIENT_SLICE = slice(45, 55)
+
+# :QULT レコードの固定長フィールド (文字位置)
+QULT_NAME_SLICE = slice(10, 28)
+QULT_FIELDS_SLICE = slice(28, 60)
+QULT_DESCRIPTION_SLICE = slice(60, None)
+
+# :MARK レコードの固定長フィールド (文字位置)
+MARK_CODE_SLICE = slice(10, 14)
+MARK_BASE_CODE_SLICE = slice(14, 18)
+
+logger = logging.getLogger(__name__)
+
+Dimensions = tuple[float, ...]
+# 単位重量表の行を読み込む関数 (初回参照時に呼び出す)
+TableLoader = Callable[[], Iterable["UnitWeight"]]
+
+
+class ShapeMark(NamedTuple):
+    """形状定義 (:MARK)"""
+
+    code: str
+    base_code: str  # 単位重量表を共有する形状コード (例: BN2 → BN)
+    description: str
+
+
+class Material(NamedTuple):
+    """材質定義 (:QULT)"""
+
+    name: str
+    specific_gravity: float
+    description: str
+
+
+class UnitWeight(NamedTuple):
+    """単位重量 (:TABLE)"""
+
+    dimensions: Dimensions
+    weight: float | None  # 単位重量 (未定義の場合は None)
+    coefficient: float | None  # 第2値 (形状により意味が異なる)
+
+
+class UnitWeightTable:
+    """
+    形状コード毎の単位重量表
+
+    寸法の昇順に並べた配列で保持し、寸法による検索は二分探索で行う
+    """
+
+    def __init__(self, code: str, rows: Iterable[UnitWeight]):
+        self.code: Final = code
+        self._keys: list[Dimensions] = []
+        self._weights = array("d")
+        self._coefficients = array("d")
+
+        # 同一寸法が複数存在する場合は先頭の行を優先する
+        for row in sorted(rows, key=lambda row: row.dimensions):
+            if self._keys and self._keys[-1] == row.dimensions:
+                continue
+            self._keys.append(row.dimensions)
+            self._weights.append(_to_float(row.weight))
+            self._coefficients.append(_to_float(row.coefficient))
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __iter__(self) -> Iterator[UnitWeight]:
+        for i in range(len(self._keys)):
+            yield self._row(i)
+
+    def __repr__(self) -> str:
+        return f"UnitWeightTable(code={self.code!r}, rows={len(self)})"
+
+    def find(self, *dimensions: float) -> UnitWeight | None:
+        """寸法に一致する単位重量を返す (存在しない場合は `None` を返す)"""
+        key = normalize_dimensions(dimensions)
+        i = bisect_left(self._keys, key)
+        if i < len(self._keys) and self._keys[i] == key:
+            return self._row(i)
+        return None
+
+    def weight(self, *dimensions: float) -> float:
+        """寸法に一致する単位重量を返す (存在しない場合は `KeyError` を送出する)"""
+        row = self.find(*dimensions)
+        if row is None or row.weight is None:
+            raise KeyError(f"単位重量が存在しません: {self.code} {format_dimensions(dimensions)}")
+        return row.weight
+
+    def _row(self, i: int) -> UnitWeight:
+        """i 番目の単位重量を返す"""
+        return UnitWeight(self._keys[i], _to_optional(self._weights[i]), _to_optional(self._coefficients[i]))
+
+
+class MaterialMaster:
+    """
+    材料マスタクラス (形状定義・材質定義・単位重量表)
+
+    単位重量表は形状コード毎に読み込み関数を保持しておき、初回参照時に解析する
+    """
+
+    def __init__(
+        self, marks: Iterable[ShapeMark], materials: Iterable[Material], table_loaders: Mapping[str, TableLoader]
+    ):
+        self.marks: Final = {mark.code: mark for mark in marks}
+        self.materials: Final = {material.name: material for material in materials}
+        self._table_loaders: Final = dict(table_loaders)
+        self._tables: dict[str, UnitWeightTable] = {}
+
+    def __repr__(self) -> str:
+        return (
+            f"MaterialMaster(marks={len(self.marks)}, materials={len(self.materials)}, "
+            f"tables={len(self._table_loaders)})"
+        )
+
+    @staticmethod
+    def load_from_file(master_path: str | Path) -> MaterialMaster:
+        """材料マスタファイル (テキスト形式 .txt またはバイナリ形式 .maz) からインスタンスを生成する"""
+        if Path(master_path).suffix.lower() == ".maz":
+            return MaterialMaster.load_from_maz(master_path)
+        return MaterialMaster.from_lines(MasterFileReader(master_path).load())
+
+    @staticmethod
+    def load_from_maz(maz_path: str | Path) -> MaterialMaster:
+        """
+        材料マスタのバイナリファイル (.maz) からインスタンスを生成する
+
+        ファイルは mmap したまま保持し、単位重量表は初回参照時に該当箇所のみ読み込む。
+        バイナリ形式では空欄と 0 を区別できないため、単位重量と第2値の 0 は未定義 (`None`) として扱う
+        """
+        reader = MazFileReader(maz_path)
+        reader.open()
+        records = reader.load()
+        marks = [ShapeMark(record.code, record.base_code, record.description) for record in records]
+        materials = [Material(*record) for record in reader.load_materials()]
+        table_loaders = {
+            record.code: partial(_read_maz_table_rows, reader, record) for record in records if record.table_count
+        }
+        return MaterialMaster(marks, materials, table_loaders)
+
+    @staticmethod
+    def from_lines(lines: Iterable[str]) -> MaterialMaster:
+        """
+        材料マスタの行リストからインスタンスを生成する
+
+        :MARK, :QULT, :TABLE 以外のレコード (:WELD, :PRIMER, :USER 等) は未対応のため読み飛ばし、
+        種類毎の件数をログに出力する (部材データなど `:` で始まらない行は数えない)
+        """
+        marks: list[ShapeMark] = []
+        materials: list[Material] = []
+        table_lines: defaultdict[str, list[tuple[int, str]]] = defaultdict(list)
+        skipped_counts: Counter[str] = Counter()
+
+        for line_no, line in enumerate(lines, start=1):
+            try:
+                if line.startswith(":TABLE"):
+                    table_lines[line[TABLE_CODE_SLICE].strip()].append((line_no, line))
+                elif line.startswith(":MARK"):
+                    marks.append(_parse_mark_line(line))
+                elif line.startswith(":QULT"):
+                    materials.append(_parse_material_line(line))
+                elif line.startswith(":"):
+                    skipped_counts[line.split(maxsplit=1)[0]] += 1
+            except (ValueError, IndexError) as e:
+                raise ValueError(f"材料マスタの読み込みに失敗しました ({line_no}行目): {line!r}") from e
+
+        if skipped_counts:
+            counts = ", ".join(f"{kind} {count}件" for kind, count in skipped_counts.items())
+            logger.info("材料マスタの未対応のレコードを読み飛ばしました: %s", counts)
+
+        table_loaders = {code: partial(_parse_table_lines, lines) for code, lines in table_lines.items()}
+        return MaterialMaster(marks, materials, table_loaders)
+
+    @property
+    def shape_order(self) -> tuple[str, ...]:
+        """形状コードの定義順"""
+        return tuple(self.marks)
+
+    @property
+    def material_order(self) -> tuple[str, ...]:
+        """材質の定義順"""
+        return tuple(self.materials)
+
+    @property
+    def table_codes(self) -> tuple[str, ...]:
+        """単位重量表が存在する形状コード一覧"""
+        return tuple(self._table_loaders)
+
+    def table(self, code: str) -> UnitWeightTable:
+        """形状コードの単位重量表を返す"""
+        table = self._tables.get(code)
+        if table is None:
+            loader = self._table_loaders.get(code)
+            if loader is None:
+                raise KeyError(f"単位重量表が存在しません: {code}")
+            table = self._tables[code] = UnitWeightTable(code, loader())
+        return table
+
+    def unit_weight(self, code: str, *dimensions: float) -> float:
+        """形状コードと寸法から単位重量を返す (例: `unit_weight("HTB", 22, 65)`)"""
+        return self.table(code).weight(*dimensions)
+
+
+def normalize_dimensions(dimensions: Iterable[float]) -> Dimensions:
+    """寸法を `DIMENSION_COUNT` 個の float に揃える (不足分は 0 とする)"""
+    values = [float(value) for value in dimensions]
+    if len(values) > DIMENSION_COUNT:
+        raise ValueError(f"寸法は{DIMENSION_COUNT}個以下で指定してください: {values}")
+    return tuple(values + [0.0] * (DIMENSION_COUNT - len(values)))
+
+
+def format_dimensions(dimensions: Iterable[float]) -> str:
+    """寸法を `22 x 65` の形式の文字列で返す"""
+    return " x ".join(f"{value:g}" for value in dimensions)
+
+
+def _read_maz_table_rows(reader: MazFileReader, record: MazMarkRecord) -> Iterator[UnitWeight]:
+    """バイナリ形式の単位重量表を順に読み込む (0 は未定義として扱う)"""
+    for row in reader.iter_table_rows(record):
+        yield UnitWeight(row.dimensions, row.weight or None, row.coefficient or None)
+
+
+def _parse_table_lines(lines: Iterable[tuple[int, str]]) -> Iterator[UnitWeight]:
+    """:TABLE レコードを順に解析する"""
+    for line_no, line in lines:
+        try:
+            yield _parse_table_line(line)
+        except ValueError as e:
+            raise ValueError(f"材料マスタの読み込みに失敗しました ({line_no}行目): {line!r}") from e
+
+
+def _parse_table_line(line: str) -> UnitWeight:
+    """:TABLE レコードを解析する"""
+    dimensions = normalize_dimensions(_parse_float(line[s]) or 0.0 for s in TABLE_DIMENSION_SLICES)
+    weight = _parse_float(line[TABLE_WEIGHT_SLICE])
+    coefficient = _parse_float(line[TABLE_COEFFICIENT_SLICE])
+    return UnitWeight(dimensions, weight, coefficient)
+
+
+def _parse_mark_line(line: str) -> ShapeMark:
+    """:MARK レコードを解析する"""
+    code = line[MARK_CODE_SLICE].strip()
+    base_code = line[MARK_BASE_CODE_SLICE].strip() or code
+    # 説明は末尾の2文字以上の空白以降 (説明内に1文字の空白を含む場合がある)
+    description = line.rsplit("  ", 1)[-1].strip()
+    return ShapeMark(code, base_code, description)
+
+
+def _parse_material_line(line: str) -> Material:
+    """:QULT レコードを解析する"""
+    name = line[QULT_NAME_SLICE].strip()
+    # 2番目のフィールドが比重
+    specific_gravity = float(line[QULT_FIELDS_SLICE].split()[1])
+    description = line[QULT_DESCRIPTION_SLICE].strip()
+    return Material(name, specific_gravity, description)
+
+
+def _parse_float(text: str) -> float | None:
+    """固定長フィールドを float に変換する (空欄の場合は `None` を返す)"""
+    text = text.strip()
+    return float(text) if text else None
+
+
+def _to_float(value: float | None) -> float:
+    """配列に格納するため、`None` を NaN に変換する"""
+    return math.nan if value is None else value
+
+
+def _to_optional(value: float) -> float | None:
+    """配列の NaN を `None` に戻す"""
+    return None if math.isnan(value) else value
@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from pathlib import Path
+
+from app.io.csv_reader import CSVRow
+from app.io.parts_reader import PartsKey, PartsListReader, PartsRow
+from app.models.summary_matrix import Number, format_number, parse_number
+from app.models.summary_schema import STEEL_KEY_COLS, STEEL_WEIGHT_SCHEMA, TOTAL_COL_NAME
+from app.models.summary_sheet import SummarySheet
+
+# 集計区分 (重量計算書の区分が "購入" の材片は購入部品、それ以外は加工鋼重とする)
+FABRICATED = "加工鋼重"
+PURCHASED = "購入部品"
+SECTIONS = (FABRICATED, PURCHASED)
+PURCHASED_CATEGORIES = frozenset({"購入"})
+
+SUBTOTAL_LABEL = "小計"
+SECTION_TOTAL_LABELS = {FABRICATED: "加工鋼重中計", PURCHASED: "購入部品中計"}
+GRAND_TOTAL_LABEL = "合計"
+
+# 寸法を呼び径と長さで表す形状 (ボルト類)
+BOLT_SHAPES = frozenset({"TCB", "HTB", "BN"})
+
+# 材片種別の集計キー (区分, 材質, 形状, 寸法)
+ItemKey = tuple[str, str, str, str]
+
+
+class SummaryAggregator:
+    """
+    重量計算書の材片行を集計し、総括表を生成するクラス
+
+    材片行は階層と材片種別をキーとする辞書で1回だけ集計し、上位階層へは集計結果を積み上げる
+    """
+
+    def __init__(
+        self,
+        root_name: str,
+        material_order: Sequence[str] | None = None,
+        shape_order: Sequence[str] | None = None,
+    ):
+        self.root_name = root_name
+        self._material_order = {name: i for i, name in enumerate(material_order or ())}
+        self._shape_order = {name: i for i, name in enumerate(shape_order or ())}
+        self._parts_sums: defaultdict[PartsKey, Number] = defaultdict(int)
+
+    def add(self, part: PartsRow) -> None:
+        """材片行を集計に追加する"""
+        self._parts_sums[part.key] += part.weight
+
+    def add_all(self, parts: Iterable[PartsRow]) -> None:
+        """複数の材片行を集計に追加する"""
+        for part in parts:
+            self.add(part)
+
+    def add_weights(self, weights: Mapping[PartsKey, Number]) -> None:
+        """集計キー毎の重量 (`PartsListReader.sum_weights` の戻り値) を集計に追加する"""
+        for key, weight in weights.items():
+            self._parts_sums[key] += weight
+
+    def summary_rows(self) -> list[CSVRow]:
+        """総括表CSVと同じ形式の行リスト (小計・中計・合計行を含む) を返す"""
+        node_sums, children, sort_keys = self._build_nodes()
+        sort_key = self._item_sort_key(sort_keys)
+
+        rows: list[CSVRow] = []
+        level = 1
+        frontier: list[tuple[str, ...]] = [()]
+        while frontier:
+            next_frontier: list[tuple[str, ...]] = []
+            for node in frontier:
+                kids = list(children.get(node, ()))
+                if not kids:
+                    continue
+                level_name = node[-1] if node else self.root_name
+                kid_sums = [node_sums[kid] for kid in kids]
+                header = CSVRow([f"#{level}レベル名", *STEEL_KEY_COLS, TOTAL_COL_NAME, *(kid[-1] for kid in kids)])
+                rows.append(header)
+                rows.extend(self._block_rows(level_name, node_sums[node], kid_sums, sort_key))
+                next_frontier.extend(kids)
+            frontier = next_frontier
+            level += 1
+        return rows
+
+    def summary_sheet(self) -> SummarySheet:
+        """集計結果から `SummarySheet` を生成する"""
+        return SummarySheet(self.summary_rows(), schema=STEEL_WEIGHT_SCHEMA)
+
+    def _build_nodes(
+        self,
+    ) -> tuple[
+        dict[tuple[str, ...], defaultdict[ItemKey, Number]],
+        dict[tuple[str, ...], dict[tuple[str, ...], None]],
+        dict[ItemKey, tuple[float, ...]],
+    ]:
+        """材片行の集計結果を階層毎に積み上げる"""
+        node_sums: defaultdict[tuple[str, ...], defaultdict[ItemKey, Number]] = defaultdict(lambda: defaultdict(int))
+        children: defaultdict[tuple[str, ...], dict[tuple[str, ...], None]] = defaultdict(dict)
+        sort_keys: dict[ItemKey, tuple[float, ...]] = {}
+        item_sections: dict[tuple[str, str, str], str] = {}
+        dimension_cache: dict[tuple[str, tuple[str, ...], str], tuple[str, tuple[float, ...]]] = {}
+
+        for (path, category, material, shape, dimensions, length), weight in self._parts_sums.items():
+            cache_key = (shape, dimensions, length)
+            if cache_key not in dimension_cache:
+                dimension_cache[cache_key] = format_dimension(shape, dimensions, length)
+            dimension, numbers = dimension_cache[cache_key]
+
+            section = PURCHASED if category in PURCHASED_CATEGORIES else FABRICATED
+            key = (section, material, shape, dimension)
+            if key not in sort_keys:
+                # 総括表の材片種別 (`SummaryProps`) は区分を持たないため、両方の区分にある材片種別は区別できない
+                if item_sections.setdefault(key[1:], section) != section:
+                    raise ValueError(f"加工鋼重と購入部品の両方にある材片種別です: {material} {shape} {dimension}")
+                sort_keys[key] = numbers
+            # 並び順が指定されていない材質・形状は出現順に後ろへ追加する
+            self._material_order.setdefault(material, len(self._material_order))
+            self._shape_order.setdefault(shape, len(self._shape_order))
+
+            # 上位階層へ積み上げる (出現順に子階層を登録する)
+            for depth in range(len(path) + 1):
+                node = path[:depth]
+                node_sums[node][key] += weight
+                if depth:
+                    children[path[: depth - 1]].setdefault(node, None)
+
+        return node_sums, children, sort_keys
+
+    def _item_sort_key(self, sort_keys: dict[ItemKey, tuple[float, ...]]) -> Callable[[ItemKey], tuple]:
+        """材片種別の並び順 (区分, 材質, 形状, 寸法の降順) を返す関数"""
+
+        def sort_key(key: ItemKey) -> tuple:
+            section, material, shape, _ = key
+            numbers = tuple(-number for number in sort_keys[key])
+            return (SECTIONS.index(section), self._material_order[material], self._shape_order[shape], numbers)
+
+        return sort_key
+
+    def _block_rows(
+        self,
+        level_name: str,
+        sums: dict[ItemKey, Number],
+        kid_sums: list[defaultdict[ItemKey, Number]],
+        sort_key: Callable[[ItemKey], tuple],
+    ) -> list[CSVRow]:
+        """
+        総括表ブロックのデータ行を生成する
+
+        まてりあるの出力に合わせ、小計行は次の材片種別の行で材質が変わる箇所 (区分をまたぐ場合を含む) にだけ追加する
+        同じ形状の行が複数続き、次の行で形状が変わる場合は、その内側に形状毎の小計行 (`材質, 小計`) を追加する
+        """
+        section_keys = {
+            section: sorted((key for key in sums if key[0] == section), key=sort_key) for section in SECTIONS
+        }
+        item_keys = [key for section in SECTIONS for key in section_keys[section]]
+
+        rows: list[CSVRow] = []
+        material_start = shape_start = 0
+        for i, key in enumerate(item_keys):
+            section, material, shape, _ = key
+            rows.append(_value_row([level_name, *key[1:]], [key], sums, kid_sums))
+            next_key = item_keys[i + 1] if i + 1 < len(item_keys) else None
+
+            if next_key is not None and next_key[2] != shape and i > shape_start:
+                shape_keys = item_keys[shape_start : i + 1]
+                rows.append(_value_row([level_name, material, SUBTOTAL_LABEL, ""], shape_keys, sums, kid_sums))
+            if next_key is not None and next_key[1] != material:
+                material_keys = item_keys[material_start : i + 1]
+                rows.append(_value_row([level_name, SUBTOTAL_LABEL, "", ""], material_keys, sums, kid_sums))
+            if next_key is None or next_key[0] != section:
+                label = SECTION_TOTAL_LABELS[section]
+                rows.append(_value_row([level_name, label, "", ""], section_keys[section], sums, kid_sums))
+
+            if next_key is None or next_key[:3] != key[:3]:
+                shape_start = i + 1
+            if next_key is None or next_key[:2] != key[:2]:
+                material_start = i + 1
+
+        rows.append(_value_row([level_name, GRAND_TOTAL_LABEL, "", ""], item_keys, sums, kid_sums))
+        return rows
+
+
+def aggregate_parts_csv(
+    csv_path: str | Path,
+    root_name: str,
+    material_order: Sequence[str] | None = None,
+    shape_order: Sequence[str] | None = None,
+) -> SummarySheet:
+    """重量計算書CSVファイルを集計して `SummarySheet` を生成する"""
+    aggregator = SummaryAggregator(root_name, material_order, shape_order)
+    aggregator.add_weights(PartsListReader(csv_path).sum_weights())
+    return aggregator.summary_sheet()
+
+
+def format_dimension(shape: str, dimensions: Sequence[str], length: str = "") -> tuple[str, tuple[float, ...]]:
+    """
+    形状に応じた寸法の表示文字列と、並び替え用の数値を返す
+
+    例: PL → `19.0`, L → `90 x  90 x 10.0`, CT → `118x176x 8.0x 8.0`, TCB → `M 22 x  65`
+    """
+    values = [float(number) if (number := parse_number(cell)) is not None else 0.0 for cell in dimensions]
+    if shape in BOLT_SHAPES:
+        numbers: tuple[float, ...] = (values[0], float(parse_number(length) or 0))
+        text = f"M{numbers[0]:3.0f} x {numbers[1]:3.0f}"
+    elif shape == "PL":
+        numbers = (values[1],)
+        text = f"{numbers[0]:.1f}"
+    elif shape == "L":
+        numbers = tuple(values[:3])
+        text = f"{numbers[0]:3.0f} x {numbers[1]:3.0f} x {numbers[2]:4.1f}"
+    elif shape == "CT":
+        numbers = tuple(values[:4])
+        text = f"{numbers[0]:.0f}x{numbers[1]:.0f}x{numbers[2]:4.1f}x{numbers[3]:4.1f}"
+    else:
+        numbers = tuple(value for value in values if value)
+        text = "x".join(f"{value:g}" for value in numbers)
+    return text.strip(), numbers
+
+
+def _value_row(
+    label_cells: list[str],
+    keys: Sequence[ItemKey],
+    sums: dict[ItemKey, Number],
+    kid_sums: list[defaultdict[ItemKey, Number]],
+) -> CSVRow:
+    """ヘッダー列と、指定した集計キーの合計列・子階層列を並べた行を生成する"""
+    total = sum(sums[key] for key in keys)
+    values = [sum(kid.get(key, 0) for key in keys) for kid in kid_sums]
+    return CSVRow([*label_cells, format_number(total), *(format_number(value) for value in values)])
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import re
+import sys
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from operator import itemgetter
+from typing import Final, NamedTuple
+
+from app.io.csv_reader import CSVRow
+from app.models.csv_summary_data import is_header_row
+from app.models.summary_schema import STEEL_WEIGHT_SCHEMA, RowKind, SummarySchema, sniff_schema
+
+# ヘッダーセルからレベル番号を抽出する正規表現
+LEVEL_PATTERN = re.compile(r"#(\d+)レベル名")
+
+
+class BlockFingerprint(NamedTuple):
+    """総括表ブロックの指紋 (再読み込み時に変更されたブロックを判定する)"""
+
+    level: int
+    level_name: str
+    header: tuple[str, ...]
+    value_indices: tuple[int, ...]
+    rows_hash: int  # データ行のハッシュ値 (プロセス内でのみ比較する)
+
+    def same_structure(self, other: BlockFingerprint) -> bool:
+        """データ行以外 (階層・列構成) が一致する場合 `True` を返す"""
+        return self[:-1] == other[:-1]
+
+
+class SummaryBlock:
+    """
+    総括表ブロッククラス
+
+    `#nレベル名` のヘッダー行から次のヘッダー行の直前までの行を保持する
+    """
+
+    def __init__(self, header: CSVRow, rows: list[CSVRow], schema: SummarySchema = STEEL_WEIGHT_SCHEMA):
+        self.header: Final = header
+        self.rows: Final = rows
+        self.schema: Final = schema
+        self.layout: Final = schema.layout(header)
+        self.level: Final = self._get_level()
+        self.level_name: Final = self._get_level_name()
+        self.header_indices: Final = self._get_header_indices()
+        self.value_indices: Final = self._get_value_indices()
+
+    def __repr__(self) -> str:
+        return f"SummaryBlock(level={self.level!r}, level_name={self.level_name!r}, rows={len(self.rows)})"
+
+    @property
+    def item_rows(self) -> Iterator[tuple[CSVRow, CSVRow]]:
+        """小計行を除いたデータ行 (ヘッダー列のセルとデータ行の組)"""
+        for row in self.rows:
+            if self.row_kind(row) is RowKind.SUBTOTAL:
+                continue
+            yield self.header_cells(row), row
+
+    @property
+    def fingerprint(self) -> BlockFingerprint:
+        """ブロックの指紋"""
+        rows_hash = hash(tuple(map(tuple, self.rows)))
+        return BlockFingerprint(self.level, self.level_name, tuple(self.header), self.value_indices, rows_hash)
+
+    def shifted(self, offset: int) -> SummaryBlock:
+        """レベルを `offset` だけ下げたブロックを返す (データ行は共有する)"""
+        header = CSVRow([f"#{self.level + offset}レベル名", *self.header[1:]])
+        return SummaryBlock(header, self.rows, self.schema)
+
+    def header_cells(self, row: CSVRow) -> CSVRow:
+        """行からヘッダー列 (#nレベル名, 材質, 形状, 寸法, 合計など) のセルを抽出する"""
+        return CSVRow(row[i] for i in self.header_indices)
+
+    def row_kind(self, row: CSVRow) -> RowKind:
+        """データ行の種別 (小計・中計・合計行など) を返す"""
+        return self.schema.classify([row[i] for i in self.layout.key_indices])
+
+    def _get_level(self) -> int:
+        """ヘッダー行を基にレベル番号を返す"""
+        level_cell = self.header[0]
+        match = LEVEL_PATTERN.search(level_cell)
+        if not match:
+            raise ValueError(f"不正なセル内容: {level_cell}")
+        return int(match.group(1))
+
+    def _get_level_name(self) -> str:
+        """データ行を基にレベル名 (列の上位階層名) を返す"""
+        if not self.rows:
+            raise ValueError(f"データ行が存在しません: {self.header[0]}")
+        return self.rows[0][0]
+
+    def _get_header_indices(self) -> tuple[int, ...]:
+        """ヘッダー列の列番号を返す"""
+        return self.layout.header_indices
+
+    def _get_value_indices(self) -> tuple[int, ...]:
+        """総括表列の列番号を返す (全てのセルが空の列は除外する)"""
+        header_indices = set(self.layout.header_indices)
+        indices: list[int] = []
+        for i, name in enumerate(self.header):
+            if i in header_indices:
+                continue
+            if not name and not any(row[i] for row in self.rows):
+                continue
+            indices.append(i)
+        return tuple(indices)
+
+
+def cells_getter(indices: Sequence[int]) -> Callable[[Sequence[str]], tuple[str, ...]]:
+    """行から指定列のセルをタプルで取り出す関数を返す (`itemgetter` は列が1つの場合に文字列を返すため)"""
+    if len(indices) == 1:
+        index = indices[0]
+        return lambda row: (row[index],)
+    return itemgetter(*indices)
+
+
+def iter_summary_blocks(
+    rows: Iterable[CSVRow], schema: SummarySchema | None = None, name_hint: str = ""
+) -> Iterator[SummaryBlock]:
+    """
+    CSV行を1回だけ走査し、`#nレベル名` のヘッダー行で区切った `SummaryBlock` を順に返す
+
+    ブロックの行は列方向に転置せず、読み込んだ行をそのまま保持する。
+    `schema` を省略した場合は最初のヘッダー行と `name_hint` から総括表の種類を判定する
+    """
+    header: CSVRow | None = None
+    current_rows: list[CSVRow] = []
+    for row in rows:
+        # 空行はスキップ
+        if not any(row):
+            continue
+
+        # 新しいブロックを開始
+        if is_header_row(row):
+            if header is not None:
+                yield SummaryBlock(header, current_rows, schema)
+            elif schema is None:
+                schema = sniff_schema(row, name_hint)
+            # #nレベル名と材片種別の列の終端
+            key_end = len(schema.key_cols) + 1
+            header = row
+            current_rows = []
+            continue
+
+        if header is None:
+            raise ValueError(f"ヘッダー行より前にデータ行が存在します: {row}")
+
+        # ヘッダー行より短い行は空文字列で埋める
+        if len(row) < len(header):
+            row.extend([""] * (len(header) - len(row)))
+        # 階層名と材片種別は行やブロックをまたいで繰り返し現れるため、同じ文字列を共有する
+        row[:key_end] = map(sys.intern, row[:key_end])
+        current_rows.append(row)
+
+    if header is not None and schema is not None:
+        yield SummaryBlock(header, current_rows, schema)
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from pathlib import Path
+from typing import Final, NamedTuple
+
+from app.models.summary_sheet import SummarySheet
+
+DEFAULT_MAX_ENTRIES = 16
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024  # CSVファイルサイズの合計 (256MB)
+PATH_LOCK_STRIPES = 64  # パス毎の読み込み用ロックの数 (パスのハッシュで割り当てる)
+
+logger = logging.getLogger(__name__)
+
+
+class CacheKey(NamedTuple):
+    """キャッシュキー (パス・更新日時・ファイルサイズ)"""
+
+    path: Path
+    mtime_ns: int
+    size: int
+
+    @staticmethod
+    def from_path(csv_path: str | Path) -> CacheKey:
+        """ファイルの stat 情報からキャッシュキーを生成する"""
+        path = Path(csv_path).resolve()
+        stat = path.stat()
+        return CacheKey(path, stat.st_mtime_ns, stat.st_size)
+
+
+class CacheStats(NamedTuple):
+    """キャッシュの統計情報"""
+
+    hits: int
+    misses: int
+    entries: int
+    bytes: int
+
+
+class SummarySheetCache:
+    """
+    `SummarySheet` の LRU キャッシュ
+
+    ファイルの更新日時またはサイズが変わった場合は再読み込みする。
+    エントリ数と CSV ファイルサイズの合計が上限を超えた場合は、最も古く参照されたエントリから破棄する
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[Path, tuple[CacheKey, SummarySheet]] = OrderedDict()
+        self._total_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+        # パス毎の読み込み用ロック (同じファイルの読み込みを同時に1つだけ実行する)
+        # 読み込んだパスの数に依存しないように、固定数のロックをパスのハッシュで共有する
+        self._path_locks: Final = tuple(threading.Lock() for _ in range(PATH_LOCK_STRIPES))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def max_entries(self) -> int:
+        """最大エントリ数"""
+        return self._max_entries
+
+    @property
+    def max_bytes(self) -> int:
+        """CSVファイルサイズ合計の上限 (バイト)"""
+        return self._max_bytes
+
+    def set_budget(self, max_entries: int, max_bytes: int) -> None:
+        """上限を変更し、超過したエントリを破棄する"""
+        with self._lock:
+            self._max_entries = max_entries
+            self._max_bytes = max_bytes
+            self._evict()
+
+    def stats(self) -> CacheStats:
+        """ヒット数・ミス数などの統計情報を返す"""
+        with self._lock:
+            return CacheStats(self._hits, self._misses, len(self._entries), self._total_bytes)
+
+    def clear(self) -> None:
+        """キャッシュを全て破棄し、統計情報をリセットする"""
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+            self._hits = 0
+            self._misses = 0
+
+    def load(
+        self,
+        csv_path: str | Path,
+        loader: Callable[[Path], SummarySheet] = SummarySheet.load_from_csv,
+        reloader: Callable[[SummarySheet], SummarySheet] | None = None,
+    ) -> SummarySheet:
+        """
+        キャッシュから `SummarySheet` を返す
+
+        キャッシュに存在しない場合は `loader` で読み込む。
+        ファイルが更新されている場合は、`reloader` を指定するとキャッシュ済みのインスタンスから再読み込みした
+        新しいインスタンス (変更されていないブロックを引き継ぐ) を、指定しない場合は `loader` で読み込み直す。
+        キャッシュ済みのインスタンスは他のスレッドから参照されているため変更しない。
+        戻り値も他の呼び出し元と共有するため、呼び出し元は `display_level` などの状態を変更せず、
+        レベルは `iter_csv_rows(level)` などの引数で指定すること
+        """
+        key = CacheKey.from_path(csv_path)
+        # 同じファイルを読み込み中の場合は完了を待ち、読み込み結果を再利用する
+        with self._path_lock(key.path):
+            with self._lock:
+                entry = self._entries.get(key.path)
+                if entry is not None and entry[0] == key:
+                    self._entries.move_to_end(key.path)
+                    self._hits += 1
+                    return entry[1]
+                self._misses += 1
+                stale_sheet = entry[1] if entry is not None and reloader is not None else None
+
+            # 読み込み中は全体のロックを保持しない
+            if stale_sheet is not None:
+                summary_sheet = reloader(stale_sheet)
+            else:
+                summary_sheet = loader(Path(csv_path))
+
+            with self._lock:
+                self._store(key, summary_sheet)
+        return summary_sheet
+
+    def _path_lock(self, path: Path) -> threading.Lock:
+        """パス毎の読み込み用ロックを返す (同じロックを共有する別のパスの読み込みとは同時に実行しない)"""
+        return self._path_locks[hash(path) % len(self._path_locks)]
+
+    def _store(self, key: CacheKey, summary_sheet: SummarySheet) -> None:
+        """エントリを追加し、上限を超えたエントリを破棄する"""
+        old_entry = self._entries.pop(key.path, None)
+        if old_entry is not None:
+            self._total_bytes -= old_entry[0].size
+
+        # 単独で上限を超えるファイルはキャッシュしない
+        if key.size > self._max_bytes:
+            return
+
+        self._entries[key.path] = (key, summary_sheet)
+        self._total_bytes += key.size
+        self._evict()
+
+    def _evict(self) -> None:
+        """上限を超えたエントリを古い順に破棄する"""
+        while self._entries and (len(self._entries) > self._max_entries or self._total_bytes > self._max_bytes):
+            path, (key, _) = self._entries.popitem(last=False)
+            self._total_bytes -= key.size
+            logger.debug("キャッシュから破棄しました: %s", path)
+
+
+# アプリケーション全体で共有するキャッシュ
+summary_cache = SummarySheetCache()
@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from enum import Enum
+from typing import TYPE_CHECKING, Final, NamedTuple
+
+from app.io.csv_reader import CSVRow
+from app.models.summary_matrix import Number, format_number, parse_number
+from app.models.summary_schema import TOTAL_COL_NAME
+
+if TYPE_CHECKING:
+    from app.models.summary_sheet import SummaryColumn, SummaryItem, SummaryProps, SummarySheet
+
+
+class DiffKind(Enum):
+    """差分の種類"""
+
+    ADDED = "追加"
+    REMOVED = "削除"
+    CHANGED = "変更"
+
+
+class ColumnDiff(NamedTuple):
+    """追加・削除された総括表列"""
+
+    kind: DiffKind
+    path: str
+    level: int
+
+
+class RowDiff(NamedTuple):
+    """追加・削除された材片種別"""
+
+    kind: DiffKind
+    props: SummaryProps
+
+
+class CellDiff(NamedTuple):
+    """値が変更されたセル"""
+
+    kind: DiffKind
+    path: str  # 総括表列の階層パス (合計列の場合は "合計")
+    props: SummaryProps
+    old_value: str
+    new_value: str
+    delta: Number | None  # 数値の増減 (数値でない場合は `None`)
+
+    @property
+    def delta_text(self) -> str:
+        """増減の表示文字列 (例: `+12`, `-3.5`)"""
+        if self.delta is None:
+            return ""
+        return ("+" if self.delta > 0 else "") + format_number(self.delta)
+
+
+class SummaryDiff:
+    """
+    2つの総括表 (変更前・変更後) の差分クラス
+
+    総括表列は階層パス、材片種別は `SummaryProps` のハッシュで対応付け、全セルを1回だけ比較する。
+    両方に存在する列のみセルを比較し、追加・削除された列は列単位で記録する
+    """
+
+    def __init__(self, old_sheet: SummarySheet, new_sheet: SummarySheet):
+        if old_sheet.schema.key_cols != new_sheet.schema.key_cols:
+            raise ValueError(f"総括表の種類が異なります: {old_sheet.schema.name} | {new_sheet.schema.name}")
+        self.key_cols: Final = new_sheet.schema.key_cols
+        self.columns: Final[list[ColumnDiff]] = []
+        self.rows: Final[list[RowDiff]] = []
+        self.cells: Final[list[CellDiff]] = []
+        # 階層パス毎の変更セル (表示時の参照用)
+        self.cells_by_path: Final[dict[str, dict[SummaryProps, CellDiff]]] = {}
+
+        self._diff_rows(old_sheet, new_sheet)
+        self._diff_columns(old_sheet, new_sheet)
+
+    def __bool__(self) -> bool:
+        """差分が存在する場合 `True` を返す"""
+        return bool(self.columns or self.rows or self.cells)
+
+    def cell(self, path: str, props: SummaryProps) -> CellDiff | None:
+        """階層パスと材片種別に対応する変更セルを返す"""
+        cells = self.cells_by_path.get(path)
+        return cells.get(props) if cells is not None else None
+
+    def summary(self) -> str:
+        """差分の件数を文字列で返す"""
+
+        def count(diffs: list, kind: DiffKind) -> int:
+            return sum(1 for diff in diffs if diff.kind is kind)
+
+        added, removed = DiffKind.ADDED, DiffKind.REMOVED
+        return (
+            f"列: 追加 {count(self.columns, added)} / 削除 {count(self.columns, removed)}, "
+            f"材片種別: 追加 {count(self.rows, added)} / 削除 {count(self.rows, removed)}, "
+            f"セル: {len(self.cells)}"
+        )
+
+    def csv_rows(self) -> list[CSVRow]:
+        """差分をCSV出力用の行リストで返す (列・材片種別・セルの順)"""
+        blank_keys = [""] * len(self.key_cols)
+        rows = [CSVRow(["対象", "種別", "階層パス", *self.key_cols, "変更前", "変更後", "増減"])]
+        for column in self.columns:
+            rows.append(CSVRow(["列", column.kind.value, column.path, *blank_keys, "", "", ""]))
+        for row in self.rows:
+            rows.append(CSVRow(["材片種別", row.kind.value, "", *row.props.values(), "", "", ""]))
+        for cell in self.cells:
+            rows.append(
+                CSVRow(
+                    [
+                        "セル",
+                        cell.kind.value,
+                        cell.path,
+                        *cell.props.values(),
+                        cell.old_value,
+                        cell.new_value,
+                        cell.delta_text,
+                    ]
+                )
+            )
+        return rows
+
+    def _diff_rows(self, old_sheet: SummarySheet, new_sheet: SummarySheet) -> None:
+        """材片種別 (最上位レベルの行) と合計列を比較する"""
+        old_totals = dict(zip(old_sheet.props_group, old_sheet.total_col.data, strict=True))
+        new_totals = dict(zip(new_sheet.props_group, new_sheet.total_col.data, strict=True))
+        self.rows.extend(RowDiff(DiffKind.ADDED, props) for props in new_totals if props not in old_totals)
+        self.rows.extend(RowDiff(DiffKind.REMOVED, props) for props in old_totals if props not in new_totals)
+        self._diff_values(TOTAL_COL_NAME, old_totals, new_totals)
+
+    def _diff_columns(self, old_sheet: SummarySheet, new_sheet: SummarySheet) -> None:
+        """総括表列を階層パスで対応付け、両方に存在する列のセルを比較する"""
+        old_cols = _cols_by_path(old_sheet)
+        new_cols = _cols_by_path(new_sheet)
+        for path, new_col in new_cols.items():
+            old_col = old_cols.get(path)
+            if old_col is None:
+                self.columns.append(ColumnDiff(DiffKind.ADDED, path, new_col.level))
+                continue
+            self._diff_values(path, _item_values(old_col.items), _item_values(new_col.items))
+        self.columns.extend(
+            ColumnDiff(DiffKind.REMOVED, path, old_col.level)
+            for path, old_col in old_cols.items()
+            if path not in new_cols
+        )
+
+    def _diff_values(
+        self, path: str, old_values: Mapping[SummaryProps, str], new_values: Mapping[SummaryProps, str]
+    ) -> None:
+        """1列分のセルを材片種別で対応付けて比較する (存在しないセルは0として増減を求める)"""
+        cells: dict[SummaryProps, CellDiff] = {}
+        for props, new_value in new_values.items():
+            old_value = old_values.get(props)
+            kind = DiffKind.ADDED if old_value is None else DiffKind.CHANGED
+            cell = _compare(kind, path, props, old_value or "", new_value)
+            if cell is not None:
+                cells[props] = cell
+        for props, old_value in old_values.items():
+            if props not in new_values:
+                cell = _compare(DiffKind.REMOVED, path, props, old_value, "")
+                if cell is not None:
+                    cells[props] = cell
+        if cells:
+            self.cells_by_path[path] = cells
+            self.cells.extend(cells.values())
+
+
+def _compare(kind: DiffKind, path: str, props: SummaryProps, old_value: str, new_value: str) -> CellDiff | None:
+    """セルの値を比較し、変更がある場合は `CellDiff` を返す (数値は値で比較する)"""
+    old_number = parse_number(old_value) if old_value else 0
+    new_number = parse_number(new_value) if new_value else 0
+    if old_number is None or new_number is None:
+        if old_value == new_value:
+            return None
+        return CellDiff(kind, path, props, old_value, new_value, None)
+    if old_number == new_number:
+        return None
+    return CellDiff(kind, path, props, old_value, new_value, new_number - old_number)
+
+
+def _cols_by_path(summary_sheet: SummarySheet) -> dict[str, SummaryColumn]:
+    """階層パスをキーとする総括表列の辞書 (同一パスの列が複数存在する場合は先頭の列)"""
+    cols: dict[str, SummaryColumn] = {}
+    for col in summary_sheet.cols:
+        cols.setdefault(col.path, col)
+    return cols
+
+
+def _item_values(items: Mapping[SummaryProps, SummaryItem]) -> dict[SummaryProps, str]:
+    """総括表アイテムの値を材片種別をキーとする辞書で返す"""
+    return {props: item.value for props, item in items.items()}
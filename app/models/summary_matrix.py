@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import math
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Final
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from app.models.summary_sheet import SummaryColumn, SummaryProps
+
+# セルの数値
+Number = int | float
+
+
+class SummaryMatrix:
+    """
+    総括表の数値行列クラス
+
+    行は材片種別 (`SummaryProps`)、列は同一レベルの総括表列 (`SummaryColumn`) に対応する。
+    数値として解釈できないセルおよびアイテムが存在しないセルは欠損値として `mask` に記録する
+    """
+
+    def __init__(self, props_group: Sequence[SummaryProps], columns: Sequence[SummaryColumn]):
+        self.columns: Final = tuple(columns)
+        self.row_index: Final = self._build_row_index(props_group)
+        self.col_index: Final = {col: j for j, col in enumerate(self.columns)}
+        self.props_group: Final = tuple(self.row_index)
+        self.values, self.mask = self._build_values()
+
+    def __repr__(self) -> str:
+        rows, cols = self.shape
+        return f"SummaryMatrix(shape=({rows}, {cols}), dtype={self.values.dtype})"
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """行列の形状 (材片種別数, 総括表列数)"""
+        return self.values.shape
+
+    def row_sums(self) -> np.ndarray:
+        """材片種別毎の合計 (欠損値は0として扱う)"""
+        return self.values.sum(axis=1)
+
+    def col_sums(self, rows: np.ndarray | None = None) -> np.ndarray:
+        """
+        総括表列毎の合計 (欠損値は0として扱う)
+
+        `rows` に行のインデックスまたは真偽値配列を指定した場合は該当する行のみを合計する
+        """
+        values = self.values if rows is None else self.values[rows]
+        return values.sum(axis=0)
+
+    def rollup(self, parents: Sequence[SummaryColumn]) -> np.ndarray:
+        """
+        総括表列を親階層の列毎に合計した行列を返す
+
+        戻り値の行は `props_group`、列は `parents` に対応する
+        """
+        parent_index = {parent: j for j, parent in enumerate(parents)}
+        group = np.array([parent_index[col.parent] for col in self.columns], dtype=np.intp)
+        result = np.zeros((self.shape[0], len(parents)), dtype=self.values.dtype)
+        np.add.at(result.T, group, self.values.T)
+        return result
+
+    def _build_row_index(self, props_group: Sequence[SummaryProps]) -> dict[SummaryProps, int]:
+        """材片種別から行番号への辞書を生成する"""
+        row_index: dict[SummaryProps, int] = {props: i for i, props in enumerate(props_group)}
+        # 上位レベルに存在しない材片種別は末尾に追加する
+        for col in self.columns:
+            for props in col.items:
+                row_index.setdefault(props, len(row_index))
+        return row_index
+
+    def _build_values(self) -> tuple[np.ndarray, np.ndarray]:
+        """総括表アイテムの値を数値に変換した行列と欠損値マスクを生成する"""
+        shape = (len(self.row_index), len(self.columns))
+        numbers: list[int | float] = []
+        positions: list[int] = []
+        is_float = False
+        for j, col in enumerate(self.columns):
+            for props, item in col.items.items():
+                number = parse_number(item.value)
+                if number is None:
+                    continue
+                if isinstance(number, float):
+                    is_float = True
+                numbers.append(number)
+                positions.append(self.row_index[props] * shape[1] + j)
+
+        dtype = np.float64 if is_float else np.int64
+        values = np.zeros(shape, dtype=dtype)
+        mask = np.ones(shape, dtype=bool)
+        if positions:
+            values.flat[positions] = np.array(numbers, dtype=dtype)
+            mask.flat[positions] = False
+        return values, mask
+
+
+def parse_number(text: str) -> int | float | None:
+    """セルの文字列を数値に変換する (変換できない場合は `None` を返す)"""
+    if not text:
+        return None
+    try:
+        return int(text)
+    except ValueError:
+        pass
+    try:
+        number = float(text)
+    except ValueError:
+        return None
+    if not math.isfinite(number):
+        return None
+    return number
+
+
+def format_number(value: Number) -> str:
+    """集計値を総括表のセル文字列に変換する"""
+    if isinstance(value, float):
+        if value.is_integer():
+            return str(int(value))
+        return str(round(value, 6))
+    return str(value)
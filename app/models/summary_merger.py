@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import os
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from app.io.csv_reader import CSVRow
+from app.models.summary_matrix import format_number, parse_number
+from app.models.summary_schema import TOTAL_COL_NAME
+from app.models.summary_sheet import SummaryProps, SummarySheet
+from app.profiling import timed
+
+# 統合した総括表の #1レベル名 (最上位階層の名称)
+DEFAULT_ROOT_NAME = "統合"
+# 材片種別が存在しない橋梁のセル
+MISSING_VALUE = "0"
+
+
+def merge_summary_sheets(
+    summary_sheets: Sequence[SummarySheet], names: Sequence[str] | None = None, root_name: str = DEFAULT_ROOT_NAME
+) -> SummarySheet:
+    """
+    複数の総括表 (橋梁毎) を1つの総括表に統合する
+
+    統合した総括表のレベル1の列は各橋梁とし、各橋梁の列はレベルを1つずつ下げて橋梁の列の子孫とする。
+    レベル1の材片種別は全橋梁の和集合とし、各橋梁の列には合計列の値を、合計列には全橋梁の合計を設定する。
+    橋梁名を省略した場合は各総括表の #1レベル名 を使用する
+    """
+    if not summary_sheets:
+        raise ValueError("統合する総括表がありません")
+    schema = summary_sheets[0].schema
+    for summary_sheet in summary_sheets[1:]:
+        # 並列に読み込んだ総括表は種類のインスタンスが異なるため、名称と列構成で比較する
+        if (summary_sheet.schema.name, summary_sheet.schema.key_cols) != (schema.name, schema.key_cols):
+            raise ValueError(f"総括表の種類が異なります: {summary_sheet.schema.name} | {schema.name}")
+
+    if names is None:
+        names = _unique_names([summary_sheet.children[0].level_name for summary_sheet in summary_sheets])
+    elif len(names) != len(summary_sheets):
+        raise ValueError(f"橋梁名の数が総括表の数と一致しません: {len(names)} | {len(summary_sheets)}")
+
+    with timed("merge", sheets=len(summary_sheets)) as counts:
+        rows = merged_total_rows(summary_sheets, names, root_name)
+        merged_sheet = SummarySheet(rows, schema=schema)
+        for summary_sheet, bridge_col in zip(summary_sheets, merged_sheet.children, strict=True):
+            merged_sheet.add_sheet(summary_sheet, bridge_col)
+        counts["rows"] = len(rows) - 1
+    return merged_sheet
+
+
+def merged_total_rows(
+    summary_sheets: Sequence[SummarySheet], names: Sequence[str], root_name: str = DEFAULT_ROOT_NAME
+) -> list[CSVRow]:
+    """
+    統合した総括表のレベル1のブロック (ヘッダー行とデータ行) を返す
+
+    各総括表の合計列を材片種別をキーとする辞書で結合し、材片種別は各総括表の並び順を保って和集合をとる
+    """
+    schema = summary_sheets[0].schema
+    totals_by_sheet: list[dict[SummaryProps, str]] = []
+    for summary_sheet in summary_sheets:
+        totals = summary_sheet.total_col.data
+        totals_by_sheet.append(dict(zip(summary_sheet.props_group, totals, strict=True)))
+
+    rows = [CSVRow(["#1レベル名", *schema.key_cols, TOTAL_COL_NAME, *names])]
+    for props in _merge_order([summary_sheet.props_group for summary_sheet in summary_sheets]):
+        values = [totals.get(props, MISSING_VALUE) for totals in totals_by_sheet]
+        total = sum(parse_number(value) or 0 for value in values)
+        rows.append(CSVRow([root_name, *props.values(), format_number(total), *values]))
+    return rows
+
+
+def load_summary_sheets(csv_paths: Sequence[Path], jobs: int | None = None) -> list[SummarySheet]:
+    """
+    複数の総括表CSVファイルを読み込む
+
+    `jobs` が2以上の場合はプロセスプールで並列に読み込む (省略時はCPUコア数)。戻り値は `csv_paths` の順
+    """
+    jobs = jobs if jobs is not None else os.cpu_count() or 1
+    if jobs <= 1 or len(csv_paths) <= 1:
+        return [SummarySheet.load_from_csv(path) for path in csv_paths]
+    with ProcessPoolExecutor(max_workers=min(jobs, len(csv_paths))) as executor:
+        return list(executor.map(SummarySheet.load_from_csv, csv_paths))
+
+
+def merge_summary_csvs(
+    csv_paths: Sequence[Path],
+    names: Sequence[str] | None = None,
+    root_name: str = DEFAULT_ROOT_NAME,
+    jobs: int | None = None,
+) -> SummarySheet:
+    """複数の総括表CSVファイルを並列に読み込み、1つの総括表に統合する"""
+    return merge_summary_sheets(load_summary_sheets(csv_paths, jobs), names, root_name)
+
+
+def _merge_order(sequences: Sequence[Sequence[SummaryProps]]) -> list[SummaryProps]:
+    """
+    材片種別の和集合を、各総括表の並び順を保って返す
+
+    先頭の総括表の並び順を基準とし、他の総括表にのみ存在する材片種別は、
+    その総括表で直前にある材片種別の後ろに挿入する (中計・合計行より前に配置される)
+    """
+    # 挿入を定数時間で行うため、次の材片種別への連結リストで並び順を保持する
+    head: SummaryProps | None = None
+    next_props: dict[SummaryProps, SummaryProps | None] = {}
+    for sequence in sequences:
+        previous: SummaryProps | None = None
+        for props in sequence:
+            if props not in next_props:
+                if previous is None:
+                    next_props[props] = head
+                    head = props
+                else:
+                    next_props[props] = next_props[previous]
+                    next_props[previous] = props
+            previous = props
+
+    order: list[SummaryProps] = []
+    current = head
+    while current is not None:
+        order.append(current)
+        current = next_props[current]
+    return order
+
+
+def _unique_names(names: Sequence[str]) -> list[str]:
+    """重複する名称に連番を付ける (例: `A`, `A(2)`)"""
+    counts: dict[str, int] = {}
+    unique_names: list[str] = []
+    for name in names:
+        counts[name] = counts.get(name, 0) + 1
+        unique_names.append(name if counts[name] == 1 else f"{name}({counts[name]})")
+    return unique_names
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping, Sequence
+from enum import Enum
+from typing import Final, NamedTuple
+
+TOTAL_COL_NAME = "合計"
+
+
+class RowKind(Enum):
+    """総括表データ行の種別"""
+
+    ITEM = "item"  # 材片種別毎の行
+    SUBTOTAL = "subtotal"  # 小計 (総括表アイテムとして扱わない)
+    SECTION_TOTAL = "section_total"  # 加工鋼重中計, 購入部品中計
+    TOTAL = "total"  # 合計
+
+
+class HeaderLayout(NamedTuple):
+    """ヘッダー行の列配置"""
+
+    key_indices: tuple[int, ...]  # 材片種別の列 (例: 材質, 形状, 寸法)
+    total_index: int  # 合計列
+    header_indices: tuple[int, ...]  # ヘッダー列 (#nレベル名, 材片種別の列, 合計列)
+
+
+class SummarySchema:
+    """
+    総括表の種類毎の列構成と行の分類規則
+
+    ヘッダー列の位置はヘッダー行毎に1回だけ求め、行の分類は辞書の参照1回で行う
+    """
+
+    def __init__(self, name: str, key_cols: Sequence[str], row_labels: Mapping[str, RowKind]):
+        self.name: Final = name
+        self.key_cols: Final = tuple(key_cols)
+        self.row_labels: Final = dict(row_labels)
+        self._layouts: dict[tuple[str, ...], HeaderLayout] = {}
+
+    def __repr__(self) -> str:
+        return f"SummarySchema(name={self.name!r}, key_cols={self.key_cols!r})"
+
+    def __reduce__(self) -> tuple:
+        # 登録済みの総括表は名前で復元する (プロセス間で受け渡しても同じインスタンスを参照する)
+        if any(schema is self for schema in SCHEMAS):
+            return (_registered_schema, (self.name,))
+        return (SummarySchema, (self.name, self.key_cols, self.row_labels))
+
+    def matches(self, header: Sequence[str]) -> bool:
+        """ヘッダー行が総括表の列構成と一致する場合 `True` を返す"""
+        return all(name in header for name in (*self.key_cols, TOTAL_COL_NAME))
+
+    def layout(self, header: Sequence[str]) -> HeaderLayout:
+        """ヘッダー行の列配置を返す (同じ列構成のヘッダー行は同じインスタンスを返す)"""
+        # 0列目 (#nレベル名) と総括表列名を除いた部分で判定する
+        signature = tuple(header[1 : len(self.key_cols) + 2])
+        layout = self._layouts.get(signature)
+        if layout is None:
+            layout = self._layouts[signature] = self._compile_layout(header)
+        return layout
+
+    def classify(self, key_cells: Sequence[str]) -> RowKind:
+        """材片種別の列のセルから行の種別を返す (末尾の空でないセルで判定する)"""
+        for cell in reversed(key_cells):
+            if cell:
+                return self.row_labels.get(cell, RowKind.ITEM)
+        return RowKind.ITEM
+
+    def _compile_layout(self, header: Sequence[str]) -> HeaderLayout:
+        """ヘッダー行から列配置を求める"""
+        try:
+            key_indices = tuple(header.index(name) for name in self.key_cols)
+            total_index = header.index(TOTAL_COL_NAME)
+        except ValueError as e:
+            raise ValueError(f"{self.name} のヘッダー行ではありません: {list(header)}") from e
+        return HeaderLayout(key_indices, total_index, (0, *key_indices, total_index))
+
+
+# 鋼材系の総括表で共通の行ラベル
+STEEL_KEY_COLS = ("材質", "形状", "寸法")
+STEEL_ROW_LABELS = {
+    "小計": RowKind.SUBTOTAL,
+    "加工鋼重中計": RowKind.SECTION_TOTAL,
+    "購入部品中計": RowKind.SECTION_TOTAL,
+    "合計": RowKind.TOTAL,
+}
+
+STEEL_WEIGHT_SCHEMA = SummarySchema("鋼材重量総括表", STEEL_KEY_COLS, STEEL_ROW_LABELS)
+BOLT_COUNT_SCHEMA = SummarySchema("ボルト本数総括表", STEEL_KEY_COLS, STEEL_ROW_LABELS)
+MEMBER_LENGTH_SCHEMA = SummarySchema("部材長さ総括表", STEEL_KEY_COLS, STEEL_ROW_LABELS)
+PLATING_SCHEMA = SummarySchema("メッキ総括表", STEEL_KEY_COLS, STEEL_ROW_LABELS)
+# 塗装総括表の "合計" は塗装名称毎の合計 (一般部 + 添接部)
+PAINT_SCHEMA = SummarySchema("塗装総括表", ("塗装名称", "区分"), {"合計": RowKind.TOTAL})
+
+# 登録済みの総括表 (ヘッダー行が一致するものが複数ある場合は先頭を既定とする)
+SCHEMAS: tuple[SummarySchema, ...] = (
+    STEEL_WEIGHT_SCHEMA,
+    BOLT_COUNT_SCHEMA,
+    MEMBER_LENGTH_SCHEMA,
+    PLATING_SCHEMA,
+    PAINT_SCHEMA,
+)
+
+
+def _registered_schema(name: str) -> SummarySchema:
+    """登録済みの総括表を名前から返す (`SummarySchema` の復元用)"""
+    return next(schema for schema in SCHEMAS if schema.name == name)
+
+
+def sniff_schema(
+    header: Sequence[str], name_hint: str = "", schemas: Iterable[SummarySchema] = SCHEMAS
+) -> SummarySchema:
+    """
+    最初のヘッダー行から総括表の種類を判定する
+
+    列構成が同じ総括表 (鋼材重量・ボルト本数など) は `name_hint` (ファイル名など) に含まれる名称で区別する
+    """
+    candidates = [schema for schema in schemas if schema.matches(header)]
+    if not candidates:
+        raise ValueError(f"総括表の種類を判定できません: {list(header)}")
+    for schema in candidates:
+        if schema.name in name_hint:
+            return schema
+    return candidates[0]
@@ -1,36 +1,83 @@
 from __future__ import annotations
 
-import re
+import sys
 from collections import defaultdict
-from collections.abc import Iterator
+from collections.abc import Callable, Iterable, Iterator
+from fnmatch import fnmatchcase
 from functools import cached_property
+from itertools import chain, groupby
 from pathlib import Path
-from types import MappingProxyType
-from typing import Final, overload, override
+from typing import Final, overload
 
-from anytree import NodeMixin
+import numpy as np
 
-from app.io.csv_reader import CSVColumn, CSVRow
+from app.io.csv_reader import CSVColumn, CSVReader, CSVRow
 from app.models.csv_summary_data import CSVSummaryData
+from app.models.summary_block import SummaryBlock, cells_getter, iter_summary_blocks
+from app.models.summary_diff import SummaryDiff
+from app.models.summary_matrix import SummaryMatrix
+from app.models.summary_schema import STEEL_KEY_COLS, RowKind, SummarySchema
+from app.models.summary_tree import SummaryTree
+from app.models.summary_validator import DEFAULT_TOLERANCE, Inconsistency, validate_summary_sheet
+from app.profiling import timed
 
-HEADER_COL_NAMES = ["材質", "形状", "寸法"]
+# 階層パスの区切り文字
+PATH_SEPARATOR = "/"
+# glob パターンのワイルドカード
+GLOB_CHARS = "*?["
 
 
-class SummarySheet(NodeMixin):
+class SummarySheet:
     """総括表クラス"""
 
-    def __init__(self, csv_summary_data: CSVSummaryData):
+    # 木構造における総括表 (根) の番号
+    node_id: Final = SummaryTree.ROOT
+
+    def __init__(
+        self,
+        rows: Iterable[CSVRow] = (),
+        csv_path: Path | None = None,
+        schema: SummarySchema | None = None,
+        *,
+        blocks: Iterable[SummaryBlock] | None = None,
+    ):
+        """
+        CSV行から総括表を生成する
+
+        `blocks` を指定した場合は `rows` の代わりに解析済みの総括表ブロックから生成する (ブロックは共有する)
+        """
         self._display_level = 1  # CSV出力用
-        self._csv_summary_data: Final = csv_summary_data
-        self._csv_sheets = self._csv_summary_data.sheets
+        self._csv_path: Final = Path(csv_path) if csv_path is not None else None
+
+        # 総括表列の木構造 (親子関係と前順の並びを保持する)
+        self._tree: Final = SummaryTree[SummaryColumn]()
 
         # 総括表列データをレベル毎に格納する
-        # 格納処理は SummaryColumn のコンストラクタで行う
+        # 格納処理は総括表ブロックの解析時に行う
         self.cols_by_level: defaultdict[int, list[SummaryColumn]]
         self.cols_by_level: Final = defaultdict(list)
 
-        self._parse_summary_columns()
-        self.total_col: Final = SummaryTotalColumn.parse_total_column(self)
+        # 総括表列の索引 (レベルと列名, 階層パス)
+        self._cols_by_name: defaultdict[tuple[int, str], list[SummaryColumn]] = defaultdict(list)
+        self._cols_by_path: dict[str, SummaryColumn] = {}
+        # 親階層のレベル毎に、次のブロックの親階層を探し始める列の位置 (`cols_by_level` の位置)
+        self._parent_positions: defaultdict[int, int] = defaultdict(int)
+
+        # ブロックとブロック毎の総括表列 (再読み込み時は変更されていないブロックを引き継ぐ)
+        self._blocks: list[SummaryBlock] = []
+        self._block_cols: list[list[SummaryColumn]] = []
+
+        # 材片種別テーブル (同じ材片種別の `SummaryProps` を全ブロックで共有する)
+        self._props_table: dict[tuple[str, ...], SummaryProps] = {}
+
+        # レベル毎の数値行列 (初回アクセス時に生成する)
+        self._matrices: dict[int, SummaryMatrix] = {}
+
+        # CSV行を1回だけ走査し、ブロック単位で総括表列を生成する
+        # 総括表の種類は最初のヘッダー行とファイル名から判定する
+        if blocks is None:
+            blocks = iter_summary_blocks(rows, schema, self._name_hint)
+        self._build(iter(blocks))
 
     def __iter__(self) -> Iterator[SummaryColumn]:
         return iter(self.children)
@@ -48,13 +95,91 @@ class SummarySheet(NodeMixin):
     @staticmethod
     def load_from_csv(csv_path: str | Path) -> SummarySheet:
         """CSVファイルからインスタンスを生成する"""
-        csv_summary_data = CSVSummaryData.load_from_csv(csv_path)
-        return SummarySheet(csv_summary_data)
+        path = Path(csv_path)
+        reader = CSVReader(path)
+        return SummarySheet(reader.iter_rows(), path)
+
+    def reloaded(self, rows: Iterable[CSVRow]) -> SummarySheet:
+        """
+        CSV行を再読み込みした総括表を返す (このインスタンスは変更しない)
+
+        データ行が変更されていないブロックは、解析済みのブロックと材片種別を引き継いで新しい総括表を生成する。
+        変更されたブロックがない場合はこのインスタンスを返す。
+        ブロックの構成 (階層・列名) が変わった場合は全て解析し直す
+        """
+        blocks = list(iter_summary_blocks(rows, self.schema, self._name_hint))
+        if not blocks:
+            raise ValueError("総括表データが空です")
+
+        fingerprints = [block.fingerprint for block in blocks]
+        old_fingerprints = [block.fingerprint for block in self._blocks]
+        if len(fingerprints) != len(old_fingerprints) or not all(
+            new.same_structure(old) for new, old in zip(fingerprints, old_fingerprints, strict=True)
+        ):
+            with timed("reload", blocks=len(blocks)):
+                return SummarySheet(csv_path=self._csv_path, blocks=blocks)
+
+        changed = {i for i, (new, old) in enumerate(zip(fingerprints, old_fingerprints, strict=True)) if new != old}
+        if not changed:
+            return self
+
+        with timed("reload", blocks=len(changed)):
+            # 変更されていないブロックは変更前の総括表のブロックを共有する
+            blocks = [
+                new if i in changed else old for i, (new, old) in enumerate(zip(blocks, self._blocks, strict=True))
+            ]
+            summary_sheet = SummarySheet(csv_path=self._csv_path, blocks=blocks)
+            # 変更されていないブロックの材片種別を引き継ぐ (変更前の総括表の材片種別テーブルは変更しない)
+            for i, (old_cols, new_cols) in enumerate(zip(self._block_cols, summary_sheet._block_cols, strict=True)):
+                if i not in changed and old_cols:
+                    new_cols[0]._block_items.inherit(old_cols[0]._block_items)
+        return summary_sheet
+
+    def add_sheet(self, summary_sheet: SummarySheet, parent: SummaryColumn) -> list[SummaryColumn]:
+        """
+        別の総括表の全列を `parent` の子孫として追加し、`parent` の子となった列を返す
+
+        追加する列のレベルは `parent` のレベル分ずらす。ブロックのデータ行は追加元と共有する
+        """
+        if summary_sheet.schema.key_cols != self.schema.key_cols:
+            raise ValueError(f"総括表の種類が異なります: {summary_sheet.schema.name} | {self.schema.name}")
+
+        # 追加元の列 (または総括表) と追加先の列の対応
+        col_map: dict[SummaryColumn | SummarySheet, SummaryColumn] = {summary_sheet: parent}
+        for block, cols in zip(summary_sheet._blocks, summary_sheet._block_cols, strict=True):
+            # 列のないブロックは親階層を特定できないため追加しない
+            if not cols:
+                continue
+            shifted_block = block.shifted(parent.level)
+            new_cols = self._create_columns(shifted_block, col_map[cols[0].parent])
+            for col in new_cols:
+                self._register_column(col)
+            self._blocks.append(shifted_block)
+            self._block_cols.append(new_cols)
+            col_map.update(zip(cols, new_cols, strict=True))
+
+        self._matrices.clear()
+        return list(parent.children)
+
+    def reloaded_from_csv(self) -> SummarySheet:
+        """CSVファイルを再読み込みした総括表を返す (`reloaded` を参照)"""
+        if self._csv_path is None:
+            raise ValueError("CSVファイルのパスが設定されていません")
+        return self.reloaded(CSVReader(self._csv_path).iter_rows())
+
+    def iter_blocks(self) -> Iterator[tuple[SummaryBlock, list[SummaryColumn]]]:
+        """総括表ブロックと、ブロックの総括表列 (CSVの列順) の組を返す"""
+        return zip(self._blocks, self._block_cols, strict=True)
+
+    @property
+    def children(self) -> tuple[SummaryColumn, ...]:
+        """最上位レベルの総括表列"""
+        return self._tree.children(self.node_id)
 
     @property
-    @override
     def descendants(self) -> tuple[SummaryColumn, ...]:
-        return super().descendants
+        """全ての総括表列 (前順)"""
+        return self._tree.descendants(self.node_id)
 
     @property
     def cols(self) -> tuple[SummaryColumn, ...]:
@@ -89,77 +214,217 @@ class SummarySheet(NodeMixin):
             csv_rows.append(props_row)
         return tuple(csv_rows)
 
+    def find(self, path: str) -> SummaryColumn | None:
+        """階層パス (例: `上部構造/主構造/主桁/G1`) に一致する総括表列を返す"""
+        return self._cols_by_path.get(path.strip(PATH_SEPARATOR))
+
+    def glob(self, pattern: str) -> list[SummaryColumn]:
+        """
+        階層パスのパターン (例: `上部構造/*/主桁/G?`) に一致する総括表列のリストを返す
+
+        パターンは `/` 区切りの階層毎に `fnmatch` 形式で照合し、階層数と同じレベルの列のみを対象とする
+        """
+        parts = pattern.strip(PATH_SEPARATOR).split(PATH_SEPARATOR)
+        # ワイルドカードを含まない場合は索引から取得
+        if not any(char in pattern for char in GLOB_CHARS):
+            col = self.find(pattern)
+            return [col] if col is not None else []
+        return [
+            col
+            for col in self.cols_by_level.get(len(parts), [])
+            if all(fnmatchcase(name, part) for name, part in zip(col.path_parts, parts, strict=True))
+        ]
+
+    def matrix(self, level: int) -> SummaryMatrix:
+        """
+        レベル毎の数値行列 (材片種別 × 総括表列)
+
+        初回アクセス時に生成し、以降は同じインスタンスを返す
+        """
+        if level not in self._matrices:
+            if level not in self.cols_by_level:
+                raise KeyError(f"レベル{level} の総括表列が存在しません")
+            self._matrices[level] = SummaryMatrix(self.props_group, self.cols_by_level[level])
+        return self._matrices[level]
+
+    def rollup(self, level: int) -> np.ndarray:
+        """
+        指定レベルの総括表列を親階層 (`level - 1`) の列毎に合計した行列
+
+        行は `matrix(level).props_group` に対応する
+        """
+        if level < 2:
+            raise ValueError("rollup には 2 以上のレベルを指定してください")
+        return self.matrix(level).rollup(self.cols_by_level[level - 1])
+
+    def validate(self, tolerance: float = DEFAULT_TOLERANCE) -> list[Inconsistency]:
+        """小計・中計・合計行、合計列、下位レベルの合計の整合性を検証し、整合しないセルを返す"""
+        return validate_summary_sheet(self, tolerance)
+
+    def diff(self, old_sheet: SummarySheet) -> SummaryDiff:
+        """変更前の総括表 `old_sheet` との差分を返す"""
+        with timed("diff", cols=len(self.cols)) as counts:
+            summary_diff = SummaryDiff(old_sheet, self)
+            counts["cells"] = len(summary_diff.cells)
+        return summary_diff
+
     @property
     def display_level(self) -> int:
-        """CSV出力時の階層レベル"""
+        """
+        CSV出力時の階層レベル
+
+        `summary_cache` から取得したインスタンスは共有されるため変更しないこと (レベルは引数で指定する)
+        """
         return self._display_level
 
     @display_level.setter
     def display_level(self, value: int) -> None:
-        """`1~4` の値を受け付ける"""
-        if not isinstance(value, int) or value < 1 or value > 4:
-            raise ValueError("display_level には 1 ~ 4 のint値を設定してください")
+        """`1` 以上の値を受け付ける (統合した総括表などは5階層以上になる)"""
+        if not isinstance(value, int) or value < 1:
+            raise ValueError("display_level には 1 以上のint値を設定してください")
         self._display_level = value
 
     @property
     def csv_path(self) -> Path | None:
         """CSV ファイルのパス"""
-        return self._csv_summary_data.csv_path
+        return self._csv_path
 
     @property
     def csv_data(self) -> CSVSummaryData:
-        """総括表CSVデータ"""
-        # ヘッダー列 (材質, 形状, 寸法) を追加
-        # CSVRow のコピーを作成して header_rows への参照を防止
-        csv_rows = [CSVRow(row) for row in self.header_rows]
-
-        # 追加する総括表列のリストを取得
+        """総括表CSVデータ (`display_level` のレベル)"""
         summary_cols = self.cols_by_level[self.display_level]
+        with timed("csv_data", level=self.display_level, rows=len(self.header_rows), cols=len(summary_cols)):
+            return CSVSummaryData(list(self.iter_csv_rows()), self.csv_path)
 
-        # 合計列を追加
-        for i, cell in enumerate(self.total_col):
-            current_row = csv_rows[i]
-            current_row.append(cell)
+    def iter_csv_rows(self, level: int | None = None) -> Iterator[CSVRow]:
+        """
+        指定レベル (省略時は `display_level`) の総括表をCSV行で1行ずつ返す
+
+        総括表列はブロック毎にまとめ、材片種別からデータ行への辞書を1回だけ生成してセルを取り出す。
+        総括表アイテムは生成せず、出力する行全体も保持しない
+        """
+        summary_cols = self.cols_by_level[self.display_level if level is None else level]
+        total_col = self.total_col
+        yield CSVRow([*self.header_rows[0], total_col.name, *(col.name for col in summary_cols)])
+
+        # 同じブロックの連続した総括表列を、データ行からセルを取り出す関数にまとめる
+        col_groups: list[tuple[dict[SummaryProps, CSVRow], Callable[[CSVRow], tuple[str, ...]], tuple[str, ...]]] = []
+        for block_items, cols in groupby(summary_cols, key=lambda col: col._block_items):
+            indices = [col._index for col in cols]
+            rows_by_props = dict(block_items.props_rows)
+            col_groups.append((rows_by_props, cells_getter(indices), ("",) * len(indices)))
+
+        for props, total in zip(self.props_group, total_col.data, strict=True):
+            csv_row = CSVRow(props.values())
+            csv_row.append(total)
+            for rows_by_props, get_cells, blank_cells in col_groups:
+                row = rows_by_props.get(props)
+                csv_row.extend(get_cells(row) if row is not None else blank_cells)
+            yield csv_row
+
+    @property
+    def _name_hint(self) -> str:
+        """総括表の種類の判定に使用する名称 (ファイル名)"""
+        return self._csv_path.stem if self._csv_path is not None else ""
 
-            # 総括表列を追加
-            for summary_col in summary_cols:
-                cell = summary_col.csv_col[i]
-                current_row.append(cell)
+    def _build(self, blocks: Iterator[SummaryBlock]) -> None:
+        """総括表ブロックから合計列と総括表列を生成する"""
+        first_block = next(blocks, None)
+        if first_block is None:
+            raise ValueError("総括表データが空です")
 
-        return CSVSummaryData(csv_rows, self.csv_path)
+        self.schema = first_block.schema
+        self.total_col = SummaryTotalColumn.parse_total_column(first_block)
+        self._parse_summary_columns(chain([first_block], blocks))
 
-    def _parse_summary_columns(self) -> None:
+    def _parse_summary_columns(self, blocks: Iterable[SummaryBlock]) -> None:
         """総括表列を生成する"""
-        # 分割したCSV総括表シートをループ
-        for sheet in self._csv_sheets:
-            header_cols: list[CSVColumn] = []
-            # CSV総括表の列をループ
-            for col in sheet.cols:
-                # ヘッダー列の場合はヘッダー列リストに追加してスキップ
-                if _is_header_col(col):
-                    header_cols.append(col)
-                    continue
-                # 総括表列インスタンスを生成
-                SummaryColumn(self, col, header_cols)
-
-
-class SummaryColumn(NodeMixin):
+        with timed("parse") as counts:
+            self._parse_blocks(blocks)
+            counts["levels"] = len(self.cols_by_level)
+            counts["cols"] = sum(len(cols) for cols in self.cols_by_level.values())
+
+    def _parse_blocks(self, blocks: Iterable[SummaryBlock]) -> None:
+        """総括表ブロック毎に総括表列を生成する"""
+        # ヘッダー行で分割した総括表ブロックをループ
+        for block in blocks:
+            # 親階層はブロック内の全列で共通
+            parent = self._resolve_parent(block)
+            cols = self._create_columns(block, parent)
+            for col in cols:
+                self._register_column(col)
+
+            self._blocks.append(block)
+            self._block_cols.append(cols)
+
+    def _create_columns(self, block: SummaryBlock, parent: SummaryColumn | SummarySheet) -> list[SummaryColumn]:
+        """ブロックの総括表列を生成して木構造に追加する"""
+        # 材片種別はブロック内の全列で共有する (いずれかの列のアイテムの初回アクセス時に生成する)
+        block_items = SummaryBlockItems(block, self._props_table)
+        return [SummaryColumn(self, block, index, block_items, parent) for index in block.value_indices]
+
+    def _resolve_parent(self, block: SummaryBlock) -> SummaryColumn | SummarySheet:
+        """
+        ブロックのレベル名と一致する親階層を取得する
+
+        ブロックは親階層の列の並び順に出現するため、直前のブロックの親階層より後ろの列から列名が一致する列を探す。
+        後ろに一致する列がない場合は、直前のブロックと同じ親階層 (分割されたブロック) または同名の列が1つのみの場合に
+        その列を親階層とし、特定できない場合はエラーとする
+        """
+        # レベル1の場合、ルート階層
+        if block.level == 1:
+            return self
+
+        parent_level = block.level - 1
+        candidates = self._cols_by_name.get((parent_level, block.level_name))
+        if not candidates:
+            # 親階層が存在しない場合エラー
+            raise ValueError(f"親階層が存在しません: {block.level_name} | {block.header[0]}")
+
+        parent_cols = self.cols_by_level[parent_level]
+        start = self._parent_positions[parent_level]
+        for position in range(start, len(parent_cols)):
+            if parent_cols[position].name == block.level_name:
+                self._parent_positions[parent_level] = position + 1
+                return parent_cols[position]
+
+        if start > 0 and parent_cols[start - 1].name == block.level_name:
+            return parent_cols[start - 1]
+        if len(candidates) == 1:
+            return candidates[0]
+        raise ValueError(f"同名の親階層を特定できません: {block.level_name} | {block.header[0]}")
+
+    def _register_column(self, col: SummaryColumn) -> None:
+        """総括表列をレベル毎のリストと索引に追加する"""
+        self.cols_by_level[col.level].append(col)
+        self._cols_by_name[(col.level, col.name)].append(col)
+        # 同一パスの列が複数存在する場合は先頭の列を優先する
+        self._cols_by_path.setdefault(col.path, col)
+
+
+class SummaryColumn:
     """総括表列クラス"""
 
-    def __init__(self, summary_sheet: SummarySheet, col: CSVColumn, header_cols: list[CSVColumn]):
+    def __init__(
+        self,
+        summary_sheet: SummarySheet,
+        block: SummaryBlock,
+        index: int,
+        block_items: SummaryBlockItems,
+        parent: SummaryColumn | SummarySheet,
+    ):
         self.summary_sheet: Final = summary_sheet
-        self._col = col
-        self._header_cols = header_cols
-        self.name: Final = self._get_name()
-        self.level: Final = self._get_level()
-        self.level_name: Final = self._get_level_name()
-        self.items: Final = self._parse_summary_items()
+        self.name: Final = block.header[index]
+        self.level: Final = block.level
+        self.level_name: Final = block.level_name
+        # アイテムは初回アクセス時に生成する (`items` を参照)
+        self._index: Final = index
+        self._block_items: Final = block_items
 
         # 親階層の更新
-        self.parent: Final = self._get_parent()
-
-        # レベル毎の辞書に自ノードを追加
-        self.summary_sheet.cols_by_level[self.level].append(self)
+        self.node_id: Final = summary_sheet._tree.add(self, parent.node_id)
+        parent_parts = parent.path_parts if isinstance(parent, SummaryColumn) else ()
+        self.path_parts: Final = (*parent_parts, self.name)
 
     @overload
     def __getitem__(self, key: int) -> SummaryItem: ...
@@ -167,7 +432,7 @@ class SummaryColumn(NodeMixin):
     def __getitem__(self, key: SummaryProps) -> SummaryItem | None: ...
     def __getitem__(self, key: int | SummaryProps) -> SummaryItem | None:
         if isinstance(key, int):
-            return list(self.items.values())[key]
+            return self._item_values[key]
         if isinstance(key, SummaryProps):
             return self.items[key]
 
@@ -178,6 +443,39 @@ class SummaryColumn(NodeMixin):
         items_count = len(self.items)
         return f"SummaryColumn(name={self.name!r}, level_name={self.level_name!r}, items={items_count})"
 
+    @cached_property
+    def items(self) -> dict[SummaryProps, SummaryItem]:
+        """総括表アイテムリスト (`SummaryProps` をキーとする辞書, 初回アクセス時に生成する)"""
+        return self._parse_summary_items(self._index, self._block_items.props_rows)
+
+    @cached_property
+    def _item_values(self) -> tuple[SummaryItem, ...]:
+        """位置で参照するための総括表アイテムリスト"""
+        return tuple(self.items.values())
+
+    @property
+    def parent(self) -> SummaryColumn | SummarySheet:
+        """親階層 (最上位レベルの場合は総括表)"""
+        parent_id = self.summary_sheet._tree.parent_id(self.node_id)
+        if parent_id == SummaryTree.ROOT:
+            return self.summary_sheet
+        return self.summary_sheet._tree.node(parent_id)
+
+    @property
+    def children(self) -> tuple[SummaryColumn, ...]:
+        """子階層の総括表列"""
+        return self.summary_sheet._tree.children(self.node_id)
+
+    @property
+    def descendants(self) -> tuple[SummaryColumn, ...]:
+        """子孫の総括表列 (前順)"""
+        return self.summary_sheet._tree.descendants(self.node_id)
+
+    @property
+    def path(self) -> str:
+        """階層パス (例: `上部構造/主構造/主桁/G1`)"""
+        return PATH_SEPARATOR.join(self.path_parts)
+
     @property
     def props_group(self) -> tuple[SummaryProps, ...]:
         """材片種別一覧"""
@@ -196,57 +494,53 @@ class SummaryColumn(NodeMixin):
 
         return col
 
-    def _get_name(self) -> str:
-        """CSV列データを基に列名を返す"""
-        return self._col[0]
-
-    def _get_level(self) -> int:
-        """CSV列データを基にレベル番号を返す"""
-        level_cell = self._header_cols[0][0]
-
-        if "#" not in level_cell or "レベル名" not in level_cell:
-            raise ValueError(f"不正なセル内容: {level_cell}")
+    def _parse_summary_items(
+        self, index: int, props_rows: list[tuple[SummaryProps, CSVRow]]
+    ) -> dict[SummaryProps, SummaryItem]:
+        """総括表アイテムリスト (`SummaryProps` をキーとする辞書) を生成する"""
+        items: dict[SummaryProps, SummaryItem] = {}
+        for props, row in props_rows:
+            items[props] = SummaryItem(self, row[index], props)
+        return items
 
-        # "#" と "レベル名" の間の数字を抽出
-        match = re.search(r"#(\d+)レベル名", level_cell)
-        if not match:
-            raise ValueError(f"不正なセル内容: {level_cell}")
 
-        return int(match.group(1))
+class SummaryBlockItems:
+    """
+    総括表ブロックの材片種別とデータ行
 
-    def _get_level_name(self) -> str:
-        """CSV列データを基にレベル名（列の上位階層名）を返す"""
-        return self._header_cols[0][1]
+    ブロック内の全列で共有し、いずれかの列のアイテムの初回アクセス時に生成する
+    """
 
-    def _parse_summary_items(self) -> dict[SummaryProps, SummaryItem]:
-        """総括表アイテムリスト (`SummaryProps` をキーとする辞書) を生成する"""
-        items: dict[SummaryProps, SummaryItem] = {}
-        for i, cell in enumerate(self._col):
-            header = CSVRow(col[i] for col in self._header_cols)
-            if _is_header_row(header):
-                continue
-            if _is_subtotal_row(header):
-                continue
-            props = SummaryProps(header)
-            item = SummaryItem(self, cell, props)
-            items[props] = item
-        return items
+    def __init__(self, block: SummaryBlock, props_table: dict[tuple[str, ...], SummaryProps]):
+        self.block: Final = block
+        # 総括表内で共有する材片種別テーブル (材片種別の値をキーとする)
+        self._props_table: Final = props_table
 
-    def _get_parent(self) -> SummaryColumn | SummarySheet:
-        """レベル名と一致するノードを走査し、親階層を返す"""
-        # 自ノードのレベルが1の場合、ルート階層
-        if self.level == 1:
-            return self.summary_sheet
+    def inherit(self, other: SummaryBlockItems) -> None:
+        """
+        同じデータ行のブロックの生成済みの材片種別を引き継ぐ (未生成の場合は何もしない)
 
-        # 親ノードの候補一覧を取得
-        parent_level = self.level - 1
-        parent_nodes = self.summary_sheet.cols_by_level[parent_level]
-        for parent_node in parent_nodes:
-            if self.level_name == parent_node.name:
-                return parent_node
+        材片種別は変更されないため、総括表間で共有する
+        """
+        if "props_rows" not in vars(other):
+            return
+        for props, _ in other.props_rows:
+            self._props_table.setdefault(tuple(props.values()), props)
+        self.props_rows = other.props_rows
 
-        # 親階層が存在しない場合エラー
-        raise ValueError(f"親階層が存在しません: {self.level_name} | {self.name}")
+    @cached_property
+    def props_rows(self) -> list[tuple[SummaryProps, CSVRow]]:
+        """材片種別とデータ行の組 (小計行を除く)"""
+        key_cols = self.block.schema.key_cols
+        key_end = len(key_cols) + 1
+        props_rows: list[tuple[SummaryProps, CSVRow]] = []
+        for header_cells, row in self.block.item_rows:
+            values = tuple(header_cells[1:key_end])
+            props = self._props_table.get(values)
+            if props is None:
+                props = self._props_table[values] = SummaryProps(header_cells, key_cols)
+            props_rows.append((props, row))
+        return props_rows
 
 
 class SummaryTotalColumn(list[str]):
@@ -263,24 +557,26 @@ class SummaryTotalColumn(list[str]):
         return CSVColumn(self[1:])
 
     @staticmethod
-    def parse_total_column(summary_sheet: SummarySheet) -> SummaryTotalColumn:
-        """総括表合計列を生成する"""
-        # 最上位レベルのCSVシートを取得
-        sheet = summary_sheet._csv_sheets[0]
-        # CSVデータの "合計" 列を取得
-        total_col: list[str] = []
-        for row in sheet:
+    def parse_total_column(block: SummaryBlock) -> SummaryTotalColumn:
+        """最上位レベルの総括表ブロックから総括表合計列を生成する"""
+        # ヘッダー行の "合計" 列を取得
+        index = block.layout.total_index
+        total_col: list[str] = [block.header[index]]
+        for row in block.rows:
             # 小計行はスキップ
-            if _is_subtotal_row(row):
+            if block.row_kind(row) is RowKind.SUBTOTAL:
                 continue
             # 合計列のセルを追加
-            total_col.append(row[4])
+            total_col.append(row[index])
         return SummaryTotalColumn(total_col)
 
 
 class SummaryItem:
     """総括表アイテムクラス"""
 
+    # セル毎に生成するため、インスタンス辞書を持たない
+    __slots__ = ("parent", "value", "props")
+
     def __init__(self, parent: SummaryColumn, value: str, props: SummaryProps):
         self.parent: Final = parent
         self.value: Final = value
@@ -291,38 +587,46 @@ class SummaryItem:
 
 
 class SummaryProps:
-    """総括表アイテムプロパティクラス"""
+    """
+    総括表アイテムプロパティクラス
+
+    同じ材片種別のインスタンスは総括表内で共有する (`SummarySheet` の材片種別テーブルを参照)
+    """
 
-    def __init__(self, props: list[str]):
-        data = {
-            # 0列目は #nレベル名 (親階層の名称)
-            "材質": props[1],
-            "形状": props[2],
-            "寸法": props[3],
-        }
-        self._data: MappingProxyType[str, str] = MappingProxyType(data)
+    __slots__ = ("_keys", "_values", "_hash")
+
+    def __init__(self, props: list[str], keys: Iterable[str] = STEEL_KEY_COLS):
+        # 0列目は #nレベル名 (親階層の名称)
+        keys = tuple(keys)
+        values = tuple(sys.intern(value) for value in props[1 : len(keys) + 1])
+        self._keys: Final = keys[: len(values)]
+        self._values: Final = values
+        self._hash: Final = hash(values)
 
     def __getitem__(self, key: str) -> str:
         """キーで値を取得"""
-        return self._data[key]
+        try:
+            return self._values[self._keys.index(key)]
+        except ValueError:
+            raise KeyError(key) from None
 
     def __eq__(self, other: object) -> bool:
-        """材質、形状、寸法が全て同じなら同値と判定"""
+        """材片種別の値 (材質、形状、寸法など) が全て同じなら同値と判定"""
         if not isinstance(other, SummaryProps):
             return False
-        return self._data == other._data
+        return self._values == other._values and self._keys == other._keys
 
     def __hash__(self) -> int:
-        """材質、形状、寸法をもとにハッシュ値を計算"""
-        return hash((self._data["材質"], self._data["形状"], self._data["寸法"]))
+        """材片種別の値をもとにハッシュ値を計算"""
+        return self._hash
 
     def keys(self) -> list[str]:
         """キー一覧を返す"""
-        return list(self._data.keys())
+        return list(self._keys)
 
     def values(self) -> list[str]:
         """値一覧を返す"""
-        return list(self._data.values())
+        return list(self._values)
 
     @property
     def csv_row(self) -> CSVRow:
@@ -335,28 +639,3 @@ class SummaryProps:
         """材片種別ヘッダーをCSV行データとして返す"""
         header_row = list(self.keys())
         return CSVRow(header_row)
-
-
-def _is_header_row(row: CSVRow) -> bool:
-    """ヘッダー行の場合 `True` を返す"""
-    if row[0].endswith("レベル名"):
-        return True
-    return False
-
-
-def _is_header_col(col: CSVColumn) -> bool:
-    """ヘッダー列の場合 `True` を返す"""
-    if col[0].endswith("レベル名"):
-        return True
-    if col[0] in HEADER_COL_NAMES:
-        return True
-    if col[0] == "合計":
-        return True
-    return False
-
-
-def _is_subtotal_row(row: CSVRow) -> bool:
-    """小計行の場合 `True` を返す"""
-    if "小計" in row:
-        return True
-    return False
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterator
+
+
+class SummaryTree[T]:
+    """
+    総括表列の木構造クラス
+
+    ノードを番号で管理し、親番号・最初の子・最後の子・次の兄弟を配列で保持する。
+    番号 `0` は根 (総括表) を表し、ノードは持たない。
+    前順 (preorder) のノード列は初回アクセス時に生成し、木が変更されるまで再利用する
+    """
+
+    ROOT: int = 0
+    NO_NODE: int = -1
+
+    def __init__(self) -> None:
+        self._nodes: list[T | None] = [None]
+        self._parents = array("i", [self.NO_NODE])
+        self._first_children = array("i", [self.NO_NODE])
+        self._last_children = array("i", [self.NO_NODE])
+        self._next_siblings = array("i", [self.NO_NODE])
+        # 前順のノード列 (根を除く) と、各ノードの前順の位置・部分木の終端位置
+        self._preorder: tuple[T, ...] | None = None
+        self._positions = array("i")
+        self._subtree_ends = array("i")
+
+    def __len__(self) -> int:
+        """ノード数 (根を除く)"""
+        return len(self._nodes) - 1
+
+    def node(self, node_id: int) -> T:
+        """番号のノードを返す"""
+        node = self._nodes[node_id]
+        if node is None:
+            raise IndexError(f"ノードが存在しません: {node_id}")
+        return node
+
+    def add(self, node: T, parent_id: int = ROOT) -> int:
+        """ノードを親の最後の子として追加し、番号を返す"""
+        node_id = len(self._nodes)
+        self._nodes.append(node)
+        self._parents.append(parent_id)
+        self._first_children.append(self.NO_NODE)
+        self._last_children.append(self.NO_NODE)
+        self._next_siblings.append(self.NO_NODE)
+
+        last_child = self._last_children[parent_id]
+        if last_child == self.NO_NODE:
+            self._first_children[parent_id] = node_id
+        else:
+            self._next_siblings[last_child] = node_id
+        self._last_children[parent_id] = node_id
+        self._preorder = None
+        return node_id
+
+    def parent_id(self, node_id: int) -> int:
+        """親の番号を返す (根の場合は `NO_NODE`)"""
+        return self._parents[node_id]
+
+    def child_ids(self, node_id: int) -> Iterator[int]:
+        """子の番号を追加順に返す"""
+        child_id = self._first_children[node_id]
+        while child_id != self.NO_NODE:
+            yield child_id
+            child_id = self._next_siblings[child_id]
+
+    def children(self, node_id: int) -> tuple[T, ...]:
+        """子ノードを追加順に返す"""
+        return tuple(self.node(child_id) for child_id in self.child_ids(node_id))
+
+    def descendants(self, node_id: int = ROOT) -> tuple[T, ...]:
+        """子孫ノードを前順に返す"""
+        preorder = self._ensure_preorder()
+        # 前順のノード列は根を含まないため、位置を1つずらす
+        return preorder[self._positions[node_id] : self._subtree_ends[node_id] - 1]
+
+    def _ensure_preorder(self) -> tuple[T, ...]:
+        """前順のノード列と、各ノードの位置・部分木の終端位置を生成する"""
+        if self._preorder is not None:
+            return self._preorder
+
+        node_count = len(self._nodes)
+        order: list[int] = []
+        positions = array("i", [0]) * node_count
+        subtree_ends = array("i", [0]) * node_count
+        # 子の走査を終えたノードはビット反転した番号でスタックに積み、部分木の終端位置を記録する
+        stack = [self.ROOT]
+        while stack:
+            node_id = stack.pop()
+            if node_id < 0:
+                subtree_ends[~node_id] = len(order)
+                continue
+            positions[node_id] = len(order)
+            order.append(node_id)
+            stack.append(~node_id)
+            stack.extend(reversed(tuple(self.child_ids(node_id))))
+
+        self._preorder = tuple(self.node(node_id) for node_id in order[1:])
+        self._positions = positions
+        self._subtree_ends = subtree_ends
+        return self._preorder
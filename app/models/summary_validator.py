@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from enum import Enum
+from itertools import chain
+from typing import TYPE_CHECKING, Final, NamedTuple
+
+import numpy as np
+
+from app.models.summary_block import cells_getter
+from app.models.summary_matrix import parse_number
+from app.models.summary_schema import TOTAL_COL_NAME, RowKind
+from app.profiling import timed
+
+if TYPE_CHECKING:
+    from app.models.summary_block import SummaryBlock
+    from app.models.summary_sheet import SummaryColumn, SummarySheet
+
+# 数値の比較で許容する誤差 (小数値の丸め誤差を許容する)
+DEFAULT_TOLERANCE = 1e-3
+
+
+class CheckKind(Enum):
+    """整合性チェックの種類"""
+
+    SUBTOTAL = "小計"  # 小計行 = 直前の小計行以降の材片種別の合計
+    SECTION_TOTAL = "中計"  # 加工鋼重中計・購入部品中計 = 直前の中計行以降の材片種別の合計
+    TOTAL = "合計"  # 合計行 = 直前の合計行以降の材片種別の合計
+    ROW_TOTAL = "合計列"  # 合計列 = ブロック内の総括表列の合計
+    ROLLUP = "下位レベル"  # 総括表列 = 子階層の総括表列の合計
+
+
+class Inconsistency(NamedTuple):
+    """整合しないセル"""
+
+    check: CheckKind
+    level: int
+    path: str  # 総括表列の階層パス (ブロックの合計列は `<親階層のパス>/合計`)
+    row: int | None  # ブロック内の行番号 (ヘッダー行の次の行を1とする, 行が存在しない場合は `None`)
+    label: tuple[str, ...]  # 材片種別の列のセル (例: `("SM400A", "小計", "")`)
+    expected: float
+    actual: float
+
+    @property
+    def message(self) -> str:
+        """表示用の文字列"""
+        row = f"{self.row}行目" if self.row is not None else "行なし"
+        label = " ".join(cell for cell in self.label if cell)
+        return (
+            f"[{self.check.value}] レベル{self.level} {self.path} {row} ({label}): "
+            f"期待値 {self.expected:.10g} / 実際 {self.actual:.10g}"
+        )
+
+
+class _BlockData:
+    """検証用のブロックの数値と行の分類"""
+
+    def __init__(
+        self, block: SummaryBlock, cols: Sequence[SummaryColumn], kinds_by_label: dict[tuple[str, ...], RowKind]
+    ):
+        self.block: Final = block
+        self.cols: Final = cols
+        # 0列目は合計列、1列目以降は総括表列
+        self.values: Final = _parse_values(block.rows, [block.layout.total_index, *block.value_indices])
+        self.labels: Final = list(map(cells_getter(block.layout.key_indices), block.rows))
+        # 同じ材片種別の行はブロックをまたいで繰り返し現れるため、分類結果を総括表内で共有する
+        for label in self.labels:
+            if label not in kinds_by_label:
+                kinds_by_label[label] = block.schema.classify(label)
+        self.kinds: Final = [kinds_by_label[label] for label in self.labels]
+        # 材片種別の行 (小計行を除く) の行番号
+        self._label_rows: dict[tuple[str, ...], int] | None = None
+
+    @property
+    def label_rows(self) -> dict[tuple[str, ...], int]:
+        """材片種別の列のセルから行番号への辞書 (小計行を除く)"""
+        if self._label_rows is None:
+            self._label_rows = {
+                label: i
+                for i, (label, kind) in enumerate(zip(self.labels, self.kinds, strict=True))
+                if kind is not RowKind.SUBTOTAL
+            }
+        return self._label_rows
+
+    def col_path(self, j: int) -> str:
+        """数値の列番号に対応する階層パスを返す"""
+        if j > 0:
+            return self.cols[j - 1].path
+        parent = self.cols[0].parent if self.cols else None
+        parent_path = getattr(parent, "path", "")
+        return f"{parent_path}/{TOTAL_COL_NAME}" if parent_path else TOTAL_COL_NAME
+
+
+def validate_summary_sheet(summary_sheet: SummarySheet, tolerance: float = DEFAULT_TOLERANCE) -> list[Inconsistency]:
+    """
+    総括表の集計値の整合性を検証し、整合しないセルのリストを返す
+
+    ブロック毎にデータ行を1回だけ数値の行列に変換し、以下をまとめて比較する
+    - 小計・中計・合計行: 区間内の材片種別の行の合計 (累積和の差で求める)
+    - 合計列: ブロック内の総括表列の合計
+    - 総括表列: 子階層のブロックの総括表列の合計 (材片種別で対応付ける)
+    """
+    with timed("validate") as counts:
+        kinds_by_label: dict[tuple[str, ...], RowKind] = {}
+        blocks = [_BlockData(block, cols, kinds_by_label) for block, cols in summary_sheet.iter_blocks()]
+        inconsistencies: list[Inconsistency] = []
+        for data in blocks:
+            inconsistencies.extend(_check_subtotals(data, tolerance))
+            inconsistencies.extend(_check_row_totals(data, tolerance))
+        inconsistencies.extend(_check_rollups(blocks, tolerance))
+        counts["blocks"] = len(blocks)
+        counts["errors"] = len(inconsistencies)
+    return inconsistencies
+
+
+def _check_subtotals(data: _BlockData, tolerance: float) -> list[Inconsistency]:
+    """小計・中計・合計行を、区間内の材片種別の行の合計と比較する"""
+    check_rows: list[int] = []
+    check_starts: list[int] = []
+    check_kinds: list[CheckKind] = []
+    item_mask = np.zeros(len(data.kinds), dtype=bool)
+
+    section_start = total_start = 0
+    # 小計のラベルの位置 (材質列: 0, 形状列: 1, ...) 毎の区間の開始行
+    # 入れ子の小計 (例: 材質毎の小計の内側の形状毎の小計) は同じ位置か外側の小計以降を区間とする
+    subtotal_starts: dict[int, int] = {}
+    for i, (label, kind) in enumerate(zip(data.labels, data.kinds, strict=True)):
+        if kind is RowKind.ITEM:
+            item_mask[i] = True
+            continue
+        if kind is RowKind.SUBTOTAL:
+            depth = max(j for j, cell in enumerate(label) if cell)
+            start = max((s for d, s in subtotal_starts.items() if d <= depth), default=section_start)
+            subtotal_starts[depth] = i + 1
+            check_rows.append(i)
+            check_starts.append(start)
+            check_kinds.append(CheckKind.SUBTOTAL)
+            continue
+        if kind is RowKind.SECTION_TOTAL:
+            check_rows.append(i)
+            check_starts.append(section_start)
+            check_kinds.append(CheckKind.SECTION_TOTAL)
+        else:
+            check_rows.append(i)
+            check_starts.append(total_start)
+            check_kinds.append(CheckKind.TOTAL)
+            total_start = i + 1
+        section_start = i + 1
+        subtotal_starts.clear()
+
+    if not check_rows:
+        return []
+
+    # 区間の合計は材片種別の行の累積和の差で求める
+    values = data.values
+    cumsum = np.zeros((values.shape[0] + 1, values.shape[1]))
+    np.cumsum(values * item_mask[:, np.newaxis], axis=0, out=cumsum[1:])
+    rows = np.array(check_rows)
+    expected = cumsum[rows + 1] - cumsum[np.array(check_starts)]
+    actual = values[rows]
+    return [
+        _inconsistency(data, check_kinds[k], check_rows[k], j, expected[k, j], actual[k, j])
+        for k, j in zip(*np.nonzero(np.abs(expected - actual) > tolerance), strict=True)
+    ]
+
+
+def _check_row_totals(data: _BlockData, tolerance: float) -> list[Inconsistency]:
+    """合計列を、ブロック内の総括表列の合計と比較する"""
+    if not data.cols:
+        return []
+    expected = data.values[:, 1:].sum(axis=1)
+    actual = data.values[:, 0]
+    return [
+        _inconsistency(data, CheckKind.ROW_TOTAL, i, 0, expected[i], actual[i])
+        for i in np.flatnonzero(np.abs(expected - actual) > tolerance)
+    ]
+
+
+def _check_rollups(blocks: Sequence[_BlockData], tolerance: float) -> list[Inconsistency]:
+    """総括表列を、子階層のブロックの総括表列の合計と比較する"""
+    # 総括表列からブロックと数値の列番号への辞書
+    positions: dict[SummaryColumn, tuple[_BlockData, int]] = {}
+    for data in blocks:
+        for j, col in enumerate(data.cols, start=1):
+            positions[col] = (data, j)
+
+    # 親階層の列毎に、子階層の合計を親のブロックの行に集計する
+    # (同じ親階層のブロックが複数存在する場合も1つの列にまとめる)
+    expected_by_parent: dict[SummaryColumn, np.ndarray] = {}
+    inconsistencies: list[Inconsistency] = []
+    for data in blocks:
+        parent = data.cols[0].parent if data.cols else None
+        if parent not in positions:
+            continue
+        parent_data, _ = positions[parent]
+        expected = expected_by_parent.get(parent)
+        if expected is None:
+            expected = expected_by_parent[parent] = np.zeros(parent_data.values.shape[0])
+
+        child_sums = data.values[:, 1:].sum(axis=1)
+        label_rows = parent_data.label_rows
+        for i, (label, kind) in enumerate(zip(data.labels, data.kinds, strict=True)):
+            if kind is RowKind.SUBTOTAL:
+                continue
+            parent_row = label_rows.get(label)
+            if parent_row is not None:
+                expected[parent_row] += child_sums[i]
+            elif abs(child_sums[i]) > tolerance:
+                # 親階層に存在しない材片種別
+                inconsistencies.append(
+                    Inconsistency(CheckKind.ROLLUP, parent.level, parent.path, None, label, child_sums[i], 0.0)
+                )
+
+    for parent, expected in expected_by_parent.items():
+        parent_data, j = positions[parent]
+        rows = np.array(list(parent_data.label_rows.values()), dtype=np.intp)
+        actual = parent_data.values[rows, j]
+        for i in rows[np.abs(expected[rows] - actual) > tolerance]:
+            inconsistencies.append(
+                _inconsistency(parent_data, CheckKind.ROLLUP, i, j, expected[i], parent_data.values[i, j])
+            )
+    return inconsistencies
+
+
+def _inconsistency(
+    data: _BlockData, check: CheckKind, row: int, col: int, expected: float, actual: float
+) -> Inconsistency:
+    """ブロックの行・数値の列番号から `Inconsistency` を生成する"""
+    return Inconsistency(
+        check, data.block.level, data.col_path(col), int(row) + 1, data.labels[row], float(expected), float(actual)
+    )
+
+
+def _parse_values(rows: Sequence[Sequence[str]], indices: Sequence[int]) -> np.ndarray:
+    """
+    データ行の指定列を数値に変換した行列を返す (空のセル・数値でないセルは0)
+
+    全てのセルを `float` で一括変換し、変換できないセルが含まれる場合のみ `parse_number` で変換し直す
+    """
+    cells = list(chain.from_iterable(map(cells_getter(indices), rows)))
+    try:
+        values = np.fromiter(map(float, cells), dtype=np.float64, count=len(cells))
+    except ValueError:
+        values = np.fromiter((parse_number(cell) or 0 for cell in cells), dtype=np.float64, count=len(cells))
+    return values.reshape(len(rows), len(indices))
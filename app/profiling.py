@@ -0,0 +1,105 @@
+"""
+処理時間の計測とプロファイル出力
+
+`timed()` で囲んだ処理の所要時間と件数をログに出力し、`record_spans()` の範囲内では計測結果を収集する。
+環境変数 `MATE_SUMMARY_PROFILE` (またはCLIの `--profile`) に出力先を指定すると、読み込み処理の cProfile を出力する
+"""
+
+from __future__ import annotations
+
+import cProfile
+import logging
+import os
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import NamedTuple
+
+# cProfile の出力先を指定する環境変数
+PROFILE_ENV = "MATE_SUMMARY_PROFILE"
+
+logger = logging.getLogger(__name__)
+
+# 計測結果の収集先 (スレッド毎に独立する)
+_current_spans: ContextVar[list[TimingSpan] | None] = ContextVar("current_spans", default=None)
+
+
+class TimingSpan(NamedTuple):
+    """1処理分の計測結果"""
+
+    name: str
+    seconds: float
+    counts: dict[str, int]  # 処理した行数・列数など
+
+    def __str__(self) -> str:
+        counts = ", ".join(f"{key}={value}" for key, value in self.counts.items())
+        return f"{self.name} {self.seconds * 1000:.1f}ms" + (f" ({counts})" if counts else "")
+
+
+@contextmanager
+def timed(name: str, **counts: int) -> Iterator[dict[str, int]]:
+    """
+    処理時間を計測してログに出力する
+
+    件数は引数、または `with` 文で受け取った辞書に処理中に追加する
+    """
+    start = time.perf_counter()
+    try:
+        yield counts
+    finally:
+        span = TimingSpan(name, time.perf_counter() - start, counts)
+        logger.debug("%s", span)
+        spans = _current_spans.get()
+        if spans is not None:
+            spans.append(span)
+
+
+@contextmanager
+def record_spans() -> Iterator[list[TimingSpan]]:
+    """範囲内で計測した `TimingSpan` をリストに収集する"""
+    spans: list[TimingSpan] = []
+    token = _current_spans.set(spans)
+    try:
+        yield spans
+    finally:
+        _current_spans.reset(token)
+        if spans:
+            logger.info("処理時間: %s", format_spans(spans))
+
+
+def format_spans(spans: list[TimingSpan]) -> str:
+    """計測結果を処理名毎に合計し、`read 12ms / parse 30ms` の形式で返す"""
+    totals: dict[str, float] = {}
+    for span in spans:
+        totals[span.name] = totals.get(span.name, 0.0) + span.seconds
+    return " / ".join(f"{name} {seconds * 1000:.0f}ms" for name, seconds in totals.items())
+
+
+def profile_path_from_env() -> Path | None:
+    """環境変数に指定された cProfile の出力先を返す (未指定の場合は `None` を返す)"""
+    value = os.environ.get(PROFILE_ENV, "").strip()
+    return Path(value) if value else None
+
+
+@contextmanager
+def profile_to(output_path: Path | None) -> Iterator[None]:
+    """
+    範囲内の処理を cProfile で計測し、pstats 形式のファイルに出力する
+
+    `output_path` が `None` の場合は計測しない。計測対象は呼び出したスレッドのみ
+    """
+    if output_path is None:
+        yield
+        return
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        profiler.dump_stats(output_path)
+        logger.info("プロファイルを出力しました: %s", output_path)
@@ -3,7 +3,7 @@
 ################################################################################
 ## Form generated from reading UI file 'main_window.ui'
 ##
-## Created by: Qt User Interface Compiler version 6.10.1
+## Created by: Qt User Interface Compiler version 6.12.0
 ##
 ## WARNING! All changes made in this file will be lost when recompiling UI file!
 ################################################################################
@@ -16,13 +16,11 @@ from PySide6.QtGui import (QAction, QBrush, QColor, QConicalGradient,
     QIcon, QImage, QKeySequence, QLinearGradient,
     QPainter, QPalette, QPixmap, QRadialGradient,
     QTransform)
-from PySide6.QtWidgets import (QAbstractItemView, QApplication, QHeaderView, QMainWindow,
-    QMenu, QMenuBar, QPushButton, QSizePolicy,
-    QStatusBar, QTabWidget, QTableWidgetItem, QVBoxLayout,
-    QWidget)
+from PySide6.QtWidgets import (QApplication, QMainWindow, QMenu, QMenuBar,
+    QPushButton, QSizePolicy, QStatusBar, QTabWidget,
+    QVBoxLayout, QWidget)
 
 from app.views.components.file_selector import FileSelector
-from app.views.components.summary_table_widget import SummaryTableWidget
 
 class Ui_MainWindow(object):
     def setupUi(self, MainWindow):
@@ -35,6 +33,11 @@ class Ui_MainWindow(object):
         self.actionOpen.setObjectName(u"actionOpen")
         self.actionSaveAs = QAction(MainWindow)
         self.actionSaveAs.setObjectName(u"actionSaveAs")
+        self.actionCompare = QAction(MainWindow)
+        self.actionCompare.setObjectName(u"actionCompare")
+        self.actionClearCompare = QAction(MainWindow)
+        self.actionClearCompare.setObjectName(u"actionClearCompare")
+        self.actionClearCompare.setEnabled(False)
         self.actionExit = QAction(MainWindow)
         self.actionExit.setObjectName(u"actionExit")
         self.actionShowVersion = QAction(MainWindow)
@@ -59,58 +62,6 @@ class Ui_MainWindow(object):
         self.levelTabWidget.setTabPosition(QTabWidget.TabPosition.South)
         self.levelTabWidget.setTabShape(QTabWidget.TabShape.Triangular)
         self.levelTabWidget.setDocumentMode(True)
-        self.level1Tab = QWidget()
-        self.level1Tab.setObjectName(u"level1Tab")
-        self.level1TabLayout = QVBoxLayout(self.level1Tab)
-        self.level1TabLayout.setObjectName(u"level1TabLayout")
-        self.level1TabLayout.setContentsMargins(0, 0, 0, 0)
-        self.level1TableWidget = SummaryTableWidget(self.level1Tab)
-        self.level1TableWidget.setObjectName(u"level1TableWidget")
-        self.level1TableWidget.setStyleSheet(u"QTableWidget::item:selected { background: #316AC5; }")
-        self.level1TableWidget.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
-
-        self.level1TabLayout.addWidget(self.level1TableWidget)
-
-        self.levelTabWidget.addTab(self.level1Tab, "")
-        self.level2Tab = QWidget()
-        self.level2Tab.setObjectName(u"level2Tab")
-        self.level2TabLayout = QVBoxLayout(self.level2Tab)
-        self.level2TabLayout.setObjectName(u"level2TabLayout")
-        self.level2TabLayout.setContentsMargins(0, 0, 0, 0)
-        self.level2TableWidget = SummaryTableWidget(self.level2Tab)
-        self.level2TableWidget.setObjectName(u"level2TableWidget")
-        self.level2TableWidget.setStyleSheet(u"QTableWidget::item:selected { background: #316AC5; }")
-        self.level2TableWidget.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
-
-        self.level2TabLayout.addWidget(self.level2TableWidget)
-
-        self.levelTabWidget.addTab(self.level2Tab, "")
-        self.level3Tab = QWidget()
-        self.level3Tab.setObjectName(u"level3Tab")
-        self.level3TabLayout = QVBoxLayout(self.level3Tab)
-        self.level3TabLayout.setObjectName(u"level3TabLayout")
-        self.level3TabLayout.setContentsMargins(0, 0, 0, 0)
-        self.level3TableWidget = SummaryTableWidget(self.level3Tab)
-        self.level3TableWidget.setObjectName(u"level3TableWidget")
-        self.level3TableWidget.setStyleSheet(u"QTableWidget::item:selected { background: #316AC5; }")
-        self.level3TableWidget.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
-
-        self.level3TabLayout.addWidget(self.level3TableWidget)
-
-        self.levelTabWidget.addTab(self.level3Tab, "")
-        self.level4Tab = QWidget()
-        self.level4Tab.setObjectName(u"level4Tab")
-        self.level4TabLayout = QVBoxLayout(self.level4Tab)
-        self.level4TabLayout.setObjectName(u"level4TabLayout")
-        self.level4TabLayout.setContentsMargins(0, 0, 0, 0)
-        self.level4TableWidget = SummaryTableWidget(self.level4Tab)
-        self.level4TableWidget.setObjectName(u"level4TableWidget")
-        self.level4TableWidget.setStyleSheet(u"QTableWidget::item:selected { background: #316AC5; }")
-        self.level4TableWidget.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
-
-        self.level4TabLayout.addWidget(self.level4TableWidget)
-
-        self.levelTabWidget.addTab(self.level4Tab, "")
 
         self.centralLayout.addWidget(self.levelTabWidget)
 
@@ -138,14 +89,15 @@ class Ui_MainWindow(object):
         self.menubar.addAction(self.helpMenu.menuAction())
         self.fileMenu.addAction(self.actionOpen)
         self.fileMenu.addAction(self.actionSaveAs)
+        self.fileMenu.addSeparator()
+        self.fileMenu.addAction(self.actionCompare)
+        self.fileMenu.addAction(self.actionClearCompare)
+        self.fileMenu.addSeparator()
         self.fileMenu.addAction(self.actionExit)
         self.helpMenu.addAction(self.actionShowVersion)
 
         self.retranslateUi(MainWindow)
 
-        self.levelTabWidget.setCurrentIndex(3)
-
-
         QMetaObject.connectSlotsByName(MainWindow)
     # setupUi
 
@@ -159,16 +111,14 @@ class Ui_MainWindow(object):
 #if QT_CONFIG(shortcut)
         self.actionSaveAs.setShortcut(QCoreApplication.translate("MainWindow", u"Ctrl+S", None))
 #endif // QT_CONFIG(shortcut)
+        self.actionCompare.setText(QCoreApplication.translate("MainWindow", u"\u5909\u66f4\u524d\u3068\u6bd4\u8f03...", None))
+        self.actionClearCompare.setText(QCoreApplication.translate("MainWindow", u"\u6bd4\u8f03\u3092\u89e3\u9664", None))
         self.actionExit.setText(QCoreApplication.translate("MainWindow", u"\u7d42\u4e86", None))
 #if QT_CONFIG(shortcut)
         self.actionExit.setShortcut(QCoreApplication.translate("MainWindow", u"Ctrl+Q", None))
 #endif // QT_CONFIG(shortcut)
         self.actionShowVersion.setText(QCoreApplication.translate("MainWindow", u"\u30d0\u30fc\u30b8\u30e7\u30f3\u60c5\u5831...", None))
-        self.levelTabWidget.setTabText(self.levelTabWidget.indexOf(self.level1Tab), QCoreApplication.translate("MainWindow", u"#1\u30ec\u30d9\u30eb", None))
-        self.levelTabWidget.setTabText(self.levelTabWidget.indexOf(self.level2Tab), QCoreApplication.translate("MainWindow", u"#2\u30ec\u30d9\u30eb", None))
-        self.levelTabWidget.setTabText(self.levelTabWidget.indexOf(self.level3Tab), QCoreApplication.translate("MainWindow", u"#3\u30ec\u30d9\u30eb", None))
-        self.levelTabWidget.setTabText(self.levelTabWidget.indexOf(self.level4Tab), QCoreApplication.translate("MainWindow", u"#4\u30ec\u30d9\u30eb", None))
-        self.saveButton.setText(QCoreApplication.translate("MainWindow", u"CSV\u30d5\u30a1\u30a4\u30eb\u3068\u3057\u3066\u4fdd\u5b58...", None))
+        self.saveButton.setText(QCoreApplication.translate("MainWindow", u"\u540d\u524d\u3092\u4ed8\u3051\u3066\u4fdd\u5b58...", None))
         self.fileMenu.setTitle(QCoreApplication.translate("MainWindow", u"\u30d5\u30a1\u30a4\u30eb", None))
         self.helpMenu.setTitle(QCoreApplication.translate("MainWindow", u"\u30d8\u30eb\u30d7", None))
     # retranslateUi
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+from typing import Any, override
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, QPersistentModelIndex, Qt
+from PySide6.QtGui import QColor
+
+from app.models.summary_diff import CellDiff, DiffKind, SummaryDiff
+from app.models.summary_schema import TOTAL_COL_NAME
+from app.models.summary_sheet import SummaryColumn, SummaryProps, SummarySheet
+
+RIGHT_ALIGNMENT = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+# 比較表示の背景色
+DIFF_COLORS = {
+    DiffKind.ADDED: QColor("#d8f5d8"),
+    DiffKind.REMOVED: QColor("#f8d8d8"),
+    DiffKind.CHANGED: QColor("#fff2c0"),
+}
+
+
+class SummaryTableModel(QAbstractTableModel):
+    """
+    総括表の指定レベルを表示するテーブルモデル
+
+    セルの値は `SummarySheet` から表示時に取得し、テーブル全体を事前に生成しない
+    """
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._summary_sheet: SummarySheet | None = None
+        self._level = 1
+        self._props_group: tuple[SummaryProps, ...] = ()
+        self._columns: tuple[SummaryColumn, ...] = ()
+        self._total_col: list[str] = []
+        self._header_labels: list[str] = []
+        # 右揃えにする列の開始インデックス (合計列以降)
+        self._right_align_col_start = 0
+        # 比較表示する差分と、追加された材片種別
+        self._diff: SummaryDiff | None = None
+        self._added_props: frozenset[SummaryProps] = frozenset()
+
+    @property
+    def summary_sheet(self) -> SummarySheet | None:
+        """表示中の総括表"""
+        return self._summary_sheet
+
+    @property
+    def level(self) -> int:
+        """表示中の階層レベル"""
+        return self._level
+
+    @property
+    def diff(self) -> SummaryDiff | None:
+        """比較表示中の差分"""
+        return self._diff
+
+    def set_summary_sheet(self, summary_sheet: SummarySheet | None, level: int) -> None:
+        """表示する総括表と階層レベルを設定する (比較表示は解除する)"""
+        self.beginResetModel()
+        self._summary_sheet = summary_sheet
+        self._level = level
+        self._diff = None
+        self._added_props = frozenset()
+        if summary_sheet is None:
+            self._props_group = ()
+            self._columns = ()
+            self._total_col = []
+            self._header_labels = []
+            self._right_align_col_start = 0
+        else:
+            self._props_group = summary_sheet.props_group
+            self._columns = tuple(summary_sheet.cols_by_level.get(level, []))
+            self._total_col = summary_sheet.total_col.data
+            self._header_labels = [
+                *summary_sheet.header_rows[0],
+                summary_sheet.total_col.name,
+                *(col.name for col in self._columns),
+            ]
+            self._right_align_col_start = len(summary_sheet.schema.key_cols)
+        self.endResetModel()
+
+    def set_diff(self, diff: SummaryDiff | None) -> None:
+        """変更されたセルと追加された材片種別を強調表示する (`None` で解除)"""
+        self._diff = diff
+        if diff is None:
+            self._added_props = frozenset()
+        else:
+            self._added_props = frozenset(row.props for row in diff.rows if row.kind is DiffKind.ADDED)
+        if self.rowCount() and self.columnCount():
+            roles = [Qt.ItemDataRole.BackgroundRole, Qt.ItemDataRole.ToolTipRole]
+            self.dataChanged.emit(self.index(0, 0), self.index(self.rowCount() - 1, self.columnCount() - 1), roles)
+
+    @override
+    def rowCount(self, parent: QModelIndex | QPersistentModelIndex | None = None) -> int:
+        if parent is not None and parent.isValid():
+            return 0
+        return len(self._props_group)
+
+    @override
+    def columnCount(self, parent: QModelIndex | QPersistentModelIndex | None = None) -> int:
+        if parent is not None and parent.isValid():
+            return 0
+        return len(self._header_labels)
+
+    @override
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self._header_labels[section]
+        return str(section + 1)
+
+    @override
+    def data(self, index: QModelIndex | QPersistentModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.cell_text(index.row(), index.column())
+        if role == Qt.ItemDataRole.TextAlignmentRole and index.column() >= self._right_align_col_start:
+            return RIGHT_ALIGNMENT
+        if self._diff is not None and role in (Qt.ItemDataRole.BackgroundRole, Qt.ItemDataRole.ToolTipRole):
+            return self._diff_data(index.row(), index.column(), role)
+        return None
+
+    def cell_text(self, row: int, column: int) -> str:
+        """セルの表示文字列を返す"""
+        props = self._props_group[row]
+        props_values = props.values()
+
+        # ヘッダー列 (材質, 形状, 寸法)
+        if column < len(props_values):
+            return props_values[column]
+
+        # 合計列
+        if column == len(props_values):
+            return self._total_col[row]
+
+        # 総括表列
+        summary_col = self._columns[column - len(props_values) - 1]
+        item = summary_col.items.get(props)
+        return item.value if item else ""
+
+    def cell_diff(self, row: int, column: int) -> CellDiff | None:
+        """セルの差分を返す (比較表示中でない場合・変更のないセルは `None`)"""
+        if self._diff is None:
+            return None
+        key_count = self._right_align_col_start
+        if column < key_count:
+            return None
+        path = TOTAL_COL_NAME if column == key_count else self._columns[column - key_count - 1].path
+        return self._diff.cell(path, self._props_group[row])
+
+    def _diff_data(self, row: int, column: int, role: int) -> Any:
+        """比較表示の背景色・ツールチップを返す"""
+        cell = self.cell_diff(row, column)
+        if cell is not None:
+            if role == Qt.ItemDataRole.BackgroundRole:
+                return DIFF_COLORS[cell.kind]
+            tooltip = f"{cell.kind.value}: 変更前 {cell.old_value or '-'}"
+            return f"{tooltip} ({cell.delta_text})" if cell.delta_text else tooltip
+        # 追加された材片種別はヘッダー列を強調する
+        if column < self._right_align_col_start and self._props_group[row] in self._added_props:
+            if role == Qt.ItemDataRole.BackgroundRole:
+                return DIFF_COLORS[DiffKind.ADDED]
+            return f"{DiffKind.ADDED.value}された材片種別"
+        return None
@@ -0,0 +1,55 @@
+from PySide6.QtWidgets import QAbstractItemView, QHeaderView, QTableView, QWidget
+
+from app.models.summary_diff import SummaryDiff
+from app.models.summary_sheet import SummarySheet
+from app.profiling import timed
+from app.views.components.summary_table_model import SummaryTableModel
+
+
+class SummaryTableView(QTableView):
+    """総括表を表示するテーブルビュー"""
+
+    def __init__(self, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self.summary_model = SummaryTableModel(self)
+        self.setModel(self.summary_model)
+        self.setStyleSheet("QTableView::item:selected { background: #316AC5; }")
+        self.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+
+        # 行の高さを一括で固定する
+        self._configure_row_heights(22)
+
+    def populate(self, summary_sheet: SummarySheet, level: int) -> None:
+        """総括表の指定レベルをテーブルに設定する"""
+        with timed("populate", level=level) as counts:
+            self.summary_model.set_summary_sheet(summary_sheet, level)
+
+            # 列幅の設定
+            self._configure_column_widths([100, 50, 120], 60)
+            counts["rows"] = self.summary_model.rowCount()
+            counts["cols"] = self.summary_model.columnCount()
+
+    def set_diff(self, diff: SummaryDiff | None) -> None:
+        """差分を強調表示する (`None` で解除)"""
+        self.summary_model.set_diff(diff)
+
+    def clear(self) -> None:
+        """テーブルの表示内容を消去する"""
+        self.summary_model.set_summary_sheet(None, self.summary_model.level)
+
+    def _configure_column_widths(self, widths: list[int], default_width: int | None = None) -> None:
+        """列幅を設定する"""
+        # デフォルト列幅を一括設定
+        if default_width:
+            self.horizontalHeader().setDefaultSectionSize(default_width)
+
+        # 指定された列幅を個別に設定
+        for col_index, width in enumerate(widths):
+            if col_index < self.summary_model.columnCount():
+                self.setColumnWidth(col_index, width)
+
+    def _configure_row_heights(self, height: int) -> None:
+        """行の高さを設定する"""
+        vertical_header = self.verticalHeader()
+        vertical_header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        vertical_header.setDefaultSectionSize(height)
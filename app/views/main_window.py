@@ -1,9 +1,59 @@
-from PySide6.QtWidgets import QMainWindow
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from PySide6.QtCore import QSignalBlocker
+from PySide6.QtWidgets import QMainWindow, QVBoxLayout, QWidget
 
 from app.ui.ui_main_window import Ui_MainWindow
+from app.views.components.summary_table_view import SummaryTableView
 
 
 class MainWindow(QMainWindow, Ui_MainWindow):
     def __init__(self, parent: QMainWindow | None = None) -> None:
         super().__init__(parent)
         self.setupUi(self)
+        # レベル毎のテーブル (総括表のレベル数に合わせてタブを生成する)
+        self.level_table_views: dict[int, SummaryTableView] = {}
+
+    @property
+    def levels(self) -> list[int]:
+        """タブのレベル一覧 (タブの並び順)"""
+        return list(self.level_table_views)
+
+    @property
+    def current_level(self) -> int | None:
+        """表示中のタブのレベル (タブがない場合は `None`)"""
+        index = self.levelTabWidget.currentIndex()
+        return self.levels[index] if index >= 0 else None
+
+    def set_current_level(self, level: int) -> None:
+        """指定レベルのタブを表示する"""
+        self.levelTabWidget.setCurrentIndex(self.levels.index(level))
+
+    def set_levels(self, levels: Sequence[int]) -> None:
+        """
+        レベル毎のタブを生成する
+
+        レベル構成が変わらない場合は既存のタブを再利用する。タブの切り替えは通知しない
+        """
+        if list(levels) == self.levels:
+            return
+        with QSignalBlocker(self.levelTabWidget):
+            while self.levelTabWidget.count():
+                tab = self.levelTabWidget.widget(0)
+                self.levelTabWidget.removeTab(0)
+                tab.deleteLater()
+            self.level_table_views.clear()
+            for level in levels:
+                self.level_table_views[level] = self._add_level_tab(level)
+
+    def _add_level_tab(self, level: int) -> SummaryTableView:
+        """レベルのタブとテーブルを追加する"""
+        tab = QWidget()
+        layout = QVBoxLayout(tab)
+        layout.setContentsMargins(0, 0, 0, 0)
+        table_view = SummaryTableView(tab)
+        layout.addWidget(table_view)
+        self.levelTabWidget.addTab(tab, f"#{level}レベル")
+        return table_view
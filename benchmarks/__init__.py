@@ -0,0 +1,6 @@
+"""
+性能計測用のパッケージ
+
+合成した総括表CSVで読み込み・解析・出力・表示の処理時間とメモリ使用量を計測する
+(`python -m benchmarks.run`)
+"""
@@ -0,0 +1,171 @@
+"""
+合成した総括表CSVを生成するモジュール
+
+階層数・分岐数・最下層の列数・材片種別数を指定し、まてりあるの出力と同じ形式
+(cp932, 文字列セルのみ引用符で囲む) の鋼材重量総括表を生成する
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+from collections.abc import Iterable, Iterator, Sequence
+from pathlib import Path
+from typing import NamedTuple
+
+from app.io import ENCODING
+from app.io.csv_reader import CSVRow
+from app.io.parts_reader import PartsKey
+from app.models.summary_aggregator import SummaryAggregator
+from app.models.summary_schema import STEEL_KEY_COLS, STEEL_ROW_LABELS, STEEL_WEIGHT_SCHEMA, RowKind
+
+ROOT_NAME = "サンプル橋"
+# 寸法列の表示幅 (まてりあるは寸法を右寄せで出力する)
+DIMENSION_WIDTH = 5
+
+# 材片種別の候補 (区分, 材質, 形状)
+MATERIALS = ("SMA490BW", "SMA490AW", "SMA400AW", "SM490YB", "SM400A", "SS400")
+BOLT_MATERIALS = ("S10T", "F10T")
+# #2レベル名以下の列名の接頭辞
+LEVEL_PREFIXES = "BGCLM"
+
+
+class GeneratorParams(NamedTuple):
+    """総括表の生成条件"""
+
+    depth: int = 4  # 階層数 (#1~#nレベル名)
+    fan_out: int = 3  # 最下層以外の各階層の子階層数
+    leaf_columns: int = 8  # 最下層の各ブロックの列数
+    item_count: int = 60  # 材片種別数
+    items_per_leaf: int = 12  # 最下層の列毎の材片種別数
+    seed: int = 0
+
+    @property
+    def leaf_count(self) -> int:
+        """最下層の列数の合計"""
+        return self.fan_out ** (self.depth - 1) * self.leaf_columns
+
+
+def generate_summary_rows(params: GeneratorParams) -> list[CSVRow]:
+    """生成条件から総括表の行リスト (小計・中計・合計行を含む) を返す"""
+    if params.depth < 1 or params.fan_out < 1 or params.leaf_columns < 1:
+        raise ValueError(f"階層数・分岐数・列数には 1 以上を指定してください: {params}")
+
+    rng = random.Random(params.seed)
+    pool = _item_pool(params.item_count, rng)
+    aggregator = SummaryAggregator(ROOT_NAME, MATERIALS + BOLT_MATERIALS)
+    weights: dict[PartsKey, int] = {}
+    for path in _iter_leaf_paths(params):
+        for category, material, shape, dimensions, length in rng.sample(pool, min(params.items_per_leaf, len(pool))):
+            key = PartsKey(path, category, material, shape, dimensions, length)
+            weights[key] = rng.randint(1, 5000)
+    aggregator.add_weights(weights)
+    return aggregator.summary_rows()
+
+
+def write_summary_csv(rows: Iterable[Sequence[str]], output_path: Path) -> None:
+    """総括表の行リストをまてりあると同じ引用符の付け方でCSVファイルに書き込む"""
+    with output_path.open("w", encoding=ENCODING, newline="") as csv_file:
+        for row in rows:
+            csv_file.write(format_summary_line(row))
+            csv_file.write("\r\n")
+
+
+def format_summary_line(row: Sequence[str]) -> str:
+    """
+    総括表の1行をCSV形式の文字列に変換する
+
+    ヘッダー行は列名 (合計, 総括表列) のみ、データ行は階層名と材片種別 (形状毎の小計行の材質を含む) のみ引用符で囲み、
+    数値・空欄・小計などの行ラベルは囲まない
+    """
+    key_count = len(STEEL_KEY_COLS)
+    if row[0].endswith("レベル名"):
+        return ",".join([*row[: key_count + 1], *(_quote(cell) for cell in row[key_count + 1 :])])
+
+    key_cells = list(row[1 : key_count + 1])
+    if STEEL_WEIGHT_SCHEMA.classify(key_cells) is RowKind.ITEM:
+        key_cells[-1] = key_cells[-1].rjust(DIMENSION_WIDTH)
+    key_cells = [cell if cell in STEEL_ROW_LABELS else _quote(cell) for cell in key_cells]
+    return ",".join([_quote(row[0]), *key_cells, *row[key_count + 1 :]])
+
+
+def generate_summary_csv(output_path: Path, params: GeneratorParams | None = None) -> Path:
+    """総括表CSVファイルを生成してパスを返す"""
+    write_summary_csv(generate_summary_rows(params or GeneratorParams()), output_path)
+    return output_path
+
+
+def _iter_leaf_paths(params: GeneratorParams) -> Iterator[tuple[str, ...]]:
+    """最下層の列の階層パスを順に返す"""
+    indices: list[tuple[int, ...]] = [()]
+    for level in range(1, params.depth + 1):
+        count = params.leaf_columns if level == params.depth else params.fan_out
+        indices = [(*parent, i + 1) for parent in indices for i in range(count)]
+    for index in indices:
+        yield tuple(_column_name(index[:level]) for level in range(1, len(index) + 1))
+
+
+def _column_name(index: tuple[int, ...]) -> str:
+    """総括表列の名称 (同じ階層内で重複しない名称, 例: `G1-2-3`) を返す"""
+    if len(index) == 1:
+        return "上部構造" if index[0] == 1 else f"上部構造{index[0]}"
+    return LEVEL_PREFIXES[(len(index) - 2) % len(LEVEL_PREFIXES)] + "-".join(map(str, index[1:]))
+
+
+def _item_pool(count: int, rng: random.Random) -> list[tuple[str, str, str, tuple[str, ...], str]]:
+    """材片種別 (区分, 材質, 形状, 寸法1~4, 長さ) の候補を無作為に選ぶ"""
+    candidates = [
+        *(("大型", material, "PL", ("0", str(t), "0", "0"), "0") for material in MATERIALS for t in range(6, 101)),
+        *(("小型", "SS400", "L", (str(a), str(a), str(t), "0"), "0") for a in (75, 90, 100, 130) for t in (9, 10, 12)),
+        ("小型", "SS400", "CT", ("118", "176", "8", "8"), "0"),
+        *(
+            ("購入", material, "TCB", (str(d), "0", "0", "0"), str(length))
+            for material in BOLT_MATERIALS
+            for d in (20, 22, 24)
+            for length in range(50, 200, 5)
+        ),
+    ]
+    return rng.sample(candidates, min(count, len(candidates)))
+
+
+def _quote(cell: str) -> str:
+    """セルを引用符で囲む (空欄は囲まない)"""
+    if not cell:
+        return cell
+    return '"' + cell.replace('"', '""') + '"'
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """引数パーサーを生成する"""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.generate", description="合成した総括表CSVを生成する")
+    parser.add_argument("output", type=Path, help="出力ファイルパス")
+    add_generator_arguments(parser)
+    return parser
+
+
+def add_generator_arguments(parser: argparse.ArgumentParser) -> None:
+    """生成条件の引数を追加する"""
+    defaults = GeneratorParams()
+    parser.add_argument("--depth", type=int, default=defaults.depth, help="階層数")
+    parser.add_argument("--fan-out", type=int, default=defaults.fan_out, help="最下層以外の各階層の子階層数")
+    parser.add_argument("--leaf-columns", type=int, default=defaults.leaf_columns, help="最下層の各ブロックの列数")
+    parser.add_argument("--items", type=int, default=defaults.item_count, help="材片種別数")
+    parser.add_argument("--items-per-leaf", type=int, default=defaults.items_per_leaf, help="最下層の列毎の材片種別数")
+    parser.add_argument("--seed", type=int, default=defaults.seed, help="乱数シード")
+
+
+def params_from_args(args: argparse.Namespace) -> GeneratorParams:
+    """引数から生成条件を返す"""
+    return GeneratorParams(args.depth, args.fan_out, args.leaf_columns, args.items, args.items_per_leaf, args.seed)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    params = params_from_args(args)
+    generate_summary_csv(args.output, params)
+    print(f"{args.output} ({params.leaf_count} 列)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
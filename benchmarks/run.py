@@ -0,0 +1,215 @@
+"""
+総括表の処理時間とメモリ使用量を計測するモジュール
+
+合成した総括表CSV (または指定したCSVファイル) で各処理を計測し、結果をJSONファイルに書き込む。
+`--compare` に以前の結果を指定すると、処理毎の時間の比率を表示する
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable, Sequence
+from datetime import datetime
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from app.io.csv_handler import level_csv_filename, write_csv
+from app.io.csv_reader import CSVReader
+from app.io.xlsx_handler import write_xlsx, xlsx_filename
+from app.models.csv_data import CSVData
+from app.models.summary_sheet import SummarySheet
+from benchmarks.generate import GeneratorParams, add_generator_arguments, generate_summary_csv, params_from_args
+
+# 結果ファイルの形式のバージョン
+RESULT_VERSION = 1
+
+
+class BenchmarkResult(NamedTuple):
+    """1処理分の計測結果"""
+
+    name: str
+    seconds_min: float
+    seconds_median: float
+    peak_bytes: int  # tracemalloc で計測したメモリ使用量の最大値
+
+    def as_dict(self) -> dict[str, Any]:
+        """JSON出力用の辞書を返す"""
+        return self._asdict()
+
+
+def measure(name: str, func: Callable[[], object], repeat: int = 3) -> BenchmarkResult:
+    """
+    処理時間とメモリ使用量を計測する
+
+    処理時間は `repeat` 回の計測の最小値と中央値、メモリ使用量は別途1回実行して計測する
+    (tracemalloc の計測中は処理が遅くなるため、時間の計測とは分ける)
+    """
+    timings: list[float] = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return BenchmarkResult(name, min(timings), statistics.median(timings), peak)
+
+
+def run_benchmarks(csv_path: Path, output_dir: Path, repeat: int = 3, gui: bool = True) -> list[BenchmarkResult]:
+    """総括表CSVの読み込みから出力・表示までの各処理を計測する"""
+    rows = CSVReader(csv_path).load()
+    summary_sheet = SummarySheet.load_from_csv(csv_path)
+    levels = sorted(summary_sheet.cols_by_level)
+
+    def csv_data_all_levels() -> None:
+        for level in levels:
+            summary_sheet.display_level = level
+            _ = summary_sheet.csv_data
+
+    def export_csv() -> None:
+        for level in levels:
+            write_csv(summary_sheet.iter_csv_rows(level), output_dir / level_csv_filename(csv_path.stem, level))
+
+    benchmarks: list[tuple[str, Callable[[], object]]] = [
+        ("read", lambda: CSVReader(csv_path).load()),
+        ("parse", lambda: SummarySheet(rows, csv_path)),
+        ("load", lambda: SummarySheet.load_from_csv(csv_path)),
+        ("validate", summary_sheet.validate),
+        ("csv_data_load", lambda: CSVData.load_from_csv(csv_path)),
+        ("csv_data_all_levels", csv_data_all_levels),
+        ("export_csv", export_csv),
+        ("export_xlsx", lambda: write_xlsx(summary_sheet, output_dir / xlsx_filename(csv_path.stem))),
+    ]
+    results = [measure(name, func, repeat) for name, func in benchmarks]
+    if gui:
+        results.extend(_run_gui_benchmarks(summary_sheet, levels, repeat))
+    return results
+
+
+def write_results(
+    results: Sequence[BenchmarkResult], output_path: Path, csv_path: Path, params: GeneratorParams | None
+) -> dict[str, Any]:
+    """計測結果をJSONファイルに書き込み、書き込んだ内容を返す"""
+    data = {
+        "version": RESULT_VERSION,
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "input": {
+            "path": str(csv_path),
+            "size_bytes": csv_path.stat().st_size,
+            "params": params._asdict() if params is not None else None,
+        },
+        "results": [result.as_dict() for result in results],
+    }
+    output_path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+    return data
+
+
+def compare_results(current: dict[str, Any], previous: dict[str, Any]) -> list[str]:
+    """以前の計測結果と比較した処理時間 (最小値) の比率を行毎に返す"""
+    previous_results = {result["name"]: result for result in previous.get("results", [])}
+    lines: list[str] = []
+    for result in current["results"]:
+        before = previous_results.get(result["name"])
+        if before is None or not before["seconds_min"]:
+            continue
+        ratio = result["seconds_min"] / before["seconds_min"]
+        lines.append(
+            f"{result['name']:<24} {before['seconds_min']:9.4f}s -> {result['seconds_min']:9.4f}s (x{ratio:.2f})"
+        )
+    return lines
+
+
+def _run_gui_benchmarks(summary_sheet: SummarySheet, levels: Sequence[int], repeat: int) -> list[BenchmarkResult]:
+    """オフスクリーンでテーブルの表示処理を計測する (PySide6 が利用できない場合は計測しない)"""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    try:
+        from PySide6.QtWidgets import QApplication
+
+        from app.views.components.summary_table_view import SummaryTableView
+    except ImportError:
+        return []
+
+    _app = QApplication.instance() or QApplication([])
+    view = SummaryTableView()
+    view.resize(1280, 800)
+
+    def populate_all_levels() -> None:
+        for level in levels:
+            view.populate(summary_sheet, level)
+            # 表示範囲のセルを描画する
+            view.grab()
+
+    return [measure("table_populate_all_levels", populate_all_levels, repeat)]
+
+
+def _git_commit() -> str | None:
+    """計測したコミットのハッシュを返す (git が利用できない場合は `None` を返す)"""
+    try:
+        completed = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True, timeout=10
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return completed.stdout.strip() or None
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """引数パーサーを生成する"""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.run", description="総括表の処理性能を計測する")
+    parser.add_argument("-o", "--output", type=Path, default=Path("benchmark.json"), help="計測結果のJSONファイル")
+    parser.add_argument("-i", "--input", type=Path, help="計測に使用する総括表CSV (省略時は合成したCSVを使用)")
+    parser.add_argument("-r", "--repeat", type=int, default=3, help="計測の繰り返し回数")
+    parser.add_argument("--compare", type=Path, help="比較する以前の計測結果のJSONファイル")
+    parser.add_argument("--no-gui", action="store_true", help="テーブル表示の計測を行わない")
+    add_generator_arguments(parser)
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        work_dir = Path(temp_dir)
+        params: GeneratorParams | None = None
+        csv_path: Path = args.input
+        if csv_path is None:
+            params = params_from_args(args)
+            csv_path = generate_summary_csv(work_dir / "合成鋼材重量総括表.csv", params)
+
+        results = run_benchmarks(csv_path, work_dir, args.repeat, gui=not args.no_gui)
+        data = write_results(results, args.output, csv_path, params)
+
+    for result in results:
+        print(
+            f"{result.name:<24} min {result.seconds_min:9.4f}s  median {result.seconds_median:9.4f}s  "
+            f"peak {result.peak_bytes / 1e6:8.1f} MB"
+        )
+    if args.compare is not None:
+        previous = json.loads(args.compare.read_text(encoding="utf-8"))
+        print(f"--- {args.compare} との比較")
+        for line in compare_results(data, previous):
+            print(line)
+    print(f"計測結果を書き込みました: {args.output}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,47 @@
+from pathlib import Path
+
+from app.io.csv_reader import CSVReader
+from app.models.summary_schema import RowKind
+from app.models.summary_sheet import SummarySheet
+from benchmarks.generate import GeneratorParams, format_summary_line, generate_summary_csv
+from benchmarks.run import compare_results
+
+
+def test_generate_summary_csv_指定した階層構成の総括表を生成(tmp_path: Path):
+    params = GeneratorParams(depth=4, fan_out=2, leaf_columns=3, item_count=10, items_per_leaf=4)
+    csv_path = generate_summary_csv(tmp_path / "鋼材重量総括表.csv", params)
+
+    summary_sheet = SummarySheet.load_from_csv(csv_path)
+    assert {level: len(cols) for level, cols in summary_sheet.cols_by_level.items()} == {1: 2, 2: 4, 3: 8, 4: 24}
+    assert len(summary_sheet.cols_by_level[4]) == params.leaf_count
+    # 中計・合計行を除いた材片種別数
+    items = [
+        props for props in summary_sheet.props_group if summary_sheet.schema.classify(props.values()) is RowKind.ITEM
+    ]
+    assert len(items) == 10
+    assert next(CSVReader(csv_path).iter_rows())[:5] == ["#1レベル名", "材質", "形状", "寸法", "合計"]
+    # 小計・中計・合計行と下位レベルの合計が整合する
+    assert summary_sheet.validate() == []
+
+
+def test_generate_summary_csv_まてりあると同じ引用符の付け方(tmp_path: Path):
+    params = GeneratorParams(depth=1, fan_out=1, leaf_columns=1, item_count=1, items_per_leaf=1)
+    csv_path = generate_summary_csv(tmp_path / "鋼材重量総括表.csv", params)
+
+    lines = csv_path.read_text(encoding="cp932").splitlines()
+    assert lines[0] == '#1レベル名,材質,形状,寸法,"合計","上部構造"'
+    assert lines[1].startswith('"サンプル橋","')
+    assert lines[-1].startswith('"サンプル橋",合計,,,')
+
+
+def test_format_summary_line_形状毎の小計行は材質を引用符で囲む():
+    row = ["主構造", "SM400A", "小計", "", "198", "198", "0", "0"]
+    assert format_summary_line(row) == '"主構造","SM400A",小計,,198,198,0,0'
+
+
+def test_compare_results_処理時間の比率():
+    previous = {"results": [{"name": "load", "seconds_min": 2.0}]}
+    current = {"results": [{"name": "load", "seconds_min": 1.0}, {"name": "parse", "seconds_min": 1.0}]}
+    lines = compare_results(current, previous)
+    assert len(lines) == 1
+    assert lines[0].endswith("(x0.50)")
@@ -0,0 +1,25 @@
+import csv
+from pathlib import Path
+
+from app.cli import run_cli
+from app.io import ENCODING
+
+
+def test_checkコマンドは不整合の有無を終了コードで返す(summary_csv_path: Path, tmp_path: Path, capsys):
+    assert run_cli(["check", str(summary_csv_path)]) == 0
+
+    with summary_csv_path.open(encoding=ENCODING, newline="") as f:
+        rows = list(csv.reader(f))
+    # 最上位レベルの上部構造列の最初の小計行を変更
+    rows[2][5] = "165"
+    invalid_path = tmp_path / "鋼材重量総括表.csv"
+    with invalid_path.open("w", encoding=ENCODING, newline="") as f:
+        csv.writer(f).writerows(rows)
+
+    capsys.readouterr()
+    assert run_cli(["check", str(summary_csv_path), str(invalid_path)]) == 1
+    output = capsys.readouterr().out
+    assert f"{invalid_path}: 不整合 2件" in output
+    assert "[小計] レベル1 上部構造 2行目 (小計): 期待値 166 / 実際 165" in output
+
+    assert run_cli(["check", str(tmp_path / "存在しない.csv")]) == 2
@@ -0,0 +1,90 @@
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from app.cli import convert
+from app.cli.convert import ConvertResult, collect_input_files, convert_file, convert_files
+from app.models.summary_cache import summary_cache
+
+
+def _exit_on_crash_path(input_path: Path, output_dir: Path | None = None, output_format: str = "csv") -> ConvertResult:
+    """ファイル名が `crash` で始まる場合にワーカープロセスを異常終了させる変換関数"""
+    if input_path.name.startswith("crash"):
+        os._exit(1)
+    return ConvertResult(input_path)
+
+
+def test_collect_input_files_ディレクトリとグロブの展開(summary_csv_path: Path):
+    # ディレクトリ指定とグロブ指定で同じファイルが重複しない
+    paths = collect_input_files(["tests/data", "tests/data/*総括表*.csv"])
+    assert summary_csv_path in paths
+    assert len(paths) == len(set(paths))
+    assert all(path.suffix == ".csv" for path in paths)
+
+
+def test_convert_file_レベル毎にCSVを出力(summary_csv_path: Path, tmp_path: Path):
+    result = convert_file(summary_csv_path, tmp_path)
+    assert result.ok
+    assert [path.name for path in result.output_paths] == [
+        "鋼材重量総括表_#1レベル名.csv",
+        "鋼材重量総括表_#2レベル名.csv",
+        "鋼材重量総括表_#3レベル名.csv",
+        "鋼材重量総括表_#4レベル名.csv",
+    ]
+    assert all(path.exists() for path in result.output_paths)
+
+
+def test_convert_files_失敗したファイルを分離(summary_csv_path: Path, tmp_path: Path):
+    broken_path = tmp_path / "broken.csv"
+    broken_path.write_text("a,b,c\n", encoding="utf-8")
+
+    report = convert_files([summary_csv_path, broken_path], tmp_path / "out", jobs=2)
+    assert len(report.succeeded) == 1
+    assert len(report.failed) == 1
+    assert report.failed[0].input_path == broken_path
+    assert report.files_per_sec > 0
+
+
+def test_convert_files_ワーカープロセスの異常終了を失敗として集計(
+    summary_csv_path: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(convert, "convert_file", _exit_on_crash_path)
+    crash_path = tmp_path / "crash.csv"
+
+    report = convert_files([summary_csv_path, crash_path], tmp_path / "out", jobs=2)
+    assert len(report.results) == 2
+    assert crash_path in [result.input_path for result in report.failed]
+    assert all("BrokenProcessPool" in (result.error or "") for result in report.failed)
+
+
+def test_convert_file_監視モード以外はキャッシュを使用しない(summary_csv_path: Path, tmp_path: Path):
+    input_path = tmp_path / summary_csv_path.name
+    shutil.copy(summary_csv_path, input_path)
+    misses = summary_cache.stats().misses
+    assert convert_file(input_path, tmp_path / "out").ok
+    assert summary_cache.stats().misses == misses
+
+    assert convert_file(input_path, tmp_path / "out", use_cache=True).ok
+    assert summary_cache.stats().misses == misses + 1
+
+
+def test_convertコマンドはPySide6を読み込まない(summary_csv_path: Path, tmp_path: Path):
+    code = (
+        "import sys; from app.__main__ import main; "
+        f"rc = main(['convert', {str(summary_csv_path)!r}, '-o', {str(tmp_path)!r}, '-j', '1']); "
+        "assert 'PySide6' not in sys.modules; sys.exit(rc)"
+    )
+    completed = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert completed.returncode == 0, completed.stderr
+    assert "files/sec" in completed.stdout
+
+
+def test_convert_file_Excelファイルを出力(summary_csv_path: Path, tmp_path: Path):
+    result = convert_file(summary_csv_path, tmp_path, "xlsx")
+    assert result.ok
+    assert [path.name for path in result.output_paths] == ["鋼材重量総括表.xlsx"]
+    assert result.output_paths[0].exists()
@@ -0,0 +1,34 @@
+import csv
+from pathlib import Path
+
+from app.cli import run_cli
+from app.io import ENCODING
+
+
+def test_diffコマンドは差分の有無を終了コードで返す(summary_csv_path: Path, tmp_path: Path):
+    with summary_csv_path.open(encoding=ENCODING, newline="") as f:
+        rows = list(csv.reader(f))
+    # 主構造ブロックの主桁列の値を変更
+    rows[50][5] = "8"
+    new_path = tmp_path / "変更後.csv"
+    with new_path.open("w", encoding=ENCODING, newline="") as f:
+        csv.writer(f).writerows(rows)
+
+    assert run_cli(["diff", str(summary_csv_path), str(summary_csv_path)]) == 0
+
+    output_path = tmp_path / "差分.csv"
+    assert run_cli(["diff", str(summary_csv_path), str(new_path), "-o", str(output_path)]) == 1
+    with output_path.open(encoding=ENCODING, newline="") as f:
+        assert list(csv.reader(f))[1] == [
+            "セル",
+            "変更",
+            "上部構造/主構造/主桁",
+            "SM400A",
+            "PL",
+            "22.0",
+            "7",
+            "8",
+            "+1",
+        ]
+
+    assert run_cli(["diff", str(summary_csv_path), str(tmp_path / "存在しない.csv")]) == 2
@@ -0,0 +1,11 @@
+from pathlib import Path
+
+from app.cli import run_cli
+
+
+def test_mergeコマンドは統合した総括表を出力(summary_csv_path: Path, tmp_path: Path):
+    rc = run_cli(["merge", str(summary_csv_path), str(summary_csv_path), "-o", str(tmp_path), "-j", "1"])
+    assert rc == 0
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        f"統合_鋼材重量総括表_#{level}レベル名.csv" for level in range(1, 6)
+    ]
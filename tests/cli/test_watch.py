@@ -0,0 +1,83 @@
+import os
+import shutil
+import threading
+from pathlib import Path
+
+from app.cli.watch import DirectoryWatcher, scan_directory, watch
+
+
+def test_scan_directory_変換結果と隠しファイルを除外(tmp_path: Path):
+    (tmp_path / "sub").mkdir()
+    (tmp_path / ".hidden").mkdir()
+    for name in [
+        "鋼材重量総括表.csv",
+        "sub/塗装総括表.csv",
+        "鋼材重量総括表_#1レベル名.csv",
+        "memo.txt",
+        ".hidden/a.csv",
+    ]:
+        (tmp_path / name).write_text("x", encoding="utf-8")
+
+    snapshot = scan_directory(tmp_path)
+    assert sorted(Path(path).relative_to(tmp_path).as_posix() for path in snapshot) == [
+        "sub/塗装総括表.csv",
+        "鋼材重量総括表.csv",
+    ]
+    assert snapshot[str(tmp_path / "鋼材重量総括表.csv")][1] == 1
+
+
+def test_DirectoryWatcher_更新が止まってから変更を返す(tmp_path: Path):
+    csv_path = tmp_path / "鋼材重量総括表.csv"
+    csv_path.write_text("a", encoding="utf-8")
+    watcher = DirectoryWatcher(tmp_path, settle=1.0)
+    assert watcher.baseline() == 1
+    assert watcher.poll(now=0.0) == []
+
+    # 書き込み中 (サイズが変化し続ける) の間は返さない
+    csv_path.write_text("ab", encoding="utf-8")
+    assert watcher.poll(now=10.0) == []
+    csv_path.write_text("abc", encoding="utf-8")
+    assert watcher.poll(now=10.5) == []
+    assert watcher.pending_count == 1
+
+    # 待機時間が経過した後に1回だけ返す
+    assert watcher.poll(now=11.0) == []
+    assert watcher.poll(now=11.5) == [csv_path]
+    assert watcher.poll(now=20.0) == []
+
+
+def test_DirectoryWatcher_更新日時のみの変更も検出(tmp_path: Path):
+    csv_path = tmp_path / "鋼材重量総括表.csv"
+    csv_path.write_text("a", encoding="utf-8")
+    watcher = DirectoryWatcher(tmp_path, settle=0.0)
+    watcher.baseline()
+
+    mtime_ns = csv_path.stat().st_mtime_ns + 10**9
+    os.utime(csv_path, ns=(mtime_ns, mtime_ns))
+    assert watcher.poll(now=0.0) == []
+    assert watcher.poll(now=0.0) == [csv_path]
+
+
+def test_watch_起動時のファイルを変換(summary_csv_path: Path, tmp_path: Path):
+    input_dir = tmp_path / "input"
+    output_dir = tmp_path / "output"
+    input_dir.mkdir()
+    shutil.copyfile(summary_csv_path, input_dir / summary_csv_path.name)
+
+    stop_event = threading.Event()
+    thread = threading.Thread(
+        target=watch,
+        args=(input_dir, output_dir),
+        kwargs={"interval": 0.05, "settle": 0.1, "initial": True, "stop_event": stop_event},
+    )
+    thread.start()
+    try:
+        output_path = output_dir / "鋼材重量総括表_#4レベル名.csv"
+        for _ in range(100):
+            if output_path.exists():
+                break
+            stop_event.wait(0.05)
+        assert output_path.exists()
+    finally:
+        stop_event.set()
+        thread.join(timeout=5)
@@ -1,6 +1,8 @@
+import os
 from pathlib import Path
 
 import pytest
+from PySide6.QtWidgets import QApplication
 
 from app.models.csv_data import CSVData
 from app.models.csv_summary_data import CSVSummaryData
@@ -30,3 +32,25 @@ def csv_summary_data(summary_csv_path: Path) -> CSVSummaryData:
 @pytest.fixture(scope="module")
 def summary_sheet(summary_csv_path: Path) -> SummarySheet:
     return SummarySheet.load_from_csv(summary_csv_path)
+
+
+@pytest.fixture(scope="module")
+def parts_csv_path() -> Path:
+    """重量計算書CSVファイルのパスを返すフィクスチャ"""
+    return Path("tests/data/重量計算書.csv")
+
+
+@pytest.fixture(scope="module")
+def master_path() -> Path:
+    """材料マスタファイルのパスを返すフィクスチャ"""
+    return Path("tests/data/sample_fix.txt")
+
+
+@pytest.fixture(scope="session")
+def qapp() -> QApplication:
+    """ウィジェットのテスト用の `QApplication` を返すフィクスチャ"""
+    # ディスプレイのない環境でも実行できるように、指定がなければ画面を表示しないプラットフォームを使用する
+    if not os.environ.get("QT_QPA_PLATFORM"):
+        os.environ["QT_QPA_PLATFORM"] = "offscreen"
+    app = QApplication.instance()
+    return app if isinstance(app, QApplication) else QApplication([])
@@ -0,0 +1,99 @@
+import gc
+from pathlib import Path
+
+import pytest
+from PySide6.QtWidgets import QApplication, QFileDialog
+
+from app.controllers import main_controller
+from app.controllers.main_controller import MainController
+from app.models.summary_sheet import SummarySheet
+from app.views.main_window import MainWindow
+from app.views.settings import INI_FILENAME, WindowSettings
+
+
+@pytest.fixture(autouse=True)
+def window_settings(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """ウィンドウ設定を一時ディレクトリのINIファイルに保存するフィクスチャ (リポジトリの設定を読み書きしない)"""
+    ini_path = tmp_path / INI_FILENAME
+    monkeypatch.setattr(main_controller, "WindowSettings", lambda: WindowSettings(str(ini_path)))
+
+
+@pytest.fixture(autouse=True)
+def collect_widgets() -> None:
+    """前のテストのウィジェットがワーカースレッドでガベージコレクトされないように、テスト前に回収するフィクスチャ"""
+    gc.collect()
+
+
+def test_MainController_表示中のタブのみテーブルをセット(qapp: QApplication, summary_sheet: SummarySheet):
+    window = MainWindow()
+    controller = MainController(window)
+    controller.summary_sheet = summary_sheet
+    controller._update_tables()
+
+    # 総括表のレベル数だけタブを生成し、最下位レベルのタブのみセットする
+    levels = sorted(summary_sheet.cols_by_level)
+    assert window.levels == levels
+    assert window.current_level == levels[-1]
+    row_counts = {level: view.model().rowCount() for level, view in window.level_table_views.items()}
+    assert row_counts[levels[-1]] > 0
+    assert all(row_counts[level] == 0 for level in levels[:-1])
+
+    # 初めて表示したタブをセットする
+    window.set_current_level(levels[0])
+    assert window.level_table_views[levels[0]].model().rowCount() > 0
+
+
+def test_MainController_再読み込み時は表示中のレベルを維持(qapp: QApplication, summary_sheet: SummarySheet):
+    window = MainWindow()
+    controller = MainController(window)
+    controller.summary_sheet = summary_sheet
+    controller._update_tables()
+    window.set_current_level(2)
+
+    controller._update_tables()
+    assert window.current_level == 2
+    assert window.level_table_views[2].model().rowCount() > 0
+    assert window.level_table_views[1].model().rowCount() == 0
+
+
+def _select_compare_file(monkeypatch: pytest.MonkeyPatch, file_path: Path) -> None:
+    """比較対象の選択ダイアログで `file_path` を選択したことにする"""
+    monkeypatch.setattr(QFileDialog, "getOpenFileName", lambda *args: (str(file_path), ""))
+
+
+def test_MainController_比較対象はワーカースレッドで読み込む(
+    qapp: QApplication, monkeypatch: pytest.MonkeyPatch, summary_sheet: SummarySheet, summary_csv_path: Path
+):
+    window = MainWindow()
+    controller = MainController(window)
+    controller.summary_sheet = summary_sheet
+    controller._update_tables()
+    _select_compare_file(monkeypatch, summary_csv_path)
+
+    # 読み込み完了の通知はイベントループで受け取るため、選択直後は比較対象が未設定
+    controller.on_compare()
+    assert controller.compare_sheet is None
+
+    controller._thread_pool.waitForDone()
+    qapp.processEvents()
+    assert controller.compare_sheet is not None
+    assert controller.compare_sheet.csv_path == summary_csv_path
+    assert controller._diff is not None
+    assert window.actionClearCompare.isEnabled()
+
+
+def test_MainController_比較解除時は比較対象の読み込みを破棄(
+    qapp: QApplication, monkeypatch: pytest.MonkeyPatch, summary_sheet: SummarySheet, summary_csv_path: Path
+):
+    window = MainWindow()
+    controller = MainController(window)
+    controller.summary_sheet = summary_sheet
+    controller._update_tables()
+    _select_compare_file(monkeypatch, summary_csv_path)
+
+    controller.on_compare()
+    controller.on_clear_compare()
+    controller._thread_pool.waitForDone()
+    qapp.processEvents()
+    assert controller.compare_sheet is None
+    assert controller._diff is None
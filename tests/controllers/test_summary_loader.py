@@ -0,0 +1,55 @@
+from pathlib import Path
+
+import pytest
+
+from app.controllers.summary_loader import SummaryLoadTask
+from app.models.summary_sheet import SummarySheet
+
+
+def _run_task(task: SummaryLoadTask) -> dict[str, list]:
+    """タスクを現在のスレッドで実行し、発行されたシグナルを記録して返す"""
+    emitted: dict[str, list] = {"progress": [], "finished": [], "failed": []}
+    task.signals.progress.connect(lambda *args: emitted["progress"].append(args))
+    task.signals.finished.connect(lambda *args: emitted["finished"].append(args))
+    task.signals.failed.connect(lambda *args: emitted["failed"].append(args))
+    task.run()
+    return emitted
+
+
+def test_SummaryLoadTask_読み込み完了を通知(summary_csv_path: Path):
+    emitted = _run_task(SummaryLoadTask(1, summary_csv_path))
+    assert emitted["progress"]
+    assert len(emitted["finished"]) == 1
+    request_id, summary_sheet = emitted["finished"][0]
+    assert request_id == 1
+    assert isinstance(summary_sheet, SummarySheet)
+    assert summary_sheet.csv_path == summary_csv_path
+
+
+def test_SummaryLoadTask_キャンセル済みの場合は通知しない(summary_csv_path: Path):
+    task = SummaryLoadTask(2, summary_csv_path)
+    task.cancel()
+    emitted = _run_task(task)
+    assert emitted == {"progress": [], "finished": [], "failed": []}
+
+
+def test_SummaryLoadTask_読み込み失敗を通知():
+    emitted = _run_task(SummaryLoadTask(3, Path("tests/data/non_existent.csv")))
+    assert not emitted["finished"]
+    assert len(emitted["failed"]) == 1
+    assert emitted["failed"][0][0] == 3
+
+
+def test_SummaryLoadTask_読み込み時に集計値を検証(summary_csv_path: Path):
+    task = SummaryLoadTask(4, summary_csv_path)
+    emitted = _run_task(task)
+    assert len(emitted["finished"]) == 1
+    assert task.inconsistencies == []
+
+
+def test_SummaryLoadTask_検証しない場合は集計値を検証しない(summary_csv_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(SummarySheet, "validate", lambda self: pytest.fail("validate が呼び出されました"))
+    task = SummaryLoadTask(5, summary_csv_path, validate=False)
+    emitted = _run_task(task)
+    assert len(emitted["finished"]) == 1
+    assert task.inconsistencies == []
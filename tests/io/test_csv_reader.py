@@ -57,3 +57,28 @@ def test_CSVReader_ファイルが見つからない場合() -> None:
     non_existent_path = Path("tests/data/non_existent.csv")
     with pytest.raises(FileNotFoundError):
         _ = CSVReader(non_existent_path)
+
+
+@pytest.mark.parametrize(
+    ("encoding", "expected_encoding"),
+    [("cp932", "cp932"), ("utf-8-sig", "utf-8-sig"), ("utf-8", "utf-8-sig")],
+)
+def test_CSVReader_文字コードを判定(tmp_path: Path, encoding: str, expected_encoding: str) -> None:
+    # cp932 にのみ存在する文字 (髙, ①) を含むCSV
+    csv_path = tmp_path / "sample.csv"
+    csv_path.write_text("#1レベル名,髙橋橋\n①, 寸法 \n", encoding=encoding)
+
+    reader = CSVReader(csv_path)
+    csv_rows = reader.load()
+    assert csv_rows == [["#1レベル名", "髙橋橋"], ["①", "寸法"]]
+    assert reader.encoding == expected_encoding
+
+
+def test_CSVReader_シフトJISはcp932として読み込む(tmp_path: Path) -> None:
+    # cp932 は シフトJIS の上位互換のため、シフトJIS のファイルも cp932 で復号できる
+    csv_path = tmp_path / "sample.csv"
+    csv_path.write_text("#1レベル名,上部構造\n主桁, 寸法 \n", encoding="shift_jis")
+
+    reader = CSVReader(csv_path)
+    assert reader.load() == [["#1レベル名", "上部構造"], ["主桁", "寸法"]]
+    assert reader.encoding == "cp932"
@@ -4,6 +4,7 @@ from pathlib import Path
 import pytest
 
 from app.io.csv_handler import write_csv
+from app.io.csv_reader import CSVReader
 from app.models.summary_sheet import SummarySheet
 
 
@@ -16,3 +17,9 @@ def test_CSVの書き出し(summary_sheets: list[SummarySheet]) -> None:
         output_csv_path = Path(tmpdir) / "output.csv"
         write_csv(output_csvdata, output_csv_path)
         assert output_csv_path.exists()
+
+
+def test_write_csv_イテレータの行をまとめて書き込む(summary_sheet: SummarySheet, tmp_path: Path) -> None:
+    output_path = tmp_path / "output.csv"
+    write_csv(summary_sheet.iter_csv_rows(4), output_path)
+    assert CSVReader(output_path).load() == list(summary_sheet.iter_csv_rows(4))
@@ -0,0 +1,40 @@
+from pathlib import Path
+
+import pytest
+
+from app.io.maz_reader import MazFileReader
+
+MAZ_PATH = Path("tests/data/sample_fix.maz")
+
+
+def test_MazFileReader_レコードを読み込む():
+    with MazFileReader(MAZ_PATH) as reader:
+        records = reader.load()
+        assert len(records) == 119
+        assert [record.code for record in records[:3]] == ["PL", "DECK", "CHPL"]
+        assert sum(record.table_count for record in records) == 4428
+
+        deck = records[1]
+        assert deck.description == "デッキプレート"
+        first_row = next(reader.iter_table_rows(deck))
+        assert first_row.dimensions == (2.7, 0.0, 0.0, 0.0)
+        assert first_row.weight == 35.2
+
+        materials = reader.load_materials()
+        assert len(materials) == 227
+        assert materials[0].name == "SBHS700W"
+        assert materials[0].specific_gravity == 7.85
+    assert not reader.is_open
+
+
+def test_MazFileReader_閉じた後は読み込めない():
+    reader = MazFileReader(MAZ_PATH)
+    with pytest.raises(ValueError, match="ファイルが開かれていません"):
+        reader.load()
+
+
+def test_MazFileReader_途中で切れたファイルはエラー(tmp_path: Path):
+    maz_path = tmp_path / "broken.maz"
+    maz_path.write_bytes(MAZ_PATH.read_bytes()[:1000])
+    with MazFileReader(maz_path) as reader, pytest.raises(ValueError, match="不正なファイル形式です"):
+        reader.load()
@@ -0,0 +1,66 @@
+from pathlib import Path
+
+import pytest
+
+from app.io.csv_handler import write_csv
+from app.io.csv_reader import CSVReader, CSVRow
+from app.io.parts_reader import PartsKey, PartsListReader
+
+
+def test_PartsListReader_材片行を読み込む(parts_csv_path: Path):
+    parts = list(PartsListReader(parts_csv_path).iter_parts())
+    assert len(parts) == 19
+
+    first = parts[0]
+    assert first.key == PartsKey(
+        ("上部構造", "主構造", "主桁", "G1"),
+        "大型",
+        "SM400A",
+        "PL",
+        ("220.000000", "16.000000", "0.000000", "0.000000"),
+        "980",
+    )
+    assert first.count == "1"
+    assert first.weight == 27
+
+
+def test_PartsListReader_集計キー毎に重量を合計(parts_csv_path: Path):
+    weights = PartsListReader(parts_csv_path).sum_weights()
+    parts = list(PartsListReader(parts_csv_path).iter_parts())
+    assert sum(weights.values()) == sum(part.weight for part in parts) == 960
+
+    # G1 の V-STIFF (PL 160x16 L=1800) は2行を合計
+    key = next(part.key for part in parts if part.key.dimensions[0] == "160.000000" and part.key.path[-1] == "G1")
+    assert weights[key] == 144
+
+
+def test_PartsListReader_列数が不足している場合エラー(tmp_path: Path):
+    csv_path = tmp_path / "parts.csv"
+    csv_path.write_text("1,1,上部構造\n", encoding="cp932")
+    with pytest.raises(ValueError, match="列数が不足しています"):
+        PartsListReader(csv_path).sum_weights()
+
+
+def test_PartsListReader_階層数を列数から判定(parts_csv_path: Path, tmp_path: Path):
+    # #4レベル名の後に #5レベル名 (番号, 名称) の2列を追加した5階層の重量計算書
+    rows = CSVReader(parts_csv_path).load()
+    csv_path = tmp_path / "parts.csv"
+    write_csv([CSVRow([*row[:9], "1", "J1", *row[9:]]) for row in rows], csv_path)
+
+    parts = list(PartsListReader(csv_path).iter_parts())
+    assert parts[0].key.path == ("上部構造", "主構造", "主桁", "G1", "J1")
+    assert parts[0].key.material == "SM400A"
+    assert parts[0].weight == 27
+    weights = PartsListReader(csv_path).sum_weights()
+    assert sum(weights.values()) == 960
+    assert all(len(key.path) == 5 for key in weights)
+
+
+def test_PartsListReader_列数が一致しない場合エラー(parts_csv_path: Path, tmp_path: Path):
+    rows = CSVReader(parts_csv_path).load()
+    csv_path = tmp_path / "parts.csv"
+    write_csv([rows[0], CSVRow([*rows[1], ""])], csv_path)
+    with pytest.raises(ValueError, match="列数が一致しません"):
+        PartsListReader(csv_path).sum_weights()
+    with pytest.raises(ValueError, match="列数が一致しません"):
+        list(PartsListReader(csv_path).iter_parts())
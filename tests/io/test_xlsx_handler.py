@@ -0,0 +1,42 @@
+from pathlib import Path
+
+from openpyxl import load_workbook
+
+from app.io.xlsx_handler import write_xlsx
+from app.models.summary_matrix import parse_number
+from app.models.summary_sheet import SummarySheet
+
+
+def test_write_xlsx_レベル毎のワークシートを出力(summary_sheet: SummarySheet, tmp_path: Path):
+    output_path = tmp_path / "output.xlsx"
+    write_xlsx(summary_sheet, output_path)
+
+    workbook = load_workbook(output_path, read_only=True)
+    assert workbook.sheetnames == ["#1レベル名", "#2レベル名", "#3レベル名", "#4レベル名"]
+
+    for level, title in enumerate(workbook.sheetnames, start=1):
+        csv_rows = list(summary_sheet.iter_csv_rows(level))
+        # 末尾の空セルは読み込み時に省略されるため、列数を揃える
+        max_col = len(csv_rows[0])
+        xlsx_rows = list(workbook[title].iter_rows(max_col=max_col, values_only=True))
+        assert len(xlsx_rows) == len(csv_rows)
+
+        # ヘッダー行と材片種別は文字列のまま (空文字は空セル)
+        assert list(xlsx_rows[0]) == csv_rows[0]
+        for xlsx_row, csv_row in zip(xlsx_rows[1:], csv_rows[1:], strict=True):
+            assert list(xlsx_row[:3]) == [cell or None for cell in csv_row[:3]]
+            # 数値セルは数値として出力
+            assert list(xlsx_row[3:]) == [parse_number(cell) for cell in csv_row[3:]]
+    workbook.close()
+
+
+def test_write_xlsx_材片種別の列のみ列幅を設定(tmp_path: Path):
+    # 塗装総括表の材片種別は2列 (塗装名称, 区分) で、3列目は合計列
+    paint_sheet = SummarySheet.load_from_csv("tests/data/塗装総括表.csv")
+    output_path = tmp_path / "output.xlsx"
+    write_xlsx(paint_sheet, output_path)
+
+    worksheet = load_workbook(output_path)["#1レベル名"]
+    assert [worksheet.column_dimensions[letter].width for letter in "AB"] == [20, 8]
+    assert "C" not in worksheet.column_dimensions
+    assert worksheet.freeze_panes == "C2"
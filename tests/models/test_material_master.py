@@ -0,0 +1,72 @@
+from pathlib import Path
+
+import pytest
+
+from app.io.master_reader import MasterFileReader
+from app.models.material_master import MaterialMaster
+
+
+@pytest.fixture(scope="module")
+def material_master(master_path: Path) -> MaterialMaster:
+    return MaterialMaster.load_from_file(master_path)
+
+
+def test_MaterialMaster_形状コードと寸法から単位重量を取得(material_master: MaterialMaster):
+    assert material_master.unit_weight("HTB", 22, 65) == 0.54
+    assert material_master.unit_weight("L", 25, 25, 3) == 1.12
+
+    row = material_master.table("HTB").find(22, 65)
+    assert row is not None
+    assert row.dimensions == (22.0, 65.0, 0.0, 0.0)
+    assert row.coefficient == 6.7
+
+
+def test_MaterialMaster_存在しない寸法と形状コード(material_master: MaterialMaster):
+    assert material_master.table("HTB").find(22, 66) is None
+    with pytest.raises(KeyError):
+        material_master.unit_weight("HTB", 22, 66)
+    with pytest.raises(KeyError):
+        material_master.table("XXXX")
+
+
+def test_UnitWeightTable_寸法の昇順に整列(material_master: MaterialMaster):
+    table = material_master.table("HTB")
+    dimensions = [row.dimensions for row in table]
+    assert dimensions == sorted(dimensions)
+    assert sum(len(material_master.table(code)) for code in material_master.table_codes) == 4428
+
+
+def test_MaterialMaster_形状定義と材質定義(material_master: MaterialMaster):
+    assert material_master.shape_order[:3] == ("PL", "DECK", "CHPL")
+    assert material_master.marks["BN2"].base_code == "BN"
+    assert material_master.materials["SMA570P"].description == "JIS G3114"
+    assert material_master.materials["SM400A"].specific_gravity == 7.85
+
+    # 総括表の材質の並び順と一致
+    material_order = material_master.material_order
+    summary_materials = ["SMA490BW", "SMA490AW", "SMA400AW", "SM400A", "SS400", "S10T"]
+    assert sorted(summary_materials, key=material_order.index) == summary_materials
+
+
+def test_MasterFileReader_拡張子の検証(tmp_path: Path):
+    with pytest.raises(ValueError, match="不正な拡張子です"):
+        MasterFileReader(tmp_path / "master.csv")
+
+
+def test_MaterialMaster_バイナリ形式とテキスト形式の内容が一致(material_master: MaterialMaster):
+    maz_master = MaterialMaster.load_from_file("tests/data/sample_fix.maz")
+    assert maz_master.unit_weight("HTB", 22, 65) == 0.54
+    assert maz_master.marks == material_master.marks
+    assert maz_master.materials == material_master.materials
+    assert maz_master.table_codes == material_master.table_codes
+    for code in material_master.table_codes:
+        assert list(maz_master.table(code)) == list(material_master.table(code))
+
+
+def test_MaterialMaster_未対応のレコードの件数をログに出力(master_path: Path, caplog: pytest.LogCaptureFixture):
+    with caplog.at_level("INFO", logger="app.models.material_master"):
+        MaterialMaster.load_from_file(master_path)
+    message = next(record.getMessage() for record in caplog.records if "未対応のレコード" in record.getMessage())
+    assert ":WELD 96件" in message
+    assert ":PRIMER 6件" in message
+    assert ":USER 9件" in message
@@ -0,0 +1,61 @@
+from pathlib import Path
+
+import pytest
+
+from app.io.csv_reader import CSVReader
+from app.io.parts_reader import PartsKey, PartsListReader, PartsRow
+from app.models.summary_aggregator import SummaryAggregator, aggregate_parts_csv, format_dimension
+from app.models.summary_sheet import SummarySheet
+
+MATERIAL_ORDER = ["SMA490BW", "SMA490AW", "SMA400AW", "SM400A", "SS400", "S10T"]
+SHAPE_ORDER = ["PL", "L", "CT", "TCB", "BN"]
+
+
+@pytest.mark.parametrize(
+    ("shape", "dimensions", "length", "expected"),
+    [
+        ("PL", ("220.000000", "16.000000", "0.000000", "0.000000"), "980", "16.0"),
+        ("L", ("90.000000", "90.000000", "10.000000", "0.000000"), "600", "90 x  90 x 10.0"),
+        ("CT", ("118.000000", "176.000000", "8.000000", "8.000000"), "4823", "118x176x 8.0x 8.0"),
+        ("TCB", ("22.000000", "0.000000", "0.000000", "0.000000"), "65", "M 22 x  65"),
+    ],
+)
+def test_format_dimension_形状毎の寸法表記(shape: str, dimensions: tuple[str, ...], length: str, expected: str):
+    assert format_dimension(shape, dimensions, length)[0] == expected
+
+
+def test_aggregate_parts_csv_総括表と一致(parts_csv_path: Path, summary_csv_path: Path, summary_sheet: SummarySheet):
+    aggregated = aggregate_parts_csv(parts_csv_path, "サンプル橋", MATERIAL_ORDER, SHAPE_ORDER)
+    aggregator = SummaryAggregator("サンプル橋", MATERIAL_ORDER, SHAPE_ORDER)
+    aggregator.add_weights(PartsListReader(parts_csv_path).sum_weights())
+
+    # 小計・中計・合計行を含め、まてりあるの出力と行単位で一致する
+    assert aggregator.summary_rows() == CSVReader(summary_csv_path).load()
+    assert list(aggregated.total_col) == list(summary_sheet.total_col)
+
+
+def test_SummaryAggregator_区分をまたぐ同じ材片種別はエラー():
+    dimensions = ("220.000000", "16.000000", "0.000000", "0.000000")
+    aggregator = SummaryAggregator("サンプル橋")
+    aggregator.add(PartsRow(PartsKey(("上部構造",), "大型", "SS400", "PL", dimensions, "980"), "1", 27))
+    aggregator.add(PartsRow(PartsKey(("上部構造",), "購入", "SS400", "PL", dimensions, "980"), "1", 27))
+
+    with pytest.raises(ValueError, match="加工鋼重と購入部品の両方にある材片種別です: SS400 PL 16.0"):
+        aggregator.summary_rows()
+
+
+def test_SummaryAggregator_材片行の逐次追加と一括集計は同じ結果(parts_csv_path: Path):
+    reader = PartsListReader(parts_csv_path)
+    row_aggregator = SummaryAggregator("サンプル橋")
+    row_aggregator.add_all(reader.iter_parts())
+    weight_aggregator = SummaryAggregator("サンプル橋")
+    weight_aggregator.add_weights(reader.sum_weights())
+
+    rows = row_aggregator.summary_rows()
+    assert rows == weight_aggregator.summary_rows()
+
+    # 並び順を指定しない場合は出現順 (加工鋼重 → 購入部品 → 合計)
+    level_1_rows = rows[1 : rows.index(next(row for row in rows[1:] if row[0] == "#2レベル名"))]
+    assert level_1_rows[0][1:4] == ["SM400A", "PL", "22.0"]
+    assert [row[1] for row in level_1_rows if not row[2]][-3:] == ["小計", "購入部品中計", "合計"]
+    assert level_1_rows[-1][4:] == ["960", "960"]
@@ -0,0 +1,40 @@
+from pathlib import Path
+
+import pytest
+
+from app.io.csv_reader import CSVReader, CSVRow
+from app.models.summary_block import iter_summary_blocks
+
+
+def test_iter_summary_blocks_ヘッダー行で分割(summary_csv_path: Path):
+    blocks = list(iter_summary_blocks(CSVReader(summary_csv_path).iter_rows()))
+    assert len(blocks) == 8  # 総括表ブロックの総数
+    assert [block.level for block in blocks] == [1, 2, 3, 3, 4, 4, 4, 4]
+    assert [block.level_name for block in blocks[:3]] == ["サンプル橋", "上部構造", "主構造"]
+
+    # ヘッダー行は保持し、データ行には含めない
+    assert blocks[0].header == ["#1レベル名", "材質", "形状", "寸法", "合計", "上部構造"]
+    assert len(blocks[0].rows) == 20
+
+
+def test_SummaryBlock_総括表列の列番号(summary_csv_path: Path):
+    blocks = list(iter_summary_blocks(CSVReader(summary_csv_path).iter_rows()))
+    assert blocks[0].header_indices == (0, 1, 2, 3, 4)
+    assert blocks[0].value_indices == (5,)
+    assert blocks[2].value_indices == (5, 6, 7)
+
+
+def test_SummaryBlock_小計行を除外(summary_csv_path: Path):
+    block = next(iter_summary_blocks(CSVReader(summary_csv_path).iter_rows()))
+    item_rows = list(block.item_rows)
+    # 小計5行を除外した行数
+    assert len(item_rows) == 20 - 5
+    header_cells, row = item_rows[0]
+    assert header_cells == ["サンプル橋", "SMA490BW", "PL", "19.0", "166"]
+    assert row[5] == "166"
+
+
+def test_iter_summary_blocks_ヘッダー行より前のデータ行はエラー():
+    rows = [CSVRow(["サンプル橋", "SS400", "PL", "6.0", "8", "8"])]
+    with pytest.raises(ValueError):
+        list(iter_summary_blocks(rows))
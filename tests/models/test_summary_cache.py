@@ -0,0 +1,141 @@
+import os
+import shutil
+import threading
+from pathlib import Path
+
+import pytest
+
+from app.io.csv_handler import write_csv
+from app.io.csv_reader import CSVReader
+from app.models.summary_cache import PATH_LOCK_STRIPES, SummarySheetCache
+from app.models.summary_sheet import SummarySheet
+
+
+@pytest.fixture
+def csv_copies(summary_csv_path: Path, tmp_path: Path) -> list[Path]:
+    """総括表CSVファイルを一時ディレクトリに3つ複製して返すフィクスチャ"""
+    paths = [tmp_path / f"summary_{i}.csv" for i in range(3)]
+    for path in paths:
+        shutil.copy(summary_csv_path, path)
+    return paths
+
+
+def test_SummarySheetCache_同じファイルはキャッシュから返す(csv_copies: list[Path]):
+    cache = SummarySheetCache()
+    sheet_1 = cache.load(csv_copies[0])
+    sheet_2 = cache.load(csv_copies[0])
+    assert sheet_1 is sheet_2
+    assert cache.stats().hits == 1
+    assert cache.stats().misses == 1
+
+
+def test_SummarySheetCache_更新されたファイルは再読み込み(csv_copies: list[Path]):
+    cache = SummarySheetCache()
+    sheet_1 = cache.load(csv_copies[0])
+
+    # 更新日時を変更
+    stat = csv_copies[0].stat()
+    os.utime(csv_copies[0], ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    sheet_2 = cache.load(csv_copies[0])
+    assert sheet_1 is not sheet_2
+    assert cache.stats().misses == 2
+    assert len(cache) == 1
+
+
+def test_SummarySheetCache_エントリ数の上限で古い順に破棄(csv_copies: list[Path]):
+    cache = SummarySheetCache(max_entries=2)
+    sheet_0 = cache.load(csv_copies[0])
+    cache.load(csv_copies[1])
+    cache.load(csv_copies[0])  # 0番目を最近参照したエントリにする
+    cache.load(csv_copies[2])  # 1番目が破棄される
+
+    assert len(cache) == 2
+    assert cache.load(csv_copies[0]) is sheet_0
+    cache.load(csv_copies[1])
+    assert cache.stats().misses == 4
+
+
+def test_SummarySheetCache_サイズの上限で破棄(csv_copies: list[Path]):
+    size = csv_copies[0].stat().st_size
+    cache = SummarySheetCache(max_bytes=size * 2)
+    for path in csv_copies:
+        cache.load(path)
+    assert len(cache) == 2
+    assert cache.stats().bytes == size * 2
+
+    # 上限を縮小すると超過分を破棄
+    cache.set_budget(max_entries=16, max_bytes=size)
+    assert len(cache) == 1
+
+
+def test_SummarySheetCache_更新されたファイルをreloaderで再読み込み(csv_copies: list[Path]):
+    cache = SummarySheetCache()
+    sheet_1 = cache.load(csv_copies[0], reloader=SummarySheet.reloaded_from_csv)
+
+    # 更新日時を変更
+    stat = csv_copies[0].stat()
+    os.utime(csv_copies[0], ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    # 内容が変わらない場合は同じインスタンスを新しいキーで格納する
+    sheet_2 = cache.load(csv_copies[0], reloader=SummarySheet.reloaded_from_csv)
+    assert sheet_1 is sheet_2
+    assert cache.load(csv_copies[0]) is sheet_1
+    assert cache.stats().misses == 2
+    assert cache.stats().hits == 1
+
+
+def test_SummarySheetCache_reloaderはキャッシュ済みのインスタンスを変更しない(csv_copies: list[Path]):
+    cache = SummarySheetCache()
+    sheet_1 = cache.load(csv_copies[0], reloader=SummarySheet.reloaded_from_csv)
+    old_rows = list(sheet_1.iter_csv_rows(4))
+
+    # 主桁ブロックの値を変更
+    rows = CSVReader(csv_copies[0]).load()
+    rows[50][5] = "8"
+    write_csv(rows, csv_copies[0])
+
+    sheet_2 = cache.load(csv_copies[0], reloader=SummarySheet.reloaded_from_csv)
+    assert sheet_2 is not sheet_1
+    assert list(sheet_1.iter_csv_rows(4)) == old_rows
+    assert cache.load(csv_copies[0]) is sheet_2
+
+
+def test_SummarySheetCache_同じファイルの読み込みは1回のみ実行(csv_copies: list[Path]):
+    cache = SummarySheetCache()
+    started = threading.Event()
+    release = threading.Event()
+    loaded: list[Path] = []
+
+    def slow_loader(path: Path) -> SummarySheet:
+        loaded.append(path)
+        started.set()
+        release.wait(timeout=5)
+        return SummarySheet.load_from_csv(path)
+
+    results: list[SummarySheet] = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.load(csv_copies[0], slow_loader))) for _ in range(2)
+    ]
+    threads[0].start()
+    started.wait(timeout=5)
+    threads[1].start()
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    # 後から読み込んだスレッドは先に読み込んだ結果を返す
+    assert len(loaded) == 1
+    assert results[0] is results[1]
+    assert cache.stats().hits == 1
+
+
+def test_SummarySheetCache_読み込み用ロックは読み込んだパスの数に依存しない(csv_copies: list[Path]):
+    cache = SummarySheetCache(max_entries=1)
+    for path in csv_copies:
+        cache.load(path)
+
+    # 破棄されたエントリのロックは残らず、同じパスには同じロックを使う
+    assert len(cache) == 1
+    assert len(cache._path_locks) == PATH_LOCK_STRIPES
+    assert cache._path_lock(csv_copies[0].resolve()) is cache._path_lock(csv_copies[0].resolve())
@@ -0,0 +1,51 @@
+import pytest
+
+from app.io.csv_reader import CSVReader, CSVRow
+from app.models.summary_diff import DiffKind
+from app.models.summary_schema import TOTAL_COL_NAME
+from app.models.summary_sheet import SummarySheet
+
+
+def test_SummaryDiff_同じ総括表は差分なし(summary_sheet: SummarySheet):
+    summary_diff = summary_sheet.diff(summary_sheet)
+    assert not summary_diff
+    assert summary_diff.csv_rows() == [["対象", "種別", "階層パス", "材質", "形状", "寸法", "変更前", "変更後", "増減"]]
+
+
+def test_SummaryDiff_変更されたセルと列を取得(summary_csv_path):
+    rows = CSVReader(summary_csv_path).load()
+    old_sheet = SummarySheet(rows, summary_csv_path)
+
+    # 主構造ブロックの主桁列の値を変更し、主桁ブロックの G1 列の名称を変更
+    changed_rows = [CSVRow(row) for row in rows]
+    changed_rows[50][5] = "8"
+    changed_rows[68][5] = "G2"
+    summary_diff = SummarySheet(changed_rows).diff(old_sheet)
+
+    assert [(col.kind, col.path) for col in summary_diff.columns] == [
+        (DiffKind.ADDED, "上部構造/主構造/主桁/G2"),
+        (DiffKind.REMOVED, "上部構造/主構造/主桁/G1"),
+    ]
+    assert summary_diff.rows == []
+    assert len(summary_diff.cells) == 1
+    cell = summary_diff.cells[0]
+    assert (cell.kind, cell.path, cell.props.values()) == (
+        DiffKind.CHANGED,
+        "上部構造/主構造/主桁",
+        ["SM400A", "PL", "22.0"],
+    )
+    assert (cell.old_value, cell.new_value, cell.delta_text) == ("7", "8", "+1")
+    assert summary_diff.cell("上部構造/主構造/主桁", cell.props) is cell
+    assert summary_diff.cell(TOTAL_COL_NAME, cell.props) is None
+
+    assert summary_diff.csv_rows()[1:] == [
+        ["列", "追加", "上部構造/主構造/主桁/G2", "", "", "", "", "", ""],
+        ["列", "削除", "上部構造/主構造/主桁/G1", "", "", "", "", "", ""],
+        ["セル", "変更", "上部構造/主構造/主桁", "SM400A", "PL", "22.0", "7", "8", "+1"],
+    ]
+
+
+def test_SummaryDiff_種類の異なる総括表は比較できない(summary_sheet: SummarySheet):
+    paint_sheet = SummarySheet.load_from_csv("tests/data/塗装総括表.csv")
+    with pytest.raises(ValueError):
+        summary_sheet.diff(paint_sheet)
@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+from app.models.summary_matrix import format_number, parse_number
+from app.models.summary_sheet import SummarySheet
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [("200", 200), ("0012", 12), ("-0.1250000", -0.125), ("1.5e2", 150.0), ("", None), ("ABC", None), ("nan", None)],
+)
+def test_parse_number_セルの数値変換(text: str, expected: int | float | None):
+    assert parse_number(text) == expected
+
+
+@pytest.mark.parametrize(("value", "expected"), [(200, "200"), (150.0, "150"), (0.1 + 0.2, "0.3"), (-1.25, "-1.25")])
+def test_format_number_数値のセル文字列変換(value: int | float, expected: str):
+    assert format_number(value) == expected
+
+
+def test_SummaryMatrix_レベル毎の数値行列(summary_sheet: SummarySheet):
+    matrix = summary_sheet.matrix(2)
+    assert matrix.shape == (15, 2)
+    assert matrix.values.dtype == np.int64
+    assert [col.name for col in matrix.columns] == ["主構造", "附属物"]
+
+    # 1行目 (SMA490BW, PL, 19.0)
+    assert matrix.values[0].tolist() == [166, 0]
+    # 最終行 (合計)
+    assert matrix.values[-1].tolist() == [952, 8]
+
+    # 同じインスタンスを返す
+    assert summary_sheet.matrix(2) is matrix
+
+
+def test_SummaryMatrix_アイテムが存在しないセルは欠損値(summary_sheet: SummarySheet):
+    matrix = summary_sheet.matrix(4)
+    j = [col.name for col in matrix.columns].index("取付金具")
+    assert int((~matrix.mask[:, j]).sum()) == 5
+
+
+def test_SummaryMatrix_行合計と列合計(summary_sheet: SummarySheet):
+    matrix = summary_sheet.matrix(2)
+    total_col = [parse_number(cell) for cell in summary_sheet.total_col.data]
+    assert matrix.row_sums().tolist() == total_col
+
+    # 合計行のみを指定して列合計を取得
+    assert matrix.col_sums(rows=np.array([len(matrix.props_group) - 1])).tolist() == [952, 8]
+
+
+def test_SummarySheet_rollupは親階層の値と一致(summary_sheet: SummarySheet):
+    for level in [2, 3, 4]:
+        rollup = summary_sheet.rollup(level)
+        parent_matrix = summary_sheet.matrix(level - 1)
+        present = ~parent_matrix.mask
+        assert np.array_equal(rollup[present], parent_matrix.values[present])
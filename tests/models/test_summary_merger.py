@@ -0,0 +1,85 @@
+from pathlib import Path
+
+import pytest
+
+from app.io.csv_reader import CSVRow
+from app.models.summary_merger import load_summary_sheets, merge_summary_csvs, merge_summary_sheets
+from app.models.summary_sheet import SummarySheet
+
+
+def _bridge_sheet(bridge_name: str, items: list[tuple[str, str, str, str]]) -> SummarySheet:
+    """1階層の総括表 (材質, 形状, 寸法, 重量) を生成する"""
+    total = str(sum(int(item[3]) for item in items))
+    rows = [
+        ["#1レベル名", "材質", "形状", "寸法", "合計", "上部構造"],
+        *([bridge_name, *item, item[3]] for item in items),
+        [bridge_name, "合計", "", "", total, total],
+    ]
+    return SummarySheet([CSVRow(row) for row in rows])
+
+
+def test_merge_summary_sheets_橋梁毎の列と材片種別の和集合():
+    sheet_a = _bridge_sheet("A橋", [("SM400A", "PL", "9.0", "10"), ("SS400", "PL", "6.0", "5")])
+    sheet_b = _bridge_sheet("B橋", [("SM400A", "PL", "9.0", "20"), ("SM400A", "PL", "12.0", "7")])
+    merged_sheet = merge_summary_sheets([sheet_a, sheet_b], root_name="工事")
+
+    assert [col.path for col in merged_sheet.cols] == ["A橋", "A橋/上部構造", "B橋", "B橋/上部構造"]
+    # B橋にのみ存在する材片種別は、B橋での並び順に従って合計行より前に挿入する
+    merged_sheet.display_level = 1
+    assert merged_sheet.csv_data.rows == [
+        ["材質", "形状", "寸法", "合計", "A橋", "B橋"],
+        ["SM400A", "PL", "9.0", "30", "10", "20"],
+        ["SM400A", "PL", "12.0", "7", "0", "7"],
+        ["SS400", "PL", "6.0", "5", "5", "0"],
+        ["合計", "", "", "42", "15", "27"],
+    ]
+    merged_sheet.display_level = 2
+    assert merged_sheet.csv_data.rows[1] == ["SM400A", "PL", "9.0", "30", "10", "20"]
+    assert merged_sheet.csv_data.rows[2] == ["SM400A", "PL", "12.0", "7", "", "7"]
+
+
+def test_merge_summary_csvs_レベルを1つ下げて統合(summary_csv_path: Path):
+    summary_sheet = SummarySheet.load_from_csv(summary_csv_path)
+    merged_sheet = merge_summary_csvs([summary_csv_path, summary_csv_path], jobs=1)
+
+    assert [col.name for col in merged_sheet.children] == ["サンプル橋", "サンプル橋(2)"]
+    assert sorted(merged_sheet.cols_by_level) == [1, 2, 3, 4, 5]
+    leaf_col = merged_sheet.find("サンプル橋(2)/上部構造/主構造/主桁/G1")
+    assert leaf_col is not None
+    assert leaf_col.level == 5
+
+    # 合計列は各橋梁の合計の和
+    totals = [int(value) for value in summary_sheet.total_col.data]
+    assert [int(value) for value in merged_sheet.total_col.data] == [value * 2 for value in totals]
+
+    # 各橋梁の列は元の総括表と同じ値
+    summary_sheet.display_level = 4
+    merged_sheet.display_level = 5
+    expected_cols = [row[4:] for row in summary_sheet.csv_data.rows]
+    assert [row[4:8] for row in merged_sheet.csv_data.rows] == expected_cols
+
+
+def test_merge_summary_sheets_種類の異なる総括表は統合しない(summary_sheet: SummarySheet):
+    paint_sheet = SummarySheet.load_from_csv("tests/data/塗装総括表.csv")
+    with pytest.raises(ValueError, match="総括表の種類が異なります"):
+        merge_summary_sheets([summary_sheet, paint_sheet])
+
+
+def test_merge_summary_csvs_プロセスプールで読み込んでも同じ結果(summary_csv_path: Path, tmp_path: Path):
+    copied_path = tmp_path / "鋼材重量総括表(2).csv"
+    copied_path.write_bytes(summary_csv_path.read_bytes())
+    csv_paths = [summary_csv_path, copied_path]
+    # プロセス間で受け渡した SummarySheet は、同じプロセスで読み込んだものと一致する
+    sheets = load_summary_sheets(csv_paths, jobs=1)
+    pooled_sheets = load_summary_sheets(csv_paths, jobs=2)
+    for sheet, pooled_sheet in zip(sheets, pooled_sheets, strict=True):
+        assert pooled_sheet.csv_path == sheet.csv_path
+        assert pooled_sheet.schema is sheet.schema
+        assert [col.path for col in pooled_sheet.cols] == [col.path for col in sheet.cols]
+        for level in sheet.cols_by_level:
+            assert list(pooled_sheet.iter_csv_rows(level)) == list(sheet.iter_csv_rows(level))
+
+    merged_sheet = merge_summary_csvs(csv_paths, jobs=1)
+    pooled_merged_sheet = merge_summary_csvs(csv_paths, jobs=2)
+    for level in merged_sheet.cols_by_level:
+        assert list(pooled_merged_sheet.iter_csv_rows(level)) == list(merged_sheet.iter_csv_rows(level))
@@ -0,0 +1,54 @@
+import pickle
+
+import pytest
+
+from app.models.summary_schema import (
+    BOLT_COUNT_SCHEMA,
+    PAINT_SCHEMA,
+    STEEL_WEIGHT_SCHEMA,
+    RowKind,
+    SummarySchema,
+    sniff_schema,
+)
+
+STEEL_HEADER = ["#1レベル名", "材質", "形状", "寸法", "合計", "上部構造"]
+PAINT_HEADER = ["#1レベル名", "塗装名称", "区分", "合計", "上部構造"]
+
+
+def test_sniff_schema_ヘッダー行から判定():
+    assert sniff_schema(STEEL_HEADER) is STEEL_WEIGHT_SCHEMA
+    assert sniff_schema(PAINT_HEADER) is PAINT_SCHEMA
+
+
+def test_sniff_schema_同じ列構成はファイル名で区別():
+    assert sniff_schema(STEEL_HEADER, "ボルト本数総括表(現場)") is BOLT_COUNT_SCHEMA
+
+
+def test_sniff_schema_不明なヘッダー行はエラー():
+    with pytest.raises(ValueError):
+        sniff_schema(["#1レベル名", "名称", "上部構造"])
+
+
+def test_SummarySchema_列配置を取得():
+    layout = STEEL_WEIGHT_SCHEMA.layout(STEEL_HEADER)
+    assert layout.key_indices == (1, 2, 3)
+    assert layout.total_index == 4
+    assert layout.header_indices == (0, 1, 2, 3, 4)
+    # 列構成が同じヘッダー行は同じ列配置を返す
+    assert STEEL_WEIGHT_SCHEMA.layout([*STEEL_HEADER[:5], "主構造"]) is layout
+
+
+def test_SummarySchema_行の種別を判定():
+    assert STEEL_WEIGHT_SCHEMA.classify(["SM400A", "PL", "9 x 100"]) is RowKind.ITEM
+    assert STEEL_WEIGHT_SCHEMA.classify(["SM400A", "小計", ""]) is RowKind.SUBTOTAL
+    assert STEEL_WEIGHT_SCHEMA.classify(["加工鋼重中計", "", ""]) is RowKind.SECTION_TOTAL
+    assert STEEL_WEIGHT_SCHEMA.classify(["合計", "", ""]) is RowKind.TOTAL
+    assert PAINT_SCHEMA.classify(["A:一般外面", "一般部"]) is RowKind.ITEM
+    assert PAINT_SCHEMA.classify(["A:一般外面", "合計"]) is RowKind.TOTAL
+
+
+def test_SummarySchema_登録済みの総括表は同じインスタンスに復元():
+    assert pickle.loads(pickle.dumps(STEEL_WEIGHT_SCHEMA)) is STEEL_WEIGHT_SCHEMA
+    custom_schema = SummarySchema("独自総括表", ("名称",), {"合計": RowKind.TOTAL})
+    restored = pickle.loads(pickle.dumps(custom_schema))
+    assert (restored.name, restored.key_cols, restored.row_labels) == ("独自総括表", ("名称",), {"合計": RowKind.TOTAL})
@@ -1,3 +1,6 @@
+import pytest
+
+from app.io.csv_reader import CSVReader, CSVRow
 from app.models.summary_sheet import SummarySheet, SummaryTotalColumn
 
 
@@ -72,6 +75,17 @@ def test_SummaryProps_等価性のチェック(summary_sheet: SummarySheet):
     assert item_1.props != item_3.props
 
 
+def test_SummaryProps_同じ材片種別はブロックをまたいで共有(summary_sheet: SummarySheet):
+    item_1 = summary_sheet.find("上部構造/主構造/主桁/G1")[0]  # SM400A, PL, 22.0
+    item_2 = summary_sheet.find("上部構造")[item_1.props]
+    assert item_2 is not None
+    assert item_1.props is item_2.props
+    assert item_1.props["材質"] == "SM400A"
+    # セル毎のオブジェクトはインスタンス辞書を持たない
+    assert not hasattr(item_1, "__dict__")
+    assert not hasattr(item_1.props, "__dict__")
+
+
 def test_SummarySheet_総括表の行ヘッダーリストを取得(summary_sheet: SummarySheet):
     header_rows = summary_sheet.header_rows
     assert len(header_rows) == 16
@@ -122,3 +136,180 @@ def test_SummarySheet_CSVデータ形式を返す(summary_sheet: SummarySheet):
     assert csv_data_2.rows[1] == ["SMA490BW", "PL", "19.0", "166", "166", "0"]
     assert csv_data_2.rows[2] == ["SMA490AW", "PL", "16.0", "38", "38", "0"]
     assert csv_data_2.rows[-1] == ["合計", "", "", "960", "952", "8"]
+
+
+def test_SummarySheet_CSV行を1行ずつ返す(summary_sheet: SummarySheet):
+    for level, summary_cols in summary_sheet.cols_by_level.items():
+        # 総括表列毎の列データ (`csv_col`) を並べた行と一致する
+        cols = [summary_sheet.total_col, *(col.csv_col for col in summary_cols)]
+        expected = [[*header, *cells] for header, *cells in zip(summary_sheet.header_rows, *cols, strict=True)]
+        assert list(summary_sheet.iter_csv_rows(level)) == expected
+
+    # レベルを省略した場合は display_level のレベル
+    summary_sheet.display_level = 2
+    assert list(summary_sheet.iter_csv_rows()) == summary_sheet.csv_data.rows
+
+
+def test_SummaryColumn_階層パスを取得(summary_sheet: SummarySheet):
+    level_4_paths = [col.path for col in summary_sheet.cols_by_level[4]]
+    assert level_4_paths == [
+        "上部構造/主構造/主桁/G1",
+        "上部構造/主構造/横桁/端支点横桁",
+        "上部構造/主構造/横構/下横構",
+        "上部構造/附属物/排水装置/取付金具",
+    ]
+
+
+def test_SummarySheet_階層パスで総括表列を検索(summary_sheet: SummarySheet):
+    col = summary_sheet.find("上部構造/主構造/主桁/G1")
+    assert col is not None
+    assert col.name == "G1"
+    assert col.parent is summary_sheet.find("上部構造/主構造/主桁")
+    assert summary_sheet.find("/上部構造/附属物/") is summary_sheet.cols_by_level[2][1]
+    assert summary_sheet.find("上部構造/主桁") is None
+
+
+def test_SummarySheet_パターンで総括表列を検索(summary_sheet: SummarySheet):
+    assert [col.name for col in summary_sheet.glob("上部構造/*")] == ["主構造", "附属物"]
+    assert [col.name for col in summary_sheet.glob("上部構造/主構造/*/*")] == ["G1", "端支点横桁", "下横構"]
+    assert [col.name for col in summary_sheet.glob("*/*/横*")] == ["横桁", "横構"]
+    assert [col.path for col in summary_sheet.glob("上部構造/附属物")] == ["上部構造/附属物"]
+    assert summary_sheet.glob("上部構造/*/存在しない") == []
+
+
+def test_SummarySheet_同名の親階層はブロック順に割り当てる():
+    rows = [
+        ["#1レベル名", "材質", "形状", "寸法", "合計", "上部構造"],
+        ["橋", "SS400", "PL", "9.0", "30", "30"],
+        ["#2レベル名", "材質", "形状", "寸法", "合計", "A", "B"],
+        ["上部構造", "SS400", "PL", "9.0", "30", "10", "20"],
+        ["#3レベル名", "材質", "形状", "寸法", "合計", "横桁"],
+        ["A", "SS400", "PL", "9.0", "10", "10"],
+        ["#3レベル名", "材質", "形状", "寸法", "合計", "横桁"],
+        ["B", "SS400", "PL", "9.0", "20", "20"],
+        ["#4レベル名", "材質", "形状", "寸法", "合計", "C1"],
+        ["横桁", "SS400", "PL", "9.0", "10", "10"],
+        ["#4レベル名", "材質", "形状", "寸法", "合計", "C2"],
+        ["横桁", "SS400", "PL", "9.0", "20", "20"],
+    ]
+    summary_sheet = SummarySheet([CSVRow(row) for row in rows])
+    assert [col.path for col in summary_sheet.cols_by_level[4]] == ["上部構造/A/横桁/C1", "上部構造/B/横桁/C2"]
+
+
+def test_SummarySheet_子階層のない同名の列を飛ばして親階層を割り当てる():
+    rows = [
+        ["#1レベル名", "材質", "形状", "寸法", "合計", "上部構造"],
+        ["橋", "SS400", "PL", "9.0", "30", "30"],
+        ["#2レベル名", "材質", "形状", "寸法", "合計", "A", "B"],
+        ["上部構造", "SS400", "PL", "9.0", "30", "10", "20"],
+        ["#3レベル名", "材質", "形状", "寸法", "合計", "横桁", "横構"],
+        ["A", "SS400", "PL", "9.0", "10", "5", "5"],
+        ["#3レベル名", "材質", "形状", "寸法", "合計", "横桁"],
+        ["B", "SS400", "PL", "9.0", "20", "20"],
+        # A の横桁は子階層を持たない
+        ["#4レベル名", "材質", "形状", "寸法", "合計", "L1"],
+        ["横構", "SS400", "PL", "9.0", "5", "5"],
+        ["#4レベル名", "材質", "形状", "寸法", "合計", "C2"],
+        ["横桁", "SS400", "PL", "9.0", "20", "20"],
+    ]
+    summary_sheet = SummarySheet([CSVRow(row) for row in rows])
+    assert [col.path for col in summary_sheet.cols_by_level[4]] == ["上部構造/A/横構/L1", "上部構造/B/横桁/C2"]
+
+
+def test_SummarySheet_同名の親階層を特定できない場合はエラー():
+    rows = [
+        ["#1レベル名", "材質", "形状", "寸法", "合計", "上部構造"],
+        ["橋", "SS400", "PL", "9.0", "30", "30"],
+        ["#2レベル名", "材質", "形状", "寸法", "合計", "A", "B"],
+        ["上部構造", "SS400", "PL", "9.0", "30", "10", "20"],
+        ["#3レベル名", "材質", "形状", "寸法", "合計", "横桁", "横構"],
+        ["A", "SS400", "PL", "9.0", "10", "5", "5"],
+        ["#3レベル名", "材質", "形状", "寸法", "合計", "横桁", "横構"],
+        ["B", "SS400", "PL", "9.0", "20", "10", "10"],
+        ["#4レベル名", "材質", "形状", "寸法", "合計", "L1"],
+        ["横構", "SS400", "PL", "9.0", "5", "5"],
+        ["#4レベル名", "材質", "形状", "寸法", "合計", "L2"],
+        ["横構", "SS400", "PL", "9.0", "10", "10"],
+        # 全ての親候補より後に現れ、A と B のどちらの横桁の子階層か判別できない
+        ["#4レベル名", "材質", "形状", "寸法", "合計", "C1"],
+        ["横桁", "SS400", "PL", "9.0", "5", "5"],
+    ]
+    with pytest.raises(ValueError, match="同名の親階層を特定できません"):
+        SummarySheet([CSVRow(row) for row in rows])
+
+
+def test_SummarySheet_塗装総括表を読み込み():
+    summary_sheet = SummarySheet.load_from_csv("tests/data/塗装総括表.csv")
+    assert summary_sheet.schema.name == "塗装総括表"
+    assert summary_sheet.header_rows[0] == ["塗装名称", "区分"]
+    # 塗装名称毎の合計行もアイテムとして扱う
+    assert summary_sheet.props_group[2].values() == ["A:一般外面", "合計"]
+    assert summary_sheet.cols[0].items[summary_sheet.props_group[0]].value == "20.959999"
+
+
+def test_SummarySheet_変更されていないブロックを引き継いで再読み込み(summary_csv_path):
+    rows = CSVReader(summary_csv_path).load()
+    summary_sheet = SummarySheet(rows, summary_csv_path)
+    old_rows = list(summary_sheet.iter_csv_rows(4))
+    # 材片種別を生成済みのブロックは材片種別も引き継ぐ
+    old_props = summary_sheet.find("上部構造/附属物/排水装置").props_group
+
+    # 主構造ブロック (#3レベル名) の主桁列の値を変更
+    changed_rows = [CSVRow(row) for row in rows]
+    changed_rows[50][5] = "8"
+    reloaded_sheet = summary_sheet.reloaded(changed_rows)
+
+    # 変更されたブロックのみ新しいブロックとなり、他のブロックは共有する
+    assert reloaded_sheet is not summary_sheet
+    shared = [new is old for new, old in zip(reloaded_sheet._blocks, summary_sheet._blocks, strict=True)]
+    assert shared.count(False) == 1
+    assert reloaded_sheet._blocks[shared.index(False)].level == 3
+    assert reloaded_sheet.find("上部構造/附属物/排水装置").props_group == old_props
+    assert all(
+        new is old
+        for new, old in zip(reloaded_sheet.find("上部構造/附属物/排水装置").props_group, old_props, strict=True)
+    )
+
+    # 変更前の総括表は変更しない
+    assert list(summary_sheet.iter_csv_rows(4)) == old_rows
+
+    # 新たに読み込んだ場合と同じCSVデータを返す
+    main_girder = reloaded_sheet.find("上部構造/主構造/主桁")
+    values = {tuple(props.values()): item.value for props, item in main_girder.items.items()}
+    assert values[("SM400A", "PL", "22.0")] == "8"
+    assert reloaded_sheet.find("上部構造/主構造/主桁/G1").parent is main_girder
+    expected = SummarySheet(changed_rows, summary_csv_path)
+    for level in (1, 2, 3, 4):
+        assert list(reloaded_sheet.iter_csv_rows(level)) == list(expected.iter_csv_rows(level))
+
+    # 変更がなければ同じインスタンスを返す
+    assert reloaded_sheet.reloaded(changed_rows) is reloaded_sheet
+
+
+def test_SummarySheet_構成が変わった場合は全て再読み込み(summary_csv_path):
+    rows = CSVReader(summary_csv_path).load()
+    summary_sheet = SummarySheet(rows, summary_csv_path)
+
+    # 主桁ブロックの列名を変更
+    changed_rows = [CSVRow(row) for row in rows]
+    changed_rows[68][5] = "G2"
+    reloaded_sheet = summary_sheet.reloaded(changed_rows)
+    assert not any(new is old for new, old in zip(reloaded_sheet._blocks, summary_sheet._blocks, strict=True))
+    assert [col.name for col in reloaded_sheet.cols_by_level[4]] == ["G2", "端支点横桁", "下横構", "取付金具"]
+    assert reloaded_sheet.find("上部構造/主構造/主桁/G2").parent is reloaded_sheet.find("上部構造/主構造/主桁")
+    assert [col.name for col in summary_sheet.cols_by_level[4]][0] == "G1"
+
+
+def test_SummaryColumn_アイテムは初回アクセス時に生成(summary_csv_path):
+    summary_sheet = SummarySheet.load_from_csv(summary_csv_path)
+    leaf_col = summary_sheet.find("上部構造/主構造/主桁/G1")
+    # 名称・レベル・親階層は読み込み時に確定する
+    assert leaf_col.level == 4
+    assert leaf_col.parent is summary_sheet.find("上部構造/主構造/主桁")
+    assert "items" not in vars(leaf_col)
+
+    # レベル1のCSVデータの生成では下位レベルのアイテムを生成しない
+    summary_sheet.display_level = 1
+    _ = summary_sheet.csv_data
+    assert "items" not in vars(leaf_col)
+    assert len(leaf_col.items) > 0
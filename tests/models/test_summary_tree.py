@@ -0,0 +1,32 @@
+from app.models.summary_tree import SummaryTree
+
+
+def _sample_tree() -> SummaryTree[str]:
+    """a(b(d, e), c) の木構造を返す"""
+    tree = SummaryTree[str]()
+    a = tree.add("a")
+    b = tree.add("b", a)
+    tree.add("c", a)
+    tree.add("d", b)
+    tree.add("e", b)
+    return tree
+
+
+def test_SummaryTree_子と子孫を取得():
+    tree = _sample_tree()
+    assert len(tree) == 5
+    assert tree.children(SummaryTree.ROOT) == ("a",)
+    assert tree.children(1) == ("b", "c")
+    assert tree.descendants() == ("a", "b", "d", "e", "c")
+    assert tree.descendants(2) == ("d", "e")
+    assert tree.descendants(3) == ()
+    assert tree.parent_id(4) == 2
+    assert tree.parent_id(SummaryTree.ROOT) == SummaryTree.NO_NODE
+
+
+def test_SummaryTree_追加後は前順の並びを更新():
+    tree = _sample_tree()
+    assert tree.descendants() == ("a", "b", "d", "e", "c")
+
+    tree.add("f", 2)
+    assert tree.descendants(1) == ("b", "d", "e", "f", "c")
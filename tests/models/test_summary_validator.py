@@ -0,0 +1,60 @@
+from pathlib import Path
+
+import pytest
+
+from app.io.csv_reader import CSVReader, CSVRow
+from app.models.summary_sheet import SummarySheet
+from app.models.summary_validator import CheckKind
+from benchmarks.generate import GeneratorParams, generate_summary_csv
+
+
+@pytest.mark.parametrize(
+    "csv_path",
+    [
+        "tests/data/鋼材重量総括表.csv",
+        "tests/data/ボルト本数総括表(現場).csv",
+        "tests/data/メッキ総括表.csv",
+        "tests/data/部材長さ総括表.csv",
+        "tests/data/塗装総括表.csv",
+    ],
+)
+def test_validate_summary_sheet_まてりあるの総括表は整合(csv_path: str):
+    assert SummarySheet.load_from_csv(csv_path).validate() == []
+
+
+def test_validate_summary_sheet_生成した総括表は整合(tmp_path: Path):
+    params = GeneratorParams(depth=3, fan_out=2, leaf_columns=3, item_count=12, items_per_leaf=5)
+    csv_path = generate_summary_csv(tmp_path / "鋼材重量総括表.csv", params)
+    assert SummarySheet.load_from_csv(csv_path).validate() == []
+
+
+def test_validate_summary_sheet_小計行の不整合を検出(summary_csv_path: Path):
+    rows = [CSVRow(row) for row in CSVReader(summary_csv_path).load()]
+    # 最上位レベルの上部構造列の最初の小計行 (166 -> 165)
+    rows[2][5] = "165"
+    inconsistencies = SummarySheet(rows).validate()
+
+    assert [(i.check, i.level, i.path, i.row, i.label) for i in inconsistencies] == [
+        (CheckKind.SUBTOTAL, 1, "上部構造", 2, ("小計", "", "")),
+        (CheckKind.ROW_TOTAL, 1, "合計", 2, ("小計", "", "")),
+    ]
+    assert (inconsistencies[0].expected, inconsistencies[0].actual) == (166, 165)
+
+
+def test_validate_summary_sheet_下位レベルの合計との不整合を検出(summary_csv_path: Path):
+    rows = [CSVRow(row) for row in CSVReader(summary_csv_path).load()]
+    # 主構造ブロックの主桁列と合計列の SM400A PL 22.0 (7 -> 8) を、小計・中計・合計行と合わせて変更
+    for i in (50, 53, 54, 58, 61):
+        rows[i][4] = str(int(rows[i][4]) + 1)
+        rows[i][5] = str(int(rows[i][5]) + 1)
+    inconsistencies = SummarySheet(rows).validate()
+
+    # 主構造ブロックは整合し、上位の主構造列・下位の G1 列との差のみ検出する
+    assert {(i.check, i.path, i.label) for i in inconsistencies} == {
+        (CheckKind.ROLLUP, "上部構造/主構造", ("SM400A", "PL", "22.0")),
+        (CheckKind.ROLLUP, "上部構造/主構造/主桁", ("SM400A", "PL", "22.0")),
+        (CheckKind.ROLLUP, "上部構造/主構造", ("加工鋼重中計", "", "")),
+        (CheckKind.ROLLUP, "上部構造/主構造", ("合計", "", "")),
+        (CheckKind.ROLLUP, "上部構造/主構造/主桁", ("加工鋼重中計", "", "")),
+        (CheckKind.ROLLUP, "上部構造/主構造/主桁", ("合計", "", "")),
+    }
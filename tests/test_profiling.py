@@ -0,0 +1,59 @@
+import pstats
+import shutil
+from pathlib import Path
+
+import pytest
+
+from app.controllers.summary_loader import SummaryLoadTask
+from app.models.summary_sheet import SummarySheet
+from app.profiling import PROFILE_ENV, TimingSpan, format_spans, record_spans, timed
+
+
+def test_timed_範囲内の計測結果を収集():
+    with record_spans() as spans:
+        with timed("read", bytes=10):
+            pass
+        with timed("parse") as counts:
+            counts["cols"] = 3
+    assert [span.name for span in spans] == ["read", "parse"]
+    assert spans[0].counts == {"bytes": 10}
+    assert spans[1].counts == {"cols": 3}
+
+
+def test_timed_収集範囲外では収集しない():
+    with timed("read"):
+        pass
+    with record_spans() as spans:
+        pass
+    assert spans == []
+
+
+def test_format_spans_処理名毎に合計():
+    spans = [TimingSpan("csv_data", 0.010, {}), TimingSpan("read", 0.002, {}), TimingSpan("csv_data", 0.020, {})]
+    assert format_spans(spans) == "csv_data 30ms / read 2ms"
+
+
+def test_SummarySheet_読み込みの各処理を計測(summary_csv_path: Path):
+    with record_spans() as spans:
+        summary_sheet = SummarySheet.load_from_csv(summary_csv_path)
+        _ = summary_sheet.csv_data
+    names = [span.name for span in spans]
+    assert names[:2] == ["read", "parse"]
+    assert "csv_data" in names
+    parse_span = spans[1]
+    assert parse_span.counts == {"levels": 4, "cols": len(summary_sheet.cols)}
+
+
+def test_SummaryLoadTask_環境変数の指定でプロファイルを出力(
+    summary_csv_path: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    # キャッシュを使用しないよう、別のパスに複製したファイルを読み込む
+    csv_path = tmp_path / summary_csv_path.name
+    shutil.copyfile(summary_csv_path, csv_path)
+    profile_path = tmp_path / "load.prof"
+    monkeypatch.setenv(PROFILE_ENV, str(profile_path))
+
+    task = SummaryLoadTask(1, csv_path)
+    task.run()
+    assert [span.name for span in task.spans] == ["read", "parse", "validate"]
+    assert pstats.Stats(str(profile_path)).total_calls > 0
@@ -0,0 +1,31 @@
+from PySide6.QtWidgets import QApplication
+
+from app.views.main_window import MainWindow
+
+
+def test_MainWindow_レベル毎にタブを生成(qapp: QApplication):
+    window = MainWindow()
+    window.set_levels([1, 2, 3, 4, 5])
+    assert window.levelTabWidget.count() == 5
+    assert window.levels == [1, 2, 3, 4, 5]
+    assert window.levelTabWidget.tabText(4) == "#5レベル"
+
+
+def test_MainWindow_レベル構成が同じ場合はタブを再利用(qapp: QApplication):
+    window = MainWindow()
+    window.set_levels([1, 2])
+    table_view = window.level_table_views[2]
+    window.set_levels([1, 2])
+    assert window.level_table_views[2] is table_view
+
+    window.set_levels([1, 2, 3])
+    assert window.levelTabWidget.count() == 3
+    assert window.level_table_views[2] is not table_view
+
+
+def test_MainWindow_表示中のレベル(qapp: QApplication):
+    window = MainWindow()
+    assert window.current_level is None
+    window.set_levels([1, 2, 3])
+    window.set_current_level(3)
+    assert window.current_level == 3
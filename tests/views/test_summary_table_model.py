@@ -0,0 +1,62 @@
+from PySide6.QtCore import Qt
+
+from app.io.csv_reader import CSVReader, CSVRow
+from app.models.summary_diff import DiffKind
+from app.models.summary_sheet import SummarySheet
+from app.views.components.summary_table_model import DIFF_COLORS, SummaryTableModel
+
+
+def test_SummaryTableModel_CSVデータと同じ内容を表示(summary_sheet: SummarySheet):
+    model = SummaryTableModel()
+    for level in [1, 2, 3, 4]:
+        model.set_summary_sheet(summary_sheet, level)
+        summary_sheet.display_level = level
+        csv_data = summary_sheet.csv_data
+
+        # ヘッダー
+        header = [model.headerData(c, Qt.Orientation.Horizontal) for c in range(model.columnCount())]
+        assert header == csv_data.header
+
+        # セルの内容
+        assert model.rowCount() == len(csv_data.data)
+        for r, row in enumerate(csv_data.data):
+            assert [model.index(r, c).data() for c in range(model.columnCount())] == row
+
+
+def test_SummaryTableModel_4列目以降は右揃え(summary_sheet: SummarySheet):
+    model = SummaryTableModel()
+    model.set_summary_sheet(summary_sheet, 2)
+    assert model.index(0, 2).data(Qt.ItemDataRole.TextAlignmentRole) is None
+    assert model.index(0, 3).data(Qt.ItemDataRole.TextAlignmentRole) is not None
+
+
+def test_SummaryTableModel_総括表を解除(summary_sheet: SummarySheet):
+    model = SummaryTableModel()
+    model.set_summary_sheet(summary_sheet, 1)
+    model.set_summary_sheet(None, 1)
+    assert model.rowCount() == 0
+    assert model.columnCount() == 0
+
+
+def test_SummaryTableModel_比較時は変更されたセルを強調表示(summary_csv_path):
+    rows = CSVReader(summary_csv_path).load()
+    old_sheet = SummarySheet(rows, summary_csv_path)
+    changed_rows = [CSVRow(row) for row in rows]
+    changed_rows[50][5] = "8"
+    new_sheet = SummarySheet(changed_rows, summary_csv_path)
+
+    model = SummaryTableModel()
+    model.set_summary_sheet(new_sheet, 3)
+    model.set_diff(new_sheet.diff(old_sheet))
+
+    # 主桁列の SM400A PL 22.0 のセル
+    row = next(i for i, props in enumerate(new_sheet.props_group) if props.values() == ["SM400A", "PL", "22.0"])
+    column = model._header_labels.index("主桁")
+    index = model.index(row, column)
+    assert index.data(Qt.ItemDataRole.BackgroundRole) == DIFF_COLORS[DiffKind.CHANGED]
+    assert index.data(Qt.ItemDataRole.ToolTipRole) == "変更: 変更前 7 (+1)"
+    assert model.index(row, column + 1).data(Qt.ItemDataRole.BackgroundRole) is None
+
+    # 比較を解除
+    model.set_diff(None)
+    assert index.data(Qt.ItemDataRole.BackgroundRole) is None